@@ -1,5 +1,26 @@
-from .base import MusicBackend
-from .gcui_suno import GcuiSunoBackend
-from .meta import MetaMusicBackend
+import importlib
 
-__all__ = ["MusicBackend", "MetaMusicBackend", "GcuiSunoBackend"]
+from .base import MusicBackend, NonRetryableError, RateLimitedError
+
+# Concrete backends pull in heavy dependencies (torch, transformers, HTTP clients),
+# so they are only imported when first accessed.
+_LAZY_BACKENDS = {
+    "GcuiSunoBackend": ".gcui_suno",
+    "MetaMusicBackend": ".meta",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_BACKENDS:
+        module = importlib.import_module(_LAZY_BACKENDS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "MusicBackend",
+    "MetaMusicBackend",
+    "GcuiSunoBackend",
+    "NonRetryableError",
+    "RateLimitedError",
+]
@@ -1,6 +1,61 @@
+import threading
 import time
 from abc import ABC, abstractmethod
 
+# Client errors that can still succeed on a later attempt (timeout, rate limit)
+RETRYABLE_CLIENT_ERRORS = frozenset({408, 429})
+
+
+class NonRetryableError(Exception):
+    """Raised by backends for failures that retrying cannot fix (bad credentials, bad input)."""
+
+
+class RateLimitedError(RuntimeError):
+    """Raised by backends when the provider rejects a request with HTTP 429.
+
+    Attributes:
+        retry_after: Seconds the provider asked us to wait, or None if it did not say
+    """
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def raise_if_rate_limited(status_code: int, headers, detail: str) -> None:
+    """Raise RateLimitedError for HTTP 429 responses, carrying the Retry-After delay.
+
+    Args:
+        status_code: HTTP status code of the response
+        headers: Response headers
+        detail: Response body or message to include in the error
+
+    Raises:
+        RateLimitedError: If the status code is 429
+    """
+    if status_code != 429:
+        return
+    try:
+        retry_after = float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        # Missing, or given as an HTTP date; fall back to our own backoff schedule
+        retry_after = None
+    raise RateLimitedError(f"HTTP 429: {detail}", retry_after=retry_after)
+
+
+def raise_if_non_retryable(status_code: int, detail: str) -> None:
+    """Raise NonRetryableError for HTTP 4xx responses other than timeouts and rate limits.
+
+    Args:
+        status_code: HTTP status code of the response
+        detail: Response body or message to include in the error
+
+    Raises:
+        NonRetryableError: If the status code indicates a permanent client error
+    """
+    if 400 <= status_code < 500 and status_code not in RETRYABLE_CLIENT_ERRORS:
+        raise NonRetryableError(f"HTTP {status_code}: {detail}")
+
 
 class MusicBackend(ABC):
     """Base class for music generation backends."""
@@ -113,6 +168,21 @@ class MusicBackend(ABC):
             str: Path to the generated audio file, or None if failed
         """
 
+    def completion_event(self, job_id: str) -> threading.Event | None:
+        """Get an event that is set once a generation job finishes, successfully or not.
+
+        Backends that learn about completion directly (e.g. a local generation thread)
+        override this so callers can wake up immediately instead of sleeping out the
+        polling interval. The default returns None, meaning callers must poll.
+
+        Args:
+            job_id: The job ID returned by start_generation
+
+        Returns:
+            threading.Event | None: Completion event, or None if the backend has none
+        """
+        return None
+
     def wait_for_completion(self, job_id: str, timeout: int = 300, interval: int = 5) -> str:
         """Wait for a generation job to complete.
 
@@ -124,6 +194,7 @@ class MusicBackend(ABC):
         Returns:
             Path to the generated audio file, or None if generation failed/timed out
         """
+        completion = self.completion_event(job_id)
         start_time = time.time()
         while time.time() - start_time < timeout:
             status, progress = self.check_progress(job_id)
@@ -132,7 +203,12 @@ class MusicBackend(ABC):
 
             if status == "complete":
                 return self.get_result(job_id)
+            if completion is not None and completion.is_set():
+                return None
 
-            time.sleep(interval)
+            if completion is not None:
+                completion.wait(timeout=interval)
+            else:
+                time.sleep(interval)
 
         return None
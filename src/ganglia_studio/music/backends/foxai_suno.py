@@ -7,7 +7,13 @@ import requests
 from ganglia_common.logger import Logger
 from ganglia_common.utils.file_utils import get_tempdir
 
-from ganglia_studio.music.backends.base import MusicBackend
+from ganglia_studio.music.backends.base import (
+    MusicBackend,
+    NonRetryableError,
+    RateLimitedError,
+    raise_if_non_retryable,
+    raise_if_rate_limited,
+)
 from ganglia_studio.music.backends.suno_interface import SunoInterface
 from ganglia_studio.music.lyrics_lib import LyricsGenerator
 
@@ -15,7 +21,14 @@ from ganglia_studio.music.lyrics_lib import LyricsGenerator
 class FoxAISunoBackend(MusicBackend, SunoInterface):
     """FoxAI's Suno API implementation for music generation."""
 
-    def __init__(self):
+    def __init__(self, session: requests.Session | None = None):
+        """Initialize the backend with configuration.
+
+        Args:
+            session: Optional shared HTTP session so polling reuses pooled connections.
+                Defaults to the module-level ``requests`` API.
+        """
+        self.session = session if session is not None else requests
         self.api_base_url = "https://api.sunoaiapi.com/api/v1"
         self.api_key = os.getenv("FOXAI_SUNO_API_KEY")
         if not self.api_key:
@@ -72,7 +85,7 @@ class FoxAISunoBackend(MusicBackend, SunoInterface):
         endpoint = f"{self.api_base_url}/gateway/query?ids={job_id}"
 
         try:
-            response = requests.get(endpoint, headers=self.headers, timeout=30)
+            response = self.session.get(endpoint, headers=self.headers, timeout=30)
             if response.status_code != 200:
                 return f"Error: HTTP {response.status_code}", 0
 
@@ -126,7 +139,7 @@ class FoxAISunoBackend(MusicBackend, SunoInterface):
         endpoint = f"{self.api_base_url}/gateway/query?ids={job_id}"
 
         try:
-            response = requests.get(endpoint, headers=self.headers, timeout=30)
+            response = self.session.get(endpoint, headers=self.headers, timeout=30)
             if response.status_code != 200:
                 return None
 
@@ -199,7 +212,7 @@ class FoxAISunoBackend(MusicBackend, SunoInterface):
         Logger.print_info(
             f"Sending request to {endpoint} with data: {data} and headers: {logging_headers}"
         )
-        response = requests.post(endpoint, headers=self.headers, json=data, timeout=30)
+        response = self.session.post(endpoint, headers=self.headers, json=data, timeout=30)
         Logger.print_info(f"Request completed with status code {response.status_code}")
 
         if response.status_code != 200:
@@ -218,6 +231,8 @@ class FoxAISunoBackend(MusicBackend, SunoInterface):
                     "Failed to start instrumental music job. "
                     f"Status: {response.status_code}, Raw response: {response.text}"
                 )
+            raise_if_rate_limited(response.status_code, response.headers, response.text)
+            raise_if_non_retryable(response.status_code, response.text)
             return None
 
         response_data = response.json()
@@ -264,13 +279,17 @@ class FoxAISunoBackend(MusicBackend, SunoInterface):
 
             self._log_request_details(endpoint, data, lyrics_data)
 
-            response = requests.post(endpoint, headers=self.headers, json=data, timeout=30)
+            response = self.session.post(endpoint, headers=self.headers, json=data, timeout=30)
             if response.status_code != 200:
                 self._log_error_response(response)
+                raise_if_rate_limited(response.status_code, response.headers, response.text)
+                raise_if_non_retryable(response.status_code, response.text)
                 return None
 
             return self._extract_song_id_from_response(response)
 
+        except (NonRetryableError, RateLimitedError):
+            raise
         except Exception as e:
             Logger.print_error(f"Failed to start lyrical song job: {str(e)}")
             return None
@@ -374,7 +393,7 @@ class FoxAISunoBackend(MusicBackend, SunoInterface):
     def _download_audio(self, audio_url, job_id):
         """Download the generated audio file."""
         try:
-            response = requests.get(audio_url, timeout=30)
+            response = self.session.get(audio_url, timeout=30)
             if response.status_code != 200:
                 return None
 
@@ -42,6 +42,7 @@ class MetaMusicBackend(MusicBackend):
         os.makedirs(self.audio_directory, exist_ok=True)
         os.makedirs(self.progress_directory, exist_ok=True)
         self.active_jobs = {}  # job_id -> thread
+        self.completion_events = {}  # job_id -> threading.Event set when the thread exits
 
     def _ensure_model_loaded(self):
         """Ensure the model and processor are loaded."""
@@ -98,6 +99,8 @@ class MetaMusicBackend(MusicBackend):
                 f,
             )
 
+        self.completion_events[job_id] = threading.Event()
+
         # Start generation thread
         thread = threading.Thread(
             target=self._generation_thread, args=(job_id, prompt), kwargs=kwargs
@@ -118,8 +121,13 @@ class MetaMusicBackend(MusicBackend):
         except (FileNotFoundError, json.JSONDecodeError, KeyError):
             return "Error reading progress", 0
 
+    def completion_event(self, job_id: str) -> threading.Event | None:
+        """Get the event set when the generation thread for job_id exits."""
+        return self.completion_events.get(job_id)
+
     def get_result(self, job_id: str) -> str:
         """Get the result of a completed generation job."""
+        self.completion_events.pop(job_id, None)
         progress_file = os.path.join(self.progress_directory, f"{job_id}.json")
 
         try:
@@ -186,6 +194,8 @@ class MetaMusicBackend(MusicBackend):
         finally:
             if job_id in self.active_jobs:
                 del self.active_jobs[job_id]
+            if job_id in self.completion_events:
+                self.completion_events[job_id].set()
 
     def _prepare_model_inputs(self, prompt):
         """Prepare model inputs from prompt."""
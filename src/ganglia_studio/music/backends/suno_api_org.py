@@ -10,15 +10,27 @@ from ganglia_common.logger import Logger
 from ganglia_common.utils.file_utils import get_tempdir
 from ganglia_common.utils.retry_utils import exponential_backoff
 
-from ganglia_studio.music.backends.base import MusicBackend
+from ganglia_studio.music.backends.base import (
+    MusicBackend,
+    NonRetryableError,
+    RateLimitedError,
+    raise_if_non_retryable,
+    raise_if_rate_limited,
+)
 from ganglia_studio.music.backends.suno_interface import SunoInterface
 
 
 class SunoApiOrgBackend(MusicBackend, SunoInterface):
     """SunoApi.org implementation for music generation."""
 
-    def __init__(self):
-        """Initialize the backend with configuration."""
+    def __init__(self, session: requests.Session | None = None):
+        """Initialize the backend with configuration.
+
+        Args:
+            session: Optional shared HTTP session so polling reuses pooled connections.
+                Defaults to the module-level ``requests`` API.
+        """
+        self.session = session if session is not None else requests
         self.api_base_url = "https://apibox.erweima.ai/api/v1"
         self.api_key = os.getenv("SUNO_API_ORG_KEY")
 
@@ -36,7 +48,7 @@ class SunoApiOrgBackend(MusicBackend, SunoInterface):
         timeout = kwargs.pop("timeout", 30)
 
         def _request():
-            response = requests.request(method, endpoint, timeout=timeout, **kwargs)
+            response = self.session.request(method, endpoint, timeout=timeout, **kwargs)
             if response.status_code == 401:
                 Logger.print_warning("Authentication failed (401) - will retry in a moment...")
                 time.sleep(2)  # Add a minimum delay before retry
@@ -68,7 +80,7 @@ class SunoApiOrgBackend(MusicBackend, SunoInterface):
             use_custom_mode = bool(title or tags)
 
             if use_custom_mode and not self._validate_custom_mode(title, tags, with_lyrics, prompt):
-                return None
+                raise NonRetryableError("Invalid custom mode request")
 
             data = self._build_request_data(
                 enhanced_prompt,
@@ -82,6 +94,8 @@ class SunoApiOrgBackend(MusicBackend, SunoInterface):
 
             return self._submit_generation_request(data)
 
+        except (NonRetryableError, RateLimitedError):
+            raise
         except Exception as e:
             Logger.print_error(f"Failed to start generation: {str(e)}")
             return None
@@ -203,6 +217,8 @@ class SunoApiOrgBackend(MusicBackend, SunoInterface):
 
         if response.status_code != 200:
             Logger.print_error(f"Failed to start generation: {response.text}")
+            raise_if_rate_limited(response.status_code, response.headers, response.text)
+            raise_if_non_retryable(response.status_code, response.text)
             return None
 
         response_data = response.json()
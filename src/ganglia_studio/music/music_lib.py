@@ -4,23 +4,38 @@ This module implements a music generation service that can use different backend
 with fallback support, retry mechanisms, and progress tracking.
 """
 
+import importlib
 import os
+import random
 import shutil
 import subprocess
+import threading
 import time
+from concurrent.futures import Future
+from functools import lru_cache
 from typing import Any
 
+import requests
 from ganglia_common.logger import Logger
+from requests.adapters import HTTPAdapter
 
-from ganglia_studio.music.backends.foxai_suno import FoxAISunoBackend
-from ganglia_studio.music.backends.meta import MetaMusicBackend
-from ganglia_studio.music.backends.suno_api_org import SunoApiOrgBackend
+from ganglia_studio.music.backends.base import NonRetryableError, RateLimitedError
 from ganglia_studio.video.config_loader import TTVConfig
 
+# Backend name -> (module, class name, uses HTTP). Modules are imported only when the
+# backend is selected, so e.g. Suno users never load torch for the Meta backend.
+_BACKEND_REGISTRY = {
+    "meta": ("ganglia_studio.music.backends.meta", "MetaMusicBackend", False),
+    "suno": ("ganglia_studio.music.backends.suno_api_org", "SunoApiOrgBackend", True),
+    "foxai": ("ganglia_studio.music.backends.foxai_suno", "FoxAISunoBackend", True),
+}
+# Backend used once the primary backend has exhausted its retries
+_FALLBACK_BACKENDS = {"suno": "foxai"}
+
 
 def _exponential_backoff(attempt, base_delay=1, max_delay=5):
     """Calculate delay with exponential backoff and jitter."""
-    delay = min(base_delay * (2**attempt), max_delay)
+    delay = base_delay * (1 << attempt)
 
     # If we're at max delay, return it without jitter
     if delay >= max_delay:
@@ -29,20 +44,83 @@ def _exponential_backoff(attempt, base_delay=1, max_delay=5):
     # If we're close to max delay, only allow positive jitter up to max
     if delay > max_delay * 0.9:  # Within 10% of max
         max_jitter = min(delay * 0.1, max_delay - delay)  # Cap jitter to not exceed max
-        return delay + (max_jitter * (os.urandom(1)[0] / 255.0))  # Only positive jitter
+        return delay + (max_jitter * random.random())  # Only positive jitter
 
     # Normal case: add bidirectional jitter
     jitter = delay * 0.1  # 10% jitter
-    return delay + (jitter * (2 * (os.urandom(1)[0] / 255.0) - 1))
+    return delay + (jitter * (2 * random.random() - 1))
+
+
+def _materialize_output(src: str, dst: str, *, keep_source: bool = True) -> None:
+    """Place the file at src at dst, avoiding a byte-for-byte copy where possible.
+
+    Moves (when the source is disposable) or hardlinks are O(1) inode operations on the
+    same filesystem; a full copy is only made when those fail, e.g. across devices or on
+    filesystems without hardlink support.
+
+    Args:
+        src: Path of the generated file
+        dst: Destination path
+        keep_source: Whether src must remain in place after the call
+
+    Raises:
+        OSError: If the file could not be placed at dst
+    """
+    try:
+        if keep_source:
+            os.link(src, dst)
+        else:
+            os.replace(src, dst)
+        return
+    except OSError:
+        pass
+    shutil.copy2(src, dst)
+
+
+def _create_http_session() -> requests.Session:
+    """Create a pooled HTTP session shared by the primary and fallback backends."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 class MusicGenerator:
     """Music generation service that uses different backends."""
 
+    __slots__ = (
+        "backend",
+        "fallback_backend",
+        "_http_session",
+        "_ensured_dirs",
+        "_inflight",
+        "_inflight_lock",
+    )
+
     MAX_RETRIES = 5  # Maximum number of retries before falling back
     MIN_BACKGROUND_DURATION = 30
     MAX_BACKGROUND_DURATION = 240
     WORDS_PER_SECOND = 2.5
+    POLL_INTERVAL = 5  # Seconds between progress checks
+    MAX_RETRY_AFTER = 60  # Upper bound on a server-requested Retry-After delay
+    # Caps in-flight generations across all threads and generators so parallel
+    # callers don't hammer the same upstream API into 429s
+    _CONCURRENCY = threading.BoundedSemaphore(
+        int(os.environ.get("GANGLIA_MUSIC_CONCURRENCY", "4"))
+    )
+    # ffprobe invocation printing the codec type of the first audio stream, if any
+    _FFPROBE_AUDIO_STREAM_CMD = (
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "a:0",
+        "-show_entries",
+        "stream=codec_type",
+        "-of",
+        "default=noprint_wrappers=1:nokey=1",
+    )
 
     def __init__(self, backend=None, config=None):
         """Initialize the music generator with a specific backend.
@@ -51,6 +129,11 @@ class MusicGenerator:
             backend: Optional backend instance. If None, uses the backend specified in config.
             config: Optional TTVConfig instance. If None, uses default config.
         """
+        self._http_session = None
+        self._ensured_dirs: set[str] = set()
+        # Instrumental requests currently generating, keyed by their parameters
+        self._inflight: dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
         if backend:
             self.backend = backend
             self.fallback_backend = None
@@ -58,20 +141,42 @@ class MusicGenerator:
             if not config:
                 config = TTVConfig(style="default", story=[], title="untitled")
 
-            # Get backend from config, default to "suno" if not specified
+            # Get backend from config, default to "suno" (SunoApiOrg with FoxAI as fallback)
             backend_name = config.get("music_backend", "suno").lower()
-            if backend_name == "meta":
-                self.backend = MetaMusicBackend()
-                self.fallback_backend = None
-            else:  # Default to SunoApiOrg with FoxAI as fallback
-                self.backend = SunoApiOrgBackend()
-                self.fallback_backend = FoxAISunoBackend()
+            if backend_name != "meta":
+                backend_name = "suno"
+            fallback_name = _FALLBACK_BACKENDS.get(backend_name)
+
+            self.backend = self._create_backend(backend_name)
+            self.fallback_backend = self._create_backend(fallback_name) if fallback_name else None
 
             Logger.print_info(
                 f"MusicGenerator initialized with backend: {self.backend.__class__.__name__},"
                 f" and fallback: {self.fallback_backend.__class__.__name__}"
             )
 
+    @staticmethod
+    def _thread_prefix(thread_id: str | None) -> str:
+        """Build the log prefix identifying the calling thread."""
+        return f"{thread_id} " if thread_id else ""
+
+    def _create_backend(self, name: str):
+        """Import and instantiate a registered backend, sharing one HTTP session."""
+        module_name, class_name, uses_http = _BACKEND_REGISTRY[name]
+        backend_class = getattr(importlib.import_module(module_name), class_name)
+        if not uses_http:
+            return backend_class()
+        if self._http_session is None:
+            self._http_session = _create_http_session()
+        return backend_class(session=self._http_session)
+
+    def _ensure_dir(self, path: str) -> None:
+        """Create a directory once per generator instead of on every call."""
+        if path in self._ensured_dirs:
+            return
+        os.makedirs(path, exist_ok=True)
+        self._ensured_dirs.add(path)
+
     def generate_instrumental(
         self,
         prompt: str,
@@ -83,6 +188,8 @@ class MusicGenerator:
     ) -> tuple[str | None, str | None]:
         """Generate instrumental music from a text prompt.
 
+        Concurrent calls with identical generation parameters share a single backend job.
+
         Args:
             prompt: The text prompt for music generation
             duration: Optional duration in seconds
@@ -90,6 +197,59 @@ class MusicGenerator:
             tags: Optional list of tags
             output_path: Optional path to save the generated audio
         """
+        key = (prompt, duration, title, tuple(tags or ()))
+        with self._inflight_lock:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                future = Future()
+                self._inflight[key] = future
+
+        # An identical request is already generating; share its result instead of paying
+        # for a second job
+        if inflight is not None:
+            Logger.print_info(f"Waiting for in-flight generation with prompt: {prompt}")
+            return self._share_inflight_result(inflight.result(), output_path)
+
+        try:
+            result = self._generate_instrumental(
+                prompt, duration=duration, title=title, tags=tags, output_path=output_path
+            )
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _share_inflight_result(
+        self, result: tuple[str | None, str | None], output_path: str | None
+    ) -> tuple[str | None, str | None]:
+        """Place another caller's generated audio at this caller's output path."""
+        audio_path, lyrics = result
+        if not audio_path or not output_path:
+            return result
+        if os.path.abspath(audio_path) == os.path.abspath(output_path):
+            return result
+        try:
+            _materialize_output(audio_path, output_path)
+            return output_path, lyrics
+        except OSError as e:
+            Logger.print_error(f"Failed to copy file to output path: {e}")
+            return result
+
+    def _generate_instrumental(
+        self,
+        prompt: str,
+        *,
+        duration: int | None,
+        title: str | None,
+        tags: list[str] | None,
+        output_path: str | None,
+    ) -> tuple[str | None, str | None]:
+        """Generate instrumental music with retries and fallback; see generate_instrumental."""
         Logger.print_info(f"Generating instrumental music with prompt: {prompt}")
 
         # Try primary backend first with retries
@@ -104,14 +264,18 @@ class MusicGenerator:
             Logger.print_info(
                 "Primary backend failed after retries, attempting fallback to Meta backend..."
             )
-            result = self._try_generate_with_backend(
-                self.fallback_backend,
-                prompt,
-                duration=duration,
-                title=title,
-                tags=tags,
-                output_path=output_path,
-            )
+            try:
+                result = self._try_generate_with_backend(
+                    self.fallback_backend,
+                    prompt,
+                    duration=duration,
+                    title=title,
+                    tags=tags,
+                    output_path=output_path,
+                )
+            except (NonRetryableError, RateLimitedError) as e:
+                Logger.print_error(f"Fallback backend failed: {str(e)}")
+                return None, None
             if result:
                 if isinstance(result, tuple):
                     return result
@@ -129,11 +293,17 @@ class MusicGenerator:
         tags: list[str] | None = None,
         output_path: str | None = None,
     ) -> tuple[str | None, str | None]:
-        """Attempt to generate music with retries and exponential backoff."""
+        """Attempt to generate music with retries and exponential backoff.
+
+        A Retry-After delay sent with a 429 response replaces the backoff delay
+        before the next attempt.
+        """
+        retry_after = None
         for attempt in range(self.MAX_RETRIES):
             try:
                 if attempt > 0:
-                    delay = _exponential_backoff(attempt)
+                    delay = retry_after if retry_after is not None else _exponential_backoff(attempt)
+                    retry_after = None
                     Logger.print_info(
                         f"Retry attempt {attempt + 1}/{self.MAX_RETRIES} "
                         f"after {delay:.1f}s delay..."
@@ -165,6 +335,22 @@ class MusicGenerator:
                 Logger.print_error("All retry attempts exhausted")
                 return None, None
 
+            except NonRetryableError as e:
+                Logger.print_error(
+                    f"Non-retryable error from {backend.__class__.__name__}, "
+                    f"not retrying: {str(e)}"
+                )
+                return None, None
+            except RateLimitedError as e:
+                Logger.print_warning(
+                    f"Rate limited by {backend.__class__.__name__} on attempt {attempt + 1}: "
+                    f"{str(e)}"
+                )
+                if e.retry_after is not None:
+                    retry_after = min(e.retry_after, self.MAX_RETRY_AFTER)
+                if attempt == self.MAX_RETRIES - 1:
+                    Logger.print_error("All retry attempts exhausted")
+                    return None, None
             except (OSError, RuntimeError, ValueError, TimeoutError) as e:
                 Logger.print_error(f"Error on attempt {attempt + 1}: {str(e)}")
                 if attempt == self.MAX_RETRIES - 1:
@@ -202,7 +388,38 @@ class MusicGenerator:
         Returns:
             Union[str, Tuple[str, str], None]: Either a string path to the audio file,
             a tuple containing (audio_path, lyrics), or None if generation fails
+
+        Raises:
+            NonRetryableError: If the backend reports a failure that retrying cannot fix
+            RateLimitedError: If the backend was rate limited by its provider
         """
+        with self._CONCURRENCY:
+            return self._generate_with_backend(
+                backend,
+                prompt,
+                with_lyrics=with_lyrics,
+                title=title,
+                tags=tags,
+                duration=duration,
+                story_text=story_text,
+                query_dispatcher=query_dispatcher,
+                output_path=output_path,
+            )
+
+    def _generate_with_backend(
+        self,
+        backend,
+        prompt: str,
+        *,
+        with_lyrics: bool,
+        title: str | None,
+        tags: list[str] | None,
+        duration: int | None,
+        story_text: str | None,
+        query_dispatcher: Any | None,
+        output_path: str | None,
+    ) -> str | tuple[str, str] | None:
+        """Run one generation job end to end; see _try_generate_with_backend."""
         try:
             job_id = self._start_backend_generation(
                 backend,
@@ -226,6 +443,8 @@ class MusicGenerator:
 
             return self._copy_result_to_output(result, output_path)
 
+        except RateLimitedError:
+            raise
         except (OSError, RuntimeError, ValueError, TimeoutError) as e:
             Logger.print_error(f"Error with {backend.__class__.__name__}: {str(e)}")
             return None
@@ -257,15 +476,25 @@ class MusicGenerator:
         return job_id
 
     def _poll_until_complete(self, backend, job_id):
-        """Poll backend until generation is complete."""
+        """Poll backend until generation is complete.
+
+        Backends that expose a completion event wake the loop as soon as the job
+        finishes rather than after the next full polling interval.
+        """
+        completion = backend.completion_event(job_id)
         while True:
             status, progress = backend.check_progress(job_id)
             Logger.print_info(f"Generation progress: {status} ({progress:.1f}%)")
 
             if progress >= 100:
                 break
+            if completion is not None and completion.is_set():
+                break
 
-            time.sleep(5)
+            if completion is not None:
+                completion.wait(timeout=self.POLL_INTERVAL)
+            else:
+                time.sleep(self.POLL_INTERVAL)
 
     def _copy_result_to_output(self, result, output_path):
         """Copy generated result to output path if specified."""
@@ -283,7 +512,7 @@ class MusicGenerator:
     def _copy_single_file(self, result, output_path):
         """Copy a single file result to output path."""
         try:
-            shutil.copy2(result, output_path)
+            _materialize_output(result, output_path, keep_source=False)
             return output_path
         except OSError as e:
             Logger.print_error(f"Failed to copy file to output path: {e}")
@@ -292,7 +521,7 @@ class MusicGenerator:
     def _copy_tuple_result(self, result, output_path):
         """Copy tuple result (audio, lyrics) to output path."""
         try:
-            shutil.copy2(result[0], output_path)
+            _materialize_output(result[0], output_path, keep_source=False)
             return output_path, result[1] if len(result) > 1 else None
         except OSError as e:
             Logger.print_error(f"Failed to copy file to output path: {e}")
@@ -326,16 +555,20 @@ class MusicGenerator:
             f"Generating music with lyrics. Prompt: {prompt}, Story length: {len(story_text)}"
         )
 
-        result = self._try_generate_with_backend(
-            self.backend,
-            prompt,
-            with_lyrics=True,
-            title=title,
-            tags=tags,
-            story_text=story_text,
-            query_dispatcher=query_dispatcher,
-            output_path=output_path,
-        )
+        try:
+            result = self._try_generate_with_backend(
+                self.backend,
+                prompt,
+                with_lyrics=True,
+                title=title,
+                tags=tags,
+                story_text=story_text,
+                query_dispatcher=query_dispatcher,
+                output_path=output_path,
+            )
+        except (NonRetryableError, RateLimitedError) as e:
+            Logger.print_error(f"Failed to generate music with lyrics: {str(e)}")
+            return None, None
 
         if not result:
             return None, None
@@ -345,6 +578,28 @@ class MusicGenerator:
 
         return result, None
 
+    @staticmethod
+    def _probe_audio_stream(file_path: str) -> bool | None:
+        """Check for an audio stream in-process with PyAV, avoiding an ffprobe subprocess.
+
+        Args:
+            file_path: Path to the file to probe
+
+        Returns:
+            Optional[bool]: Whether the file has an audio stream, or None if PyAV is not
+                installed or could not open the file (callers then fall back to ffprobe)
+        """
+        try:
+            import av
+        except ImportError:
+            return None
+
+        try:
+            with av.open(file_path) as container:
+                return any(stream.type == "audio" for stream in container.streams)
+        except (av.error.FFmpegError, OSError, ValueError):
+            return None
+
     def validate_audio_file(self, file_path: str, thread_id: str | None = None) -> bool:
         """Validate that a file exists and is a valid audio file.
 
@@ -355,27 +610,27 @@ class MusicGenerator:
         Returns:
             bool: True if file is valid audio, False otherwise
         """
-        thread_prefix = f"{thread_id} " if thread_id else ""
+        thread_prefix = self._thread_prefix(thread_id)
 
         if not os.path.exists(file_path):
             Logger.print_error(f"{thread_prefix}Audio file not found at: {file_path}")
             return False
 
+        has_audio = self._probe_audio_stream(file_path)
+        if has_audio is not None:
+            if not has_audio:
+                Logger.print_error(f"{thread_prefix}File is not a valid audio file: {file_path}")
+            return has_audio
+
         try:
-            cmd = [
-                "ffprobe",
-                "-v",
-                "error",
-                "-select_streams",
-                "a:0",
-                "-show_entries",
-                "stream=codec_type",
-                "-of",
-                "default=noprint_wrappers=1:nokey=1",
-                file_path,
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-            if result.returncode != 0 or "audio" not in result.stdout:
+            result = subprocess.run(
+                (*self._FFPROBE_AUDIO_STREAM_CMD, file_path),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            )
+            if result.returncode != 0 or b"audio" not in result.stdout:
                 Logger.print_error(f"{thread_prefix}File is not a valid audio file: {file_path}")
                 return False
             return True
@@ -384,42 +639,139 @@ class MusicGenerator:
             Logger.print_error(f"{thread_prefix}Failed to validate audio file: {str(e)}")
             return False
 
-    def get_background_music_from_file(
-        self, file_path: str, thread_id: str | None = None
+    def _get_music_from_file(
+        self, file_path: str, label: str, thread_id: str | None = None
     ) -> str | None:
-        """Get background music from a file path.
+        """Validate a configured audio file for a music asset.
 
         Args:
             file_path: Path to the audio file
+            label: Human-readable asset name used in log messages
             thread_id: Optional thread ID for logging
 
         Returns:
             Optional[str]: Path to validated audio file or None if invalid
         """
-        thread_prefix = f"{thread_id} " if thread_id else ""
-        Logger.print_info(
-            f"{thread_prefix}Using background music from file: "
-            f"{file_path}"
-        )
+        thread_prefix = self._thread_prefix(thread_id)
+        Logger.print_info(f"{thread_prefix}Using {label} from file: {file_path}")
 
         if self.validate_audio_file(file_path, thread_id):
             return file_path
         return None
 
+    def _prepare_music_output(
+        self,
+        prompt: str,
+        output_dir: str,
+        output_name: str,
+        label: str,
+        *,
+        skip_generation: bool,
+        thread_id: str | None,
+    ) -> str | None:
+        """Log and set up the output path for generating a music asset from a prompt.
+
+        Args:
+            prompt: The prompt to use for generation
+            output_dir: Directory to save generated music
+            output_name: File name of the generated asset inside output_dir
+            label: Human-readable asset name used in log messages
+            skip_generation: Whether to skip generation
+            thread_id: Optional thread ID for logging
+
+        Returns:
+            Optional[str]: Output path to generate into, or None if generation is skipped
+        """
+        thread_prefix = self._thread_prefix(thread_id)
+
+        if skip_generation:
+            Logger.print_info(
+                f"{thread_prefix}Skipping {label} generation due to skip_generation flag"
+            )
+            return None
+
+        Logger.print_info(f"{thread_prefix}Generating {label} with prompt: {prompt}")
+
+        # Create output directory if it doesn't exist
+        self._ensure_dir(output_dir)
+        return os.path.join(output_dir, output_name)
+
+    def _get_music_settings(
+        self, config: Any, config_attr: str, label: str, thread_id: str | None = None
+    ) -> tuple[str | None, str | None] | None:
+        """Read and validate the file/prompt settings of a music asset in a config.
+
+        Args:
+            config: Configuration object containing the music settings
+            config_attr: Name of the settings attribute on config
+            label: Human-readable asset name used in log messages
+            thread_id: Optional thread ID for logging
+
+        Returns:
+            Optional[Tuple[Optional[str], Optional[str]]]: (file, prompt) with exactly one
+                of them set, or None if the settings are missing or invalid
+        """
+        thread_prefix = self._thread_prefix(thread_id)
+
+        settings = getattr(config, config_attr, None)
+        if not settings:
+            Logger.print_info(f"{thread_prefix}No {label} configuration found")
+            return None
+
+        file_path = getattr(settings, "file", None)
+        prompt = getattr(settings, "prompt", None)
+
+        if file_path is not None and prompt is not None:
+            Logger.print_error(
+                f"{thread_prefix}{label.capitalize()} path and prompt cannot both be "
+                "set simultaneously. "
+                f"Current path: {file_path} and prompt: {prompt}"
+            )
+            return None
+
+        if file_path is None and prompt is None:
+            Logger.print_error(
+                f"{thread_prefix}{label.capitalize()} path and prompt cannot both be None"
+            )
+            return None
+
+        return file_path, prompt
+
+    def get_background_music_from_file(
+        self, file_path: str, thread_id: str | None = None
+    ) -> str | None:
+        """Get background music from a file path.
+
+        Args:
+            file_path: Path to the audio file
+            thread_id: Optional thread ID for logging
+
+        Returns:
+            Optional[str]: Path to validated audio file or None if invalid
+        """
+        return self._get_music_from_file(file_path, "background music", thread_id)
+
     def _estimate_background_duration(self, story: list[str] | None) -> int:
         """Estimate background music duration from story text."""
         if not story:
             return self.MIN_BACKGROUND_DURATION
+        return self._estimate_duration_for_story(
+            tuple(sentence for sentence in story if isinstance(sentence, str))
+        )
 
-        total_words = sum(len(sentence.split()) for sentence in story if isinstance(sentence, str))
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _estimate_duration_for_story(cls, story: tuple[str, ...]) -> int:
+        """Estimate duration for a hashable story; memoized since configs are re-read per run."""
+        total_words = sum(len(sentence.split()) for sentence in story)
         if total_words == 0:
-            return self.MIN_BACKGROUND_DURATION
+            return cls.MIN_BACKGROUND_DURATION
 
         estimated_seconds = max(
-            int(total_words / self.WORDS_PER_SECOND),
-            self.MIN_BACKGROUND_DURATION,
+            int(total_words / cls.WORDS_PER_SECOND),
+            cls.MIN_BACKGROUND_DURATION,
         )
-        return min(estimated_seconds, self.MAX_BACKGROUND_DURATION)
+        return min(estimated_seconds, cls.MAX_BACKGROUND_DURATION)
 
     def get_background_music_from_prompt(
         self,
@@ -428,7 +780,7 @@ class MusicGenerator:
         *,
         skip_generation: bool = False,
         thread_id: str | None = None,
-        target_duration: int | None = None,
+        target_duration: int = MIN_BACKGROUND_DURATION,
     ) -> str | None:
         """Generate background music from a prompt.
 
@@ -437,33 +789,30 @@ class MusicGenerator:
             output_dir: Directory to save generated music
             skip_generation: Whether to skip generation
             thread_id: Optional thread ID for logging
-            target_duration: Desired duration of the generated track in seconds
+            target_duration: Desired duration of the generated track in seconds, clamped to
+                [MIN_BACKGROUND_DURATION, MAX_BACKGROUND_DURATION]
 
         Returns:
             Optional[str]: Path to generated audio file or None if generation failed
         """
-        thread_prefix = f"{thread_id} " if thread_id else ""
-
-        if skip_generation:
-            Logger.print_info(
-                f"{thread_prefix}Skipping background music generation due to skip_generation flag"
-            )
-            return None
-
-        Logger.print_info(
-            f"{thread_prefix}Generating background music with prompt: "
-            f"{prompt}"
+        output_path = self._prepare_music_output(
+            prompt,
+            output_dir,
+            "background_music.mp3",
+            "background music",
+            skip_generation=skip_generation,
+            thread_id=thread_id,
         )
-        output_path = os.path.join(output_dir, "background_music.mp3")
+        if output_path is None:
+            return None
 
-        # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        thread_prefix = self._thread_prefix(thread_id)
 
         # Generate music synchronously within this thread
         result = self.generate_instrumental(
             prompt=prompt,
-            duration=(
-                target_duration if target_duration is not None else self.MIN_BACKGROUND_DURATION
+            duration=min(
+                max(target_duration, self.MIN_BACKGROUND_DURATION), self.MAX_BACKGROUND_DURATION
             ),
             output_path=output_path,
         )
@@ -476,9 +825,13 @@ class MusicGenerator:
                 f"{background_music_path}"
             )
 
-            # If we have an output path, try to copy the file
+            # The backend usually already placed the file at output_path
+            if os.path.abspath(background_music_path) == os.path.abspath(output_path):
+                return output_path
+
+            # Otherwise, try to copy the file
             try:
-                shutil.copy2(background_music_path, output_path)
+                _materialize_output(background_music_path, output_path)
                 return output_path
             except OSError as e:
                 Logger.print_error(f"{thread_prefix}Failed to copy file to output path: {e}")
@@ -508,34 +861,12 @@ class MusicGenerator:
         Returns:
             Optional[str]: Path to background music file or None if not available
         """
-        thread_prefix = f"{thread_id} " if thread_id else ""
-
-        if not hasattr(config, "background_music") or not config.background_music:
-            Logger.print_info(f"{thread_prefix}No background music configuration found")
-            return None
-
-        # Get file and prompt settings
-        background_music_path = getattr(config.background_music, "file", None)
-        background_music_prompt = getattr(config.background_music, "prompt", None)
-
-        # Validate settings
-        if background_music_path is not None and background_music_prompt is not None:
-            Logger.print_error(
-                f"{thread_prefix}Background music path and prompt cannot both be "
-                "set simultaneously."
-                f" Current path: {background_music_path} and prompt: {background_music_prompt}"
-            )
-            return None
-
-        if background_music_path is None and background_music_prompt is None:
-            Logger.print_error(
-                f"{thread_prefix}Background music path and prompt cannot both be None"
-            )
-            return None
-
-        estimated_duration = self._estimate_background_duration(
-            getattr(config, 'story', None)
+        settings = self._get_music_settings(
+            config, "background_music", "background music", thread_id
         )
+        if settings is None:
+            return None
+        background_music_path, background_music_prompt = settings
 
         # Get background music from file or generate from prompt
         if background_music_path is not None:
@@ -545,7 +876,7 @@ class MusicGenerator:
             output_dir,
             skip_generation=skip_generation,
             thread_id=thread_id,
-            target_duration=estimated_duration,
+            target_duration=self._estimate_background_duration(getattr(config, "story", None)),
         )
 
     def get_closing_credits_from_file(
@@ -560,12 +891,7 @@ class MusicGenerator:
         Returns:
             Optional[str]: Path to validated audio file or None if invalid
         """
-        thread_prefix = f"{thread_id} " if thread_id else ""
-        Logger.print_info(f"{thread_prefix}Using closing credits from file: {file_path}")
-
-        if self.validate_audio_file(file_path, thread_id):
-            return file_path
-        return None
+        return self._get_music_from_file(file_path, "closing credits", thread_id)
 
     def get_closing_credits_from_prompt(
         self,
@@ -592,22 +918,18 @@ class MusicGenerator:
                 - Path to generated audio file or None if generation failed
                 - Generated lyrics or None if not available
         """
-        thread_prefix = f"{thread_id} " if thread_id else ""
-
-        if skip_generation:
-            Logger.print_info(
-                f"{thread_prefix}Skipping closing credits generation due to skip_generation flag"
-            )
-            return None, None
-
-        Logger.print_info(
-            f"{thread_prefix}Generating closing credits with prompt: "
-            f"{prompt}"
+        output_path = self._prepare_music_output(
+            prompt,
+            output_dir,
+            "closing_credits.mp3",
+            "closing credits",
+            skip_generation=skip_generation,
+            thread_id=thread_id,
         )
-        output_path = os.path.join(output_dir, "closing_credits.mp3")
+        if output_path is None:
+            return None, None
 
-        # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        thread_prefix = self._thread_prefix(thread_id)
 
         # Generate music synchronously within this thread
         result = self.generate_with_lyrics(
@@ -667,31 +989,12 @@ class MusicGenerator:
                 - Path to closing credits file or None if not available
                 - Generated lyrics or None if not available
         """
-        thread_prefix = f"{thread_id} " if thread_id else ""
-
-        if not hasattr(config, "closing_credits") or not config.closing_credits:
-            Logger.print_info(f"{thread_prefix}No closing credits configuration found")
-            return None, None
-
-        # Get file and prompt settings
-        closing_credits_path = getattr(config.closing_credits, "file", None)
-        closing_credits_prompt = getattr(config.closing_credits, "prompt", None)
-
-        # Validate settings
-        if closing_credits_path is not None and closing_credits_prompt is not None:
-            Logger.print_error(
-                f"{thread_prefix}Closing credits path and prompt cannot both be "
-                "set simultaneously. "
-                f"Current path: {closing_credits_path} "
-                f"and prompt: {closing_credits_prompt}"
-            )
-            return None, None
-
-        if closing_credits_path is None and closing_credits_prompt is None:
-            Logger.print_error(
-                f"{thread_prefix}Closing credits path and prompt cannot both be None"
-            )
+        settings = self._get_music_settings(
+            config, "closing_credits", "closing credits", thread_id
+        )
+        if settings is None:
             return None, None
+        closing_credits_path, closing_credits_prompt = settings
 
         # Get closing credits from file or generate from prompt
         if closing_credits_path is not None:
@@ -0,0 +1,190 @@
+"""
+Cache for LLM queries made while gathering story information.
+
+Users frequently retry with the same story ideas and styles. This module caches query
+responses keyed on the user's input, and serves a cached response when a new input has
+the same words as one seen before, ignoring case, punctuation and spacing.
+"""
+
+import atexit
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+
+from ganglia_common.logger import Logger
+
+_WORD_PATTERN = re.compile(r"[a-z0-9']+")
+
+
+class QueryCache:
+    """
+    LRU cache of query responses keyed on normalized user input.
+
+    Only inputs with the same words in the same order share a response: inputs that
+    differ in a single word can ask for a different story, so looser matching would
+    serve one user's story for another's idea.
+
+    Entries are grouped by kind (e.g. "story", "title", "visual_style") so that the same
+    input to different prompts never shares a response.
+    """
+
+    DEFAULT_MAX_ENTRIES = 1024
+    DEFAULT_FLUSH_DELAY = 5.0
+
+    def __init__(
+        self,
+        path: str | None = None,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        flush_delay: float = DEFAULT_FLUSH_DELAY,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Optional JSON file to persist entries to across runs
+            max_entries: Maximum number of entries kept before evicting the oldest
+            flush_delay: Seconds after a change before entries are written to path;
+                changes in the meantime are written together
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.flush_delay = flush_delay
+        # (kind, normalized key) -> response, in least-recently-used order
+        self._entries: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._lock = threading.Lock()
+        # Serializes writes to path, so an older snapshot never replaces a newer one
+        self._save_lock = threading.Lock()
+        self._loaded = path is None
+        self._dirty = False
+        self._flush_timer: threading.Timer | None = None
+        if path:
+            # Write out changes still waiting for their flush when the process exits
+            atexit.register(self.flush)
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return " ".join(_WORD_PATTERN.findall(text.lower()))
+
+    def _load(self):
+        """Load persisted entries on first use."""
+        self._loaded = True
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            Logger.print_warning(f"Ignoring unreadable query cache {self.path}: {e}")
+            return
+        if not isinstance(stored, list) or not all(
+            isinstance(row, list) and len(row) == 3 and all(isinstance(v, str) for v in row)
+            for row in stored
+        ):
+            Logger.print_warning(
+                f"Ignoring unreadable query cache {self.path}: expected [kind, key, response] rows"
+            )
+            return
+        for kind, key, response in stored[-self.max_entries :]:
+            self._entries[(kind, self._normalize(key))] = response
+
+    def _schedule_flush(self):
+        """Mark entries changed and start the flush timer if none is pending.
+
+        Caller must hold the lock.
+        """
+        self._dirty = True
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_delay, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self):
+        """Write changed entries to path now, oldest first, so reloading keeps LRU order.
+
+        The entries go to a temporary file that then replaces path, so a crash mid-write
+        leaves the previous cache intact.
+        """
+        if not self.path:
+            return
+        with self._save_lock:
+            with self._lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                if not self._dirty:
+                    return
+                stored = [[kind, key, response] for (kind, key), response in self._entries.items()]
+                self._dirty = False
+
+            tmp_path = f"{self.path}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(stored, f)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                Logger.print_warning(f"Failed to save query cache {self.path}: {e}")
+
+    def get(self, kind: str, key: str) -> str | None:
+        """
+        Look up a cached response for key.
+
+        Args:
+            kind: Kind of query the response answers
+            key: User input the query was built from
+
+        Returns:
+            str | None: Cached response, or None on a miss
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            entry_id = (kind, self._normalize(key))
+            response = self._entries.get(entry_id)
+            if response is not None:
+                self._entries.move_to_end(entry_id)
+            return response
+
+    def put(self, kind: str, key: str, response: str):
+        """
+        Store a response for key, evicting the least recently used entry if full.
+
+        Args:
+            kind: Kind of query the response answers
+            key: User input the query was built from
+            response: Response to cache
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            entry_id = (kind, self._normalize(key))
+            self._entries[entry_id] = response
+            self._entries.move_to_end(entry_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if self.path:
+                self._schedule_flush()
+
+    def query(self, query_dispatcher, kind: str, key: str, prompt: str) -> str:
+        """
+        Return the cached response for key, or send prompt and cache the result.
+
+        Args:
+            query_dispatcher: Dispatcher used on a cache miss
+            kind: Kind of query the response answers
+            key: User input the prompt was built from
+            prompt: Full prompt to send on a cache miss
+
+        Returns:
+            str: The query response
+        """
+        cached = self.get(kind, key)
+        if cached is not None:
+            Logger.print_debug(f"Query cache hit for {kind}")
+            return cached
+        response = query_dispatcher.send_query(prompt)
+        if response:
+            self.put(kind, key, response)
+        return response
@@ -7,19 +7,277 @@ to build a TTV configuration file, and then triggering the TTV process.
 
 import json
 import os
+import queue
+import re
 import threading
 import time
 import traceback
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from enum import IntEnum
+from itertools import islice
 
 from ganglia_common.logger import Logger
 from ganglia_common.pubsub import Event, EventType, get_pubsub
 from ganglia_common.query_dispatch import ChatGPTQueryDispatcher
-from ganglia_common.utils.file_utils import get_timestamped_ttv_dir
+from ganglia_common.utils.file_utils import get_tempdir, get_timestamped_ttv_dir
 
 from ganglia_studio.interface.parse_inputs import parse_tts_interface
+from ganglia_studio.story.query_cache import QueryCache
 from ganglia_studio.video.ttv import text_to_video
 
 
+class _BackgroundPublisher:
+    """
+    Publishes events from a bounded queue on a single daemon thread.
+
+    Publishers return as soon as the event is queued instead of waiting on every
+    subscriber. Events are dispatched in the order they were queued, so an event a
+    subscriber publishes is handled after the one being dispatched returns. Identical
+    STORY_INFO_NEEDED requests queued back to back are dispatched once.
+    """
+
+    _STOP = object()
+
+    def __init__(self, name: str = "story-event-publisher", maxsize: int = 10_000):
+        self.name = name
+        self.queue = queue.Queue(maxsize=maxsize)
+        self._thread = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def submit(self, pubsub, event: Event):
+        """
+        Queue an event for publishing, starting the consumer thread on first use.
+
+        Once the publisher is closed, events are published on the caller instead.
+
+        Args:
+            pubsub: The pubsub system to publish the event on
+            event: The event to publish
+        """
+        with self._lock:
+            queued = False
+            if not self._closed:
+                if self._thread is None:
+                    thread = threading.Thread(target=self._run, name=self.name)
+                    thread.daemon = True
+                    thread.start()
+                    self._thread = thread
+                try:
+                    self.queue.put_nowait((pubsub, event))
+                    queued = True
+                except queue.Full:
+                    # Publish on the caller rather than drop the event or block the consumer
+                    Logger.print_warning(
+                        f"Event queue full, publishing {event.event_type} directly"
+                    )
+        if not queued:
+            pubsub.publish(event)
+
+    def flush(self):
+        """Wait until every queued event has been published. Not for use by subscribers."""
+        self.queue.join()
+
+    def close(self):
+        """Stop queueing events; the consumer thread exits once the queued ones are published."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._thread is not None:
+                # Nothing is queued after this, since submit checks _closed under the lock
+                self.queue.put(self._STOP)
+
+    def _run(self):
+        """Consume queued events until closed, coalescing duplicate story info requests."""
+        while True:
+            batch = [self.queue.get()]
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stopped = False
+            previous = None
+            for item in batch:
+                if item is self._STOP:
+                    stopped = True
+                    self.queue.task_done()
+                    continue
+                pubsub, event = item
+                try:
+                    if not self._is_repeat_request(previous, pubsub, event):
+                        pubsub.publish(event)
+                except Exception as e:
+                    Logger.print_error(f"Error publishing {event.event_type}: {e}")
+                finally:
+                    previous = (pubsub, event)
+                    self.queue.task_done()
+            if stopped:
+                return
+
+    @staticmethod
+    def _is_repeat_request(previous, pubsub, event: Event) -> bool:
+        """Whether event repeats the STORY_INFO_NEEDED request dispatched just before it."""
+        if previous is None or event.event_type != EventType.STORY_INFO_NEEDED:
+            return False
+        previous_pubsub, previous_event = previous
+        return (
+            previous_pubsub is pubsub
+            and previous_event.event_type == event.event_type
+            and previous_event.target == event.target
+            and previous_event.data == event.data
+        )
+
+
+# One publisher per user, so each session keeps its event order without waiting on the
+# subscribers of other sessions. Drivers without a user share the None publisher.
+_publishers: dict[str | None, _BackgroundPublisher] = {}
+_publishers_lock = threading.Lock()
+
+
+def _publisher_for(user_id: str | None) -> _BackgroundPublisher:
+    """
+    Get the background publisher for a user's events, creating it on first use.
+
+    Args:
+        user_id: User the events belong to; None for drivers that follow conversations
+
+    Returns:
+        _BackgroundPublisher: The publisher
+    """
+    with _publishers_lock:
+        publisher = _publishers.get(user_id)
+        if publisher is None:
+            name = "story-event-publisher" if user_id is None else f"story-events-{user_id}"
+            publisher = _BackgroundPublisher(name)
+            _publishers[user_id] = publisher
+        return publisher
+
+
+def _release_publisher(user_id: str):
+    """
+    Close and drop a user's publisher. Its thread exits once its queued events are
+    published, and any events its drivers publish later are published directly.
+
+    Args:
+        user_id: User whose publisher should be dropped
+    """
+    with _publishers_lock:
+        publisher = _publishers.pop(user_id, None)
+    if publisher is not None:
+        publisher.close()
+
+
+def flush_published_events():
+    """Block until every event queued by story generation drivers has been published."""
+    with _publishers_lock:
+        publishers = list(_publishers.values())
+    for publisher in publishers:
+        publisher.flush()
+
+
+@dataclass(slots=True)
+class MusicInfo:
+    """Music prompt for a section of the video, and the generated file once there is one."""
+
+    prompt: str | None = None
+    file: str | None = None
+
+
+@dataclass(slots=True)
+class StoryInfo:
+    """Story information gathered from the user; serializes to a TTV config file."""
+
+    title: str | None = None
+    style: str | None = None
+    story: list[str] = field(default_factory=list)
+    music_backend: str = "suno"
+    background_music: MusicInfo = field(default_factory=MusicInfo)
+    closing_credits: MusicInfo = field(default_factory=MusicInfo)
+    caption_style: str = "dynamic"
+
+
+def _serialize_config(story_info: StoryInfo) -> bytes:
+    """
+    Serialize a TTV config to indented JSON, using orjson when it is installed.
+
+    Args:
+        story_info: The config to serialize
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(asdict(story_info), indent=2).encode("utf-8")
+    return orjson.dumps(story_info, option=orjson.OPT_INDENT_2)
+
+
+# Number of scenes generated for a story
+SCENE_COUNT = 5
+
+
+def _iter_lines(chunks):
+    """
+    Yield the stripped, non-empty lines of a streamed response as each one completes.
+
+    Args:
+        chunks: Iterable of text chunks that may split lines anywhere
+
+    Yields:
+        str: Each complete line
+    """
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            if line.strip():
+                yield line.strip()
+    if buffer.strip():
+        yield buffer.strip()
+
+
+def _parse_scenes(response: str) -> list[str]:
+    """
+    Split a complete scene response into up to SCENE_COUNT scenes.
+
+    Uses the same line handling as streamed responses, so cached and live responses
+    give the same scenes.
+
+    Args:
+        response: The full response text, one scene per line
+
+    Returns:
+        list[str]: The stripped, non-empty scene lines
+    """
+    return list(islice(_iter_lines((response,)), SCENE_COUNT))
+
+
+# Style fields extracted from the user's artistic style answer, and what each one describes
+STYLE_FIELDS = {
+    "visual_style": (
+        'a visual style for images (e.g., "cinematic dark fantasy", "anime", "photorealistic")'
+    ),
+    "background_music": "a music style for background music",
+    "closing_credits": "a music style for closing credits",
+}
+
+# Label the model sometimes echoes ahead of a style (e.g. "Visual style: anime"), and
+# where each extracted style field lands in story_info
+_STYLE_LABEL_RE = re.compile(r"^\s*(?:visual style|background music|closing credits)\s*:", re.I)
+_STYLE_TARGETS = {
+    "visual_style": ("style",),
+    "background_music": ("background_music", "prompt"),
+    "closing_credits": ("closing_credits", "prompt"),
+}
+
+
 class StoryInfoType:
     """Types of story information that can be requested from the user."""
 
@@ -28,17 +286,22 @@ class StoryInfoType:
     MUSIC_STYLE = "music_style"
 
 
-class StoryGenerationState:
+class StoryGenerationState(IntEnum):
     """States for the story generation process."""
 
-    IDLE = "idle"
-    GATHERING_STORY_IDEA = "gathering_story_idea"
-    GATHERING_ARTISTIC_STYLE = "gathering_artistic_style"
-    GENERATING_CONFIG = "generating_config"
-    RUNNING_TTV = "running_ttv"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    CANCELLED = "cancelled"
+    IDLE = 0
+    GATHERING_STORY_IDEA = 1
+    GATHERING_ARTISTIC_STYLE = 2
+    GENERATING_CONFIG = 3
+    RUNNING_TTV = 4
+    COMPLETED = 5
+    FAILED = 6
+    CANCELLED = 7
+
+    @property
+    def label(self) -> str:
+        """Lowercase state name, as published in event data (e.g. "running_ttv")."""
+        return self.name.lower()
 
 
 class StoryGenerationDriver:
@@ -50,37 +313,104 @@ class StoryGenerationDriver:
     conversation flow.
     """
 
-    def __init__(self, query_dispatcher: ChatGPTQueryDispatcher | None = None):
+    # Pubsub subscriptions are made once per pubsub instance by the class, which routes
+    # each event to the driver for its target user instead of every driver hearing it
+    _subscribed_pubsubs = weakref.WeakSet()
+    _drivers_by_user = weakref.WeakValueDictionary()  # drivers dedicated to one user
+    _shared_drivers = weakref.WeakSet()  # drivers that follow the latest conversation
+    _routing_lock = threading.Lock()
+
+    def __init__(
+        self,
+        query_dispatcher: ChatGPTQueryDispatcher | None = None,
+        query_cache: QueryCache | None = None,
+        user_id: str | None = None,
+    ):
         """
         Initialize the story generation driver.
 
         Args:
             query_dispatcher: Optional query dispatcher for AI-assisted content generation
+            query_cache: Optional cache for query responses (default: in-memory only)
+            user_id: Optional user this driver serves exclusively. Without one, the driver
+                follows whichever user most recently started a conversation.
         """
         self.pubsub = get_pubsub()
         self.query_dispatcher = query_dispatcher
-        self.user_id = None
+        self.query_cache = query_cache if query_cache is not None else QueryCache()
+        self.user_id = user_id
+        self._owns_user = user_id is not None
+        self._publisher = _publisher_for(user_id)
         self.state = StoryGenerationState.IDLE
-        self.story_info = {
-            "title": None,
-            "style": None,
-            "story": [],
-            "music_backend": "suno",
-            "background_music": {"prompt": None, "file": None},
-            "closing_credits": {"prompt": None, "file": None},
-            "caption_style": "dynamic",
-        }
+        self.story_info = StoryInfo()
         self.config_path = None
+        # Set once the pending config file write (if any) has finished
+        self._config_written = threading.Event()
+        self._config_written.set()
+        # Handler for user responses, per state that is waiting on one
+        self._state_handlers = {
+            StoryGenerationState.GATHERING_STORY_IDEA: self._on_story_idea,
+            StoryGenerationState.GATHERING_ARTISTIC_STYLE: self._on_artistic_style,
+        }
         self._setup_pubsub_subscribers()
         Logger.print_debug("Story generation driver initialized")
 
     def _setup_pubsub_subscribers(self):
-        """Set up the PubSub subscribers for the story generation driver."""
+        """Register this driver for event routing, subscribing the class on first use."""
+        cls = type(self)
+        with cls._routing_lock:
+            if self._owns_user:
+                cls._drivers_by_user[self.user_id] = self
+            else:
+                cls._shared_drivers.add(self)
+            if self.pubsub in cls._subscribed_pubsubs:
+                return
+            cls._subscribed_pubsubs.add(self.pubsub)
+
         # Subscribe to conversation started events
-        self.pubsub.subscribe(EventType.CONVERSATION_STARTED, self._handle_conversation_started)
+        self.pubsub.subscribe(EventType.CONVERSATION_STARTED, cls._route_conversation_started)
 
         # Subscribe to story information received events
-        self.pubsub.subscribe(EventType.STORY_INFO_RECEIVED, self._handle_story_info_received)
+        self.pubsub.subscribe(EventType.STORY_INFO_RECEIVED, cls._route_story_info_received)
+
+    @classmethod
+    def _route_conversation_started(cls, event: Event):
+        """
+        Deliver a conversation started event to the drivers that follow conversations.
+
+        Args:
+            event: The event to route
+        """
+        for driver in list(cls._shared_drivers):
+            driver._handle_conversation_started(event)
+
+    @classmethod
+    def _route_story_info_received(cls, event: Event):
+        """
+        Deliver story information to the driver dedicated to its target user, if any,
+        and otherwise to the drivers that follow conversations.
+
+        Args:
+            event: The event to route
+        """
+        driver = cls._drivers_by_user.get(event.target)
+        if driver is not None:
+            driver._handle_story_info_received(event)
+            return
+        for driver in list(cls._shared_drivers):
+            driver._handle_story_info_received(event)
+
+    def _publish(self, event: Event):
+        """
+        Publish an event from the background publisher for this driver's user.
+
+        Returns once the event is queued; subscribers run on the publisher thread, and
+        events published by them are dispatched after the current dispatch returns.
+
+        Args:
+            event: The event to publish
+        """
+        self._publisher.submit(self.pubsub, event)
 
     def _handle_conversation_started(self, event: Event):
         """
@@ -89,6 +419,10 @@ class StoryGenerationDriver:
         Args:
             event: The event to handle
         """
+        if self._owns_user:
+            # Per-user drivers keep serving the user they were created for
+            return
+
         # Store the user ID for targeting events
         self.user_id = event.data.get("user_id")
         Logger.print_debug(f"Story generation driver registered user: {self.user_id}")
@@ -100,15 +434,7 @@ class StoryGenerationDriver:
             return
 
         # Reset story information
-        self.story_info = {
-            "title": "User's Story",
-            "style": "cinematic",
-            "story": [],
-            "music_backend": "suno",
-            "background_music": {"prompt": None, "file": None},
-            "closing_credits": {"prompt": None, "file": None},
-            "caption_style": "dynamic",
-        }
+        self.story_info = StoryInfo(title="User's Story", style="cinematic")
 
         # Update state and request story idea
         self.state = StoryGenerationState.GATHERING_STORY_IDEA
@@ -116,7 +442,7 @@ class StoryGenerationDriver:
 
     def _request_story_idea(self):
         """Request the story idea from the user."""
-        self.pubsub.publish(
+        self._publish(
             Event(
                 event_type=EventType.STORY_INFO_NEEDED,
                 data={
@@ -127,7 +453,7 @@ class StoryGenerationDriver:
                         "What do you have in mind for the protagonist? The conflict? "
                         "The resolution?"
                     ),
-                    "current_state": self.state,
+                    "current_state": self.state.label,
                 },
                 source="story_generation_driver",
                 target=self.user_id,
@@ -136,7 +462,7 @@ class StoryGenerationDriver:
 
     def _request_artistic_style(self):
         """Request the artistic style from the user."""
-        self.pubsub.publish(
+        self._publish(
             Event(
                 event_type=EventType.STORY_INFO_NEEDED,
                 data={
@@ -145,7 +471,7 @@ class StoryGenerationDriver:
                         "What artistic style are you thinking for the visual components? "
                         "What about music styles for the background music and closing credits?"
                     ),
-                    "current_state": self.state,
+                    "current_state": self.state.label,
                 },
                 source="story_generation_driver",
                 target=self.user_id,
@@ -169,7 +495,7 @@ class StoryGenerationDriver:
         if not is_valid:
             # User declined or provided invalid information
             self.state = StoryGenerationState.CANCELLED
-            self.pubsub.publish(
+            self._publish(
                 Event(
                     event_type=EventType.STORY_INFO_NEEDED,
                     data={
@@ -178,7 +504,7 @@ class StoryGenerationDriver:
                             "No problem! Let me know if you change your mind and want "
                             "to create a video later."
                         ),
-                        "current_state": self.state,
+                        "current_state": self.state.label,
                     },
                     source="story_generation_driver",
                     target=self.user_id,
@@ -187,26 +513,36 @@ class StoryGenerationDriver:
             return
 
         # Process the information based on the current state
-        if self.state == StoryGenerationState.GATHERING_STORY_IDEA:
-            # Process story idea
-            self._process_story_idea(user_response)
-            # Move to next state
-            self.state = StoryGenerationState.GATHERING_ARTISTIC_STYLE
-            # Request artistic style
-            self._request_artistic_style()
-
-        elif self.state == StoryGenerationState.GATHERING_ARTISTIC_STYLE:
-            # Process artistic style
-            self._process_artistic_style(user_response)
-            # Move to generating config state
-            self.state = StoryGenerationState.GENERATING_CONFIG
-            # Generate the config file
-            self._generate_config_file()
-            # Start the TTV process
-            self._start_ttv_process()
+        handler = self._state_handlers.get(self.state)
+        if handler is None:
+            Logger.print_error(f"Received story info in unexpected state: {self.state.label}")
+            return
+        handler(user_response)
 
-        else:
-            Logger.print_error(f"Received story info in unexpected state: {self.state}")
+    def _on_story_idea(self, user_response: str):
+        """
+        Handle the user's story idea.
+
+        Args:
+            user_response: The user's response containing the story idea
+        """
+        self._process_story_idea(user_response)
+        # Move to next state and request artistic style
+        self.state = StoryGenerationState.GATHERING_ARTISTIC_STYLE
+        self._request_artistic_style()
+
+    def _on_artistic_style(self, user_response: str):
+        """
+        Handle the user's artistic style, then generate the config and start TTV.
+
+        Args:
+            user_response: The user's response containing the artistic style
+        """
+        self._process_artistic_style(user_response)
+        # Move to generating config state
+        self.state = StoryGenerationState.GENERATING_CONFIG
+        self._generate_config_file()
+        self._start_ttv_process()
 
     def _process_story_idea(self, user_response: str):
         """
@@ -225,30 +561,63 @@ class StoryGenerationDriver:
             User input: {user_response}
             """
 
-            story_response = self.query_dispatcher.send_query(prompt)
-
-            # Extract the story scenes
-            scenes = [line.strip() for line in story_response.split("\n") if line.strip()]
-            # Take up to 5 scenes
-            scenes = scenes[:5]
+            scenes = self._query_scenes(user_response, prompt)
 
             # Generate a title
             title_prompt = f"Generate a short, catchy title for this story: {' '.join(scenes)}"
-            title = self.query_dispatcher.send_query(title_prompt).strip()
+            title = self.query_cache.query(
+                self.query_dispatcher, "title", " ".join(scenes), title_prompt
+            ).strip()
 
             # Update story info
-            self.story_info["story"] = scenes
-            self.story_info["title"] = title
+            self.story_info.story = scenes
+            self.story_info.title = title
         else:
             # Fallback if no query dispatcher
-            self.story_info["story"] = [
+            self.story_info.story = [
                 "A character embarks on an adventure",
                 "They encounter a challenge along the way",
                 "They struggle to overcome the obstacle",
                 "With determination, they find a solution",
                 "They return home changed by the experience",
             ]
-            self.story_info["title"] = "The Journey"
+            self.story_info.title = "The Journey"
+
+    def _query_scenes(self, user_response: str, prompt: str) -> list[str]:
+        """
+        Get up to SCENE_COUNT story scenes for the user's input.
+
+        When the dispatcher can stream, scenes are taken as their lines complete and the
+        stream is abandoned once enough have arrived, so the title query can start
+        without waiting for the rest of the response.
+
+        Args:
+            user_response: The user's response containing the story idea
+            prompt: The scene generation prompt
+
+        Returns:
+            list[str]: The story scenes
+        """
+        # Look the method up on the class so that auto-attributes on mocks don't count
+        if getattr(type(self.query_dispatcher), "send_query_stream", None) is None:
+            story_response = self.query_cache.query(
+                self.query_dispatcher, "story", user_response, prompt
+            )
+            return _parse_scenes(story_response)
+
+        cached = self.query_cache.get("story", user_response)
+        if cached is not None:
+            return _parse_scenes(cached)
+
+        lines = _iter_lines(self.query_dispatcher.send_query_stream(prompt))
+        try:
+            scenes = list(islice(lines, SCENE_COUNT))
+        finally:
+            # Stop reading the stream; anything past the last scene is unused
+            lines.close()
+        if scenes:
+            self.query_cache.put("story", user_response, "\n".join(scenes))
+        return scenes
 
     def _process_artistic_style(self, user_response: str):
         """
@@ -259,48 +628,47 @@ class StoryGenerationDriver:
         """
         # Use query dispatcher to extract style information
         if self.query_dispatcher:
-            prompt = f"""
-            Based on the following user input, extract:
-            1. A visual style for images (e.g., "cinematic dark fantasy", "anime", "photorealistic")
-            2. A music style for background music
-            3. A music style for closing credits
-
-            Format your response as:
-            Visual style: [style]
-            Background music: [style]
-            Closing credits: [style]
+            # Each fragment was extracted from a whole answer, so it is only reused for the
+            # same answer; only ask for the fields not already cached for it
+            styles = {}
+            for style_field in STYLE_FIELDS:
+                cached = self.query_cache.get(style_field, user_response)
+                if cached is not None:
+                    styles[style_field] = cached
+            missing = [style_field for style_field in STYLE_FIELDS if style_field not in styles]
+            if missing:
+                prompts = [
+                    f"""
+            Based on the following user input, describe {STYLE_FIELDS[style_field]}.
+            Respond with only the style in a few words, with no label or extra text.
 
             User input: {user_response}
             """
+                    for style_field in missing
+                ]
 
-            style_response = self.query_dispatcher.send_query(prompt)
-
-            # Parse the response
-            visual_style = None
-            background_music = None
-            closing_credits = None
+                # The fields are independent, so extract them concurrently
+                with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+                    responses = list(executor.map(self.query_dispatcher.send_query, prompts))
 
-            for line in style_response.split("\n"):
-                line = line.strip()
-                if line.startswith("Visual style:"):
-                    visual_style = line.replace("Visual style:", "").strip()
-                elif line.startswith("Background music:"):
-                    background_music = line.replace("Background music:", "").strip()
-                elif line.startswith("Closing credits:"):
-                    closing_credits = line.replace("Closing credits:", "").strip()
+                for style_field, response in zip(missing, responses, strict=True):
+                    value = _STYLE_LABEL_RE.sub("", response, count=1).strip() if response else ""
+                    if value:
+                        styles[style_field] = value
+                        self.query_cache.put(style_field, user_response, value)
 
             # Update story info
-            if visual_style:
-                self.story_info["style"] = visual_style
-            if background_music:
-                self.story_info["background_music"]["prompt"] = background_music
-            if closing_credits:
-                self.story_info["closing_credits"]["prompt"] = closing_credits
+            for style_field, value in styles.items():
+                *parents, key = _STYLE_TARGETS[style_field]
+                target = self.story_info
+                for parent in parents:
+                    target = getattr(target, parent)
+                setattr(target, key, value)
         else:
             # Fallback if no query dispatcher
-            self.story_info["style"] = "cinematic"
-            self.story_info["background_music"]["prompt"] = "epic orchestral"
-            self.story_info["closing_credits"]["prompt"] = "gentle piano"
+            self.story_info.style = "cinematic"
+            self.story_info.background_music.prompt = "epic orchestral"
+            self.story_info.closing_credits.prompt = "gentle piano"
 
     def _generate_config_file(self):
         """Generate the TTV config file."""
@@ -310,11 +678,35 @@ class StoryGenerationDriver:
         # Create the config file path
         self.config_path = os.path.join(ttv_dir, "ttv_config.json")
 
-        # Write the config file
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(self.story_info, f, indent=4)
+        # Serialize now so later story_info edits can't race the write, then write the
+        # file off the event-handling path; _run_ttv_process waits for it to land
+        data = _serialize_config(self.story_info)
+        self._config_written = threading.Event()
+        thread = threading.Thread(
+            target=self._write_config_file,
+            args=(self.config_path, data, self._config_written),
+        )
+        thread.daemon = True
+        thread.start()
 
-        Logger.print_info(f"Generated TTV config file: {self.config_path}")
+    @staticmethod
+    def _write_config_file(config_path: str, data: bytes, written: threading.Event):
+        """
+        Write serialized config data to disk and signal completion.
+
+        Args:
+            config_path: Path of the config file to write
+            data: Serialized config
+            written: Event set once the write has finished, successfully or not
+        """
+        try:
+            with open(config_path, "wb") as f:
+                f.write(data)
+            Logger.print_info(f"Generated TTV config file: {config_path}")
+        except OSError as e:
+            Logger.print_error(f"Failed to write TTV config file {config_path}: {e}")
+        finally:
+            written.set()
 
     def _start_ttv_process(self):
         """Start the TTV process."""
@@ -322,7 +714,7 @@ class StoryGenerationDriver:
         self.state = StoryGenerationState.RUNNING_TTV
 
         # Notify that the TTV process is starting
-        self.pubsub.publish(
+        self._publish(
             Event(
                 event_type=EventType.TTV_PROCESS_STARTED,
                 data={
@@ -343,6 +735,9 @@ class StoryGenerationDriver:
     def _run_ttv_process(self):
         """Run the TTV process and handle events."""
         try:
+            # The config file is written asynchronously by _generate_config_file
+            self._config_written.wait()
+
             # Initialize TTS
             tts = parse_tts_interface("google")
 
@@ -358,7 +753,7 @@ class StoryGenerationDriver:
             self.state = StoryGenerationState.COMPLETED
 
             # Publish a TTV process completed event
-            self.pubsub.publish(
+            self._publish(
                 Event(
                     event_type=EventType.TTV_PROCESS_COMPLETED,
                     data={"output_path": output_path, "timestamp": time.time()},
@@ -371,7 +766,7 @@ class StoryGenerationDriver:
             self.state = StoryGenerationState.FAILED
 
             # Publish a TTV process failed event
-            self.pubsub.publish(
+            self._publish(
                 Event(
                     event_type=EventType.TTV_PROCESS_FAILED,
                     data={"error": str(e), "timestamp": time.time()},
@@ -384,13 +779,55 @@ class StoryGenerationDriver:
             Logger.print_error(f"Traceback: {traceback.format_exc()}")
 
 
-# Singleton holder
+# Driver registry: the shared driver, plus one driver per user that asked for its own
 class _StoryGenerationDriverHolder:
     instance: StoryGenerationDriver | None = None
+    instances: dict[str, StoryGenerationDriver] = {}
+    query_cache: QueryCache | None = None
+    lock = threading.Lock()
+
+
+def get_story_generation_driver(query_dispatcher=None, user_id: str | None = None):
+    """
+    Get the StoryGenerationDriver for a user, creating it on first use.
+
+    All drivers share one persistent query cache.
+
+    Args:
+        query_dispatcher: Query dispatcher used if the driver has to be created
+        user_id: User to get a dedicated driver for; None gets the shared driver
 
+    Returns:
+        StoryGenerationDriver: The driver
+    """
+    holder = _StoryGenerationDriverHolder
+    with holder.lock:
+        if holder.query_cache is None:
+            holder.query_cache = QueryCache(os.path.join(get_tempdir(), "story_query_cache.json"))
+
+        if user_id is None:
+            if holder.instance is None:
+                holder.instance = StoryGenerationDriver(
+                    query_dispatcher, query_cache=holder.query_cache
+                )
+            return holder.instance
+
+        driver = holder.instances.get(user_id)
+        if driver is None:
+            driver = StoryGenerationDriver(
+                query_dispatcher, query_cache=holder.query_cache, user_id=user_id
+            )
+            holder.instances[user_id] = driver
+        return driver
 
-def get_story_generation_driver(query_dispatcher=None):
-    """Get the singleton StoryGenerationDriver instance."""
-    if _StoryGenerationDriverHolder.instance is None:
-        _StoryGenerationDriverHolder.instance = StoryGenerationDriver(query_dispatcher)
-    return _StoryGenerationDriverHolder.instance
+
+def release_story_generation_driver(user_id: str):
+    """
+    Forget the dedicated driver for a user, e.g. once their conversation has ended.
+
+    Args:
+        user_id: User whose driver should be dropped
+    """
+    with _StoryGenerationDriverHolder.lock:
+        _StoryGenerationDriverHolder.instances.pop(user_id, None)
+    _release_publisher(user_id)
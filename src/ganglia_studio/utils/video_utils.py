@@ -1,19 +1,88 @@
 """Video generation and manipulation utilities."""
 
 # pylint: disable=no-member
+import atexit
 import os
 import random
+import shutil
+import subprocess
 import tempfile
+import threading
+from contextlib import suppress
+from functools import lru_cache
 
 import cv2
 import numpy as np
-from PIL import Image
-
-from ganglia_studio.utils.ffmpeg_utils import run_ffmpeg_command
+from ganglia_common.logger import Logger
+
+from ganglia_studio.utils.ffmpeg_utils import (
+    FFMPEG_THREAD_COUNT,
+    ffmpeg_thread_manager,
+    run_ffmpeg_command,
+)
+
+# Encoded test videos per (duration, size, color), kept private so callers can delete theirs
+_test_video_cache: dict[tuple, str] = {}
+_test_video_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _test_video_cache_dir() -> str:
+    """Directory for the cached test video encodes, removed when the process exits."""
+    directory = tempfile.TemporaryDirectory(prefix="ganglia_test_videos_")
+    atexit.register(directory.cleanup)
+    return directory.name
+
+
+@lru_cache(maxsize=32)
+def _test_video_cmd(duration, size, color):
+    """Build the ffmpeg arguments for a solid-color test video, minus the output path."""
+    red, green, blue = color
+    return (
+        "ffmpeg", "-y",
+        "-f", "lavfi", "-i", f"color=c=0x{red:02x}{green:02x}{blue:02x}:s={size[0]}x{size[1]}",
+        "-f", "lavfi", "-i", "anullsrc=r=48000:cl=stereo",
+        "-c:v", "libx264", "-t", str(duration),
+        "-c:a", "aac", "-b:a", "192k",
+        "-pix_fmt", "yuv420p"
+    )
+
+
+@lru_cache(maxsize=8)
+def _rawvideo_encode_cmd(width, height, fps, threads):
+    """Build the ffmpeg arguments for encoding raw BGR frames from stdin, minus the output."""
+    return (
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-threads", str(threads),
+        "-f", "rawvideo", "-pix_fmt", "bgr24",
+        "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+        "-c:v", "libx264", "-preset", "ultrafast", "-pix_fmt", "yuv420p"
+    )
+
+
+def _encode_test_video(video_path, duration, size, color):
+    """Encode a solid-color video with a silent audio track to video_path.
+
+    Frames come straight from ffmpeg's lavfi color source, so no image is written to disk.
+
+    Returns:
+        str: video_path, or None if ffmpeg failed
+    """
+    ffmpeg_cmd = (*_test_video_cmd(duration, tuple(size), tuple(color)), video_path)
+    if run_ffmpeg_command(ffmpeg_cmd) is None:
+        return None
+    return video_path
 
 
 def create_test_video(duration=5, size=(1920, 1080), color=None):
-    """Create a simple colored background video with a silent audio track"""
+    """Create a simple colored background video with a silent audio track
+
+    Videos with an explicit color are encoded once per (duration, size, color); repeat
+    requests get a fresh copy of that encode. Each call returns a new file the caller owns.
+    """
+    with tempfile.NamedTemporaryFile(suffix='.mp4', delete=False) as video_file:
+        video_path = video_file.name
+
     # Generate random color if none provided
     if color is None:
         # Generate vibrant colors by ensuring at least one channel is high
@@ -22,69 +91,107 @@ def create_test_video(duration=5, size=(1920, 1080), color=None):
         if max_channel < 128:  # If all channels are too dark
             boost_channel = random.randint(0, 2)  # Choose a random channel to boost
             channels[boost_channel] = random.randint(128, 255)  # Make it brighter
-        color = tuple(channels)
-
-    # Create a colored image using PIL
-    image = Image.new('RGB', size, color)
-    with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as img_file:
-        image.save(img_file.name)
-
-        # First create video with silent audio
-        video_path = img_file.name.replace('.png', '.mp4')
-
-        # Create video with silent audio track
-        ffmpeg_cmd = [
-            "ffmpeg", "-y", "-loop", "1", "-i", img_file.name,
-            "-f", "lavfi", "-i", "anullsrc=r=48000:cl=stereo",
-            "-c:v", "libx264", "-t", str(duration),
-            "-c:a", "aac", "-b:a", "192k",
-            "-pix_fmt", "yuv420p", video_path
-        ]
-        result = run_ffmpeg_command(ffmpeg_cmd)
-        if result is None:
+        if _encode_test_video(video_path, duration, size, tuple(channels)) is None:
+            os.unlink(video_path)
             return None
-
-        # Clean up temporary files
-        os.unlink(img_file.name)
         return video_path
 
+    cache_key = (duration, tuple(size), tuple(color))
+    with _test_video_cache_lock:
+        cached_path = _test_video_cache.get(cache_key)
+        if cached_path is None or not os.path.exists(cached_path):
+            cache_dir = _test_video_cache_dir()
+            os.makedirs(cache_dir, exist_ok=True)  # In case something removed it
+            with tempfile.NamedTemporaryFile(
+                suffix='.mp4', dir=cache_dir, delete=False
+            ) as cached_file:
+                cached_path = cached_file.name
+            if _encode_test_video(cached_path, duration, size, cache_key[2]) is None:
+                os.unlink(cached_path)
+                os.unlink(video_path)
+                return None
+            _test_video_cache[cache_key] = cached_path
+
+    shutil.copyfile(cached_path, video_path)
+    return video_path
+
+
 def create_moving_rectangle_video(output_path: str, duration_seconds: int = 5):
     """Create a test video with a moving white rectangle on black background.
 
+    Frames are drawn into a single reused buffer, updating only the rectangle and
+    frame counter regions, and streamed as raw BGR into ffmpeg's libx264 encoder.
+
     Args:
         output_path: Path where the video should be saved
         duration_seconds: Duration of the video in seconds
+
+    Returns:
+        bool: True if ffmpeg encoded the video successfully
     """
     # Video settings
     fps = 30
     frame_width = 640
     frame_height = 480
-
-    # Create video writer
-    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-    out = cv2.VideoWriter(output_path, fourcc, fps, (frame_width, frame_height))
-
-    try:
-        # Create frames
-        for i in range(fps * duration_seconds):
-            # Create a black frame
-            frame = np.zeros((frame_height, frame_width, 3), dtype=np.uint8)
-
-            # Draw a moving white rectangle
-            x = int((i / (fps * duration_seconds)) * (frame_width - 100))
-            cv2.rectangle(frame, (x, 190), (x + 100, 290), (255, 255, 255), -1)
-
-            # Add frame number text
-            cv2.putText(
-                frame,
-                f'Frame {i}/{fps * duration_seconds}',
-                (20, 50),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                1,
-                (255, 255, 255),
-                2
-            )
-
-            out.write(frame)
-    finally:
-        out.release()
+    rect_size = 100
+    rect_top = 190
+    total_frames = fps * duration_seconds
+
+    # Frame counter text settings, and the band of rows it can cover
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    text_origin = (20, 50)
+    (_, text_height), baseline = cv2.getTextSize(
+        f'Frame {total_frames}/{total_frames}', font, 1, 2
+    )
+    text_rows = slice(
+        max(0, text_origin[1] - text_height - 2), text_origin[1] + baseline + 2
+    )
+
+    ffmpeg_cmd = (
+        *_rawvideo_encode_cmd(frame_width, frame_height, fps, FFMPEG_THREAD_COUNT),
+        output_path,
+    )
+
+    frame = np.zeros((frame_height, frame_width, 3), dtype=np.uint8)
+    rect_rows = slice(rect_top, rect_top + rect_size + 1)
+    prev_x = 0
+
+    with ffmpeg_thread_manager:
+        process = subprocess.Popen(
+            ffmpeg_cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        try:
+            for i in range(total_frames):
+                # Erase last frame's rectangle and counter, then draw this frame's
+                x = int((i / total_frames) * (frame_width - rect_size))
+                frame[rect_rows, prev_x:prev_x + rect_size + 1] = 0
+                frame[rect_rows, x:x + rect_size + 1] = 255
+                prev_x = x
+
+                frame[text_rows] = 0
+                cv2.putText(
+                    frame,
+                    f'Frame {i}/{total_frames}',
+                    text_origin,
+                    font,
+                    1,
+                    (255, 255, 255),
+                    2
+                )
+
+                process.stdin.write(frame.data)
+        except BrokenPipeError:
+            pass  # ffmpeg exited early; its error is reported below
+        finally:
+            with suppress(BrokenPipeError):
+                process.stdin.close()
+            stderr = process.stderr.read()
+            process.wait()
+
+    if process.returncode != 0:
+        Logger.print_error(f"ffmpeg failed with error: {stderr.decode('utf-8')}")
+        return False
+    return True
@@ -9,16 +9,21 @@ including:
 """
 
 # Standard library imports
+import hashlib
 import os
 import subprocess
 import sys
 import threading
 import time
 import traceback
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from functools import partial
+from functools import lru_cache, partial
+from itertools import pairwise
+from typing import NamedTuple
 
 # Third-party imports
+import numpy as np
 import torch
 import whisper
 
@@ -34,7 +39,141 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Monkey patch torch.load to always use weights_only=True
 torch.load = partial(torch.load, weights_only=True)
 
+# Serializes model loading
 whisper_lock = threading.Lock()
+# Each openai-whisper transcribe() installs KV-cache and cross-attention hooks on the
+# shared model, so overlapping calls would read and grow each other's caches; they take
+# turns on the cached model
+_openai_transcribe_lock = threading.Lock()
+# faster-whisper (CTranslate2) models can be called from several threads at once
+_faster_whisper_slots = threading.BoundedSemaphore(
+    int(os.environ.get("GANGLIA_WHISPER_CONCURRENCY", "2"))
+)
+
+# Recent transcriptions, most recently used last, keyed by audio version, text and model
+_TRANSCRIPTION_CACHE_SIZE = 32
+_transcription_cache: OrderedDict[tuple, dict] = OrderedDict()
+_transcription_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _whisper_device() -> str:
+    """Device to run Whisper on: the GPU when CUDA is available, else the CPU."""
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+class FasterWhisperModel:
+    """Adapter giving a faster-whisper (CTranslate2) model openai-whisper's transcribe API.
+
+    Quantized CTranslate2 models run several times faster than openai-whisper on the CPU
+    with a fraction of the memory. transcribe() takes the openai-whisper options used in
+    this module and returns a result dict of the same shape, so callers are unchanged.
+    """
+
+    def __init__(self, model_size: str, device: str):
+        from faster_whisper import WhisperModel
+
+        compute_type = "float16" if device == "cuda" else "int8"
+        self.model = WhisperModel(model_size, device=device, compute_type=compute_type)
+
+    def transcribe(self, audio_path: str, **options) -> dict:
+        """Transcribe audio, returning an openai-whisper style result dict.
+
+        Args:
+            audio_path: Path to the audio file, or its samples as 16 kHz float32
+            **options: openai-whisper transcribe options
+
+        Returns:
+            dict: Result with "text" and "segments", each segment carrying its "words"
+        """
+        # openai-whisper spells this option differently, and picks precision per call
+        if "logprob_threshold" in options:
+            options["log_prob_threshold"] = options.pop("logprob_threshold")
+        options.pop("fp16", None)
+
+        segments, _ = self.model.transcribe(audio_path, **options)
+        result_segments = [
+            {
+                "text": segment.text,
+                "start": segment.start,
+                "end": segment.end,
+                "words": [
+                    {"word": word.word, "start": word.start, "end": word.end}
+                    for word in segment.words or ()
+                ],
+            }
+            for segment in segments
+        ]
+        return {
+            "text": "".join(segment["text"] for segment in result_segments),
+            "segments": result_segments,
+        }
+
+
+def _load_whisper_model(model_size: str, device: str):
+    """Load a Whisper model with the backend chosen by GANGLIA_WHISPER_BACKEND.
+
+    Set GANGLIA_WHISPER_BACKEND=faster-whisper to use a quantized faster-whisper model;
+    the default, or a missing faster-whisper package, loads openai-whisper.
+
+    Args:
+        model_size: Size of model to load
+        device: Device to load the model on
+
+    Returns:
+        The loaded model
+    """
+    if os.environ.get("GANGLIA_WHISPER_BACKEND", "openai").lower() == "faster-whisper":
+        try:
+            return FasterWhisperModel(model_size, device)
+        except ImportError:
+            Logger.print_warning("faster-whisper is not installed, using openai-whisper")
+
+    model = whisper.load_model(
+        model_size,
+        device=device,
+        download_root=None,  # Use default download location
+        in_memory=True,  # Keep model in memory
+    )
+    if device == "cuda":
+        # Half-precision weights halve GPU memory and match fp16 transcription
+        model = model.half()
+    # Inference only; each transcribe call keeps its own decoder key/value cache
+    model = model.eval()
+    if os.getenv("GANGLIA_WHISPER_COMPILE", "false").lower() == "true":
+        _compile_encoder(model, device)
+    return model
+
+
+def _compile_encoder(model, device: str) -> None:
+    """Compile a Whisper model's encoder with torch.compile, warming it up once.
+
+    The encoder dominates Whisper's runtime and always sees a padded 30 second window,
+    so it compiles to a single static-shape graph. Compiling happens on the first call,
+    here on a silent window rather than in the first real transcription. If compiling
+    fails (e.g. no C++ toolchain), the eager encoder is kept.
+
+    Args:
+        model: The loaded openai-whisper model
+        device: Device the model is loaded on
+    """
+    eager_encoder = model.encoder
+    try:
+        # CUDA graphs cut kernel launch overhead on the GPU; they don't apply on the CPU
+        mode = "reduce-overhead" if device == "cuda" else "default"
+        model.encoder = torch.compile(eager_encoder, mode=mode, dynamic=False)
+        silent_mel = torch.zeros(
+            1,
+            model.dims.n_mels,
+            whisper.audio.N_FRAMES,
+            device=device,
+            dtype=torch.float16 if device == "cuda" else torch.float32,
+        )
+        with torch.inference_mode():
+            model.encoder(silent_mel)
+    except Exception as e:
+        Logger.print_warning(f"Could not compile the Whisper encoder, running it eagerly: {e}")
+        model.encoder = eager_encoder
 
 
 @dataclass
@@ -51,7 +190,7 @@ _whisper_state = WhisperModelState()
 
 
 def get_whisper_model(model_size: str = "small") -> whisper.Whisper:
-    """Get or load Whisper model, ensuring thread safety and clean state.
+    """Get or load Whisper model, ensuring thread safety.
 
     Args:
         model_size: Size of model to load if not already loaded
@@ -61,11 +200,6 @@ def get_whisper_model(model_size: str = "small") -> whisper.Whisper:
     """
     # Fast path - if model exists and is right size, return it
     if _whisper_state.model is not None and _whisper_state.size == model_size:
-        # Clear model state before returning
-        if hasattr(_whisper_state.model, "decoder") and hasattr(
-            _whisper_state.model.decoder, "_kv_cache"
-        ):
-            _whisper_state.model.decoder._kv_cache = {}
         return _whisper_state.model
 
     # If another thread is loading the model, wait for it
@@ -74,22 +208,12 @@ def get_whisper_model(model_size: str = "small") -> whisper.Whisper:
         _whisper_state.loading_event.wait()
         # After waiting, check if the model is what we need
         if _whisper_state.model is not None and _whisper_state.size == model_size:
-            # Clear model state before returning
-            if hasattr(_whisper_state.model, "decoder") and hasattr(
-                _whisper_state.model.decoder, "_kv_cache"
-            ):
-                _whisper_state.model.decoder._kv_cache = {}
             return _whisper_state.model
 
     # Slow path - need to load model
     with whisper_lock:
         # Double-check pattern
         if _whisper_state.model is not None and _whisper_state.size == model_size:
-            # Clear model state before returning
-            if hasattr(_whisper_state.model, "decoder") and hasattr(
-                _whisper_state.model.decoder, "_kv_cache"
-            ):
-                _whisper_state.model.decoder._kv_cache = {}
             return _whisper_state.model
 
         # Mark that we're loading the model and clear any previous event
@@ -98,18 +222,9 @@ def get_whisper_model(model_size: str = "small") -> whisper.Whisper:
 
         try:
             # Load new model
-            _whisper_state.model = whisper.load_model(
-                model_size,
-                device="cpu",  # Force CPU usage
-                download_root=None,  # Use default download location
-                in_memory=True,  # Keep model in memory
-            )
+            _whisper_state.model = _load_whisper_model(model_size, _whisper_device())
             _whisper_state.size = model_size
 
-            # Initialize empty cache
-            if hasattr(_whisper_state.model, "decoder"):
-                _whisper_state.model.decoder._kv_cache = {}
-
             return _whisper_state.model
         finally:
             # Always mark loading as complete and notify waiters
@@ -117,6 +232,68 @@ def get_whisper_model(model_size: str = "small") -> whisper.Whisper:
             _whisper_state.loading_event.set()
 
 
+def _read_duration_with_av(audio_path: str) -> float | None:
+    """Read an audio file's duration from its container header in-process with PyAV.
+
+    Args:
+        audio_path: Path to the audio file
+
+    Returns:
+        Optional[float]: Duration in seconds, or None if PyAV is not installed, could not
+            open the file, or the container does not record a duration
+    """
+    try:
+        import av
+    except ImportError:
+        return None
+
+    try:
+        with av.open(audio_path) as container:
+            if container.duration is None:
+                return None
+            return float(container.duration) / av.time_base
+    except (av.error.FFmpegError, OSError, ValueError):
+        return None
+
+
+# ffprobe invocation printing just the container duration in seconds
+_FFPROBE_DURATION_CMD = (
+    "ffprobe",
+    "-v",
+    "error",
+    "-show_entries",
+    "format=duration",
+    "-of",
+    "default=noprint_wrappers=1:nokey=1",
+)
+
+
+@lru_cache(maxsize=256)
+def _probe_duration(audio_path: str, mtime: float) -> float:
+    """Probe an audio file's duration in seconds, with PyAV or else ffprobe.
+
+    Cached per path and modification time, so each version of a file is probed once.
+    """
+    duration = _read_duration_with_av(audio_path)
+    if duration is not None:
+        return duration
+
+    # Only the ~10 byte duration is read; stderr is discarded rather than buffered
+    result = subprocess.run(
+        (*_FFPROBE_DURATION_CMD, audio_path),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    return float(result.stdout)
+
+
+def _get_duration(audio_path: str) -> float:
+    """Get an audio file's duration in seconds, probing it only if it changed."""
+    return _probe_duration(audio_path, os.path.getmtime(audio_path))
+
+
 @dataclass
 class WordTiming:
     """Represents a word with its start and end times from audio."""
@@ -126,26 +303,151 @@ class WordTiming:
     end: float
 
 
-def _transcribe_with_whisper(model, audio_path, text):
-    """Transcribe audio with Whisper model and return result."""
-    with whisper_lock:
-        return model.transcribe(
+class WordTimings(NamedTuple):
+    """Word timings from audio, stored as parallel arrays rather than one object per word."""
+
+    texts: list[str]
+    starts: np.ndarray
+    ends: np.ndarray
+
+    def as_list(self) -> list[WordTiming]:
+        """Rebuild the per-word WordTiming list for callers that still expect one."""
+        return [
+            WordTiming(text=text, start=start, end=end)
+            for text, start, end in zip(
+                self.texts, self.starts.tolist(), self.ends.tolist(), strict=True
+            )
+        ]
+
+
+def _has_word_timestamps(result) -> bool:
+    """Check whether a Whisper result has any word timestamps worth reusing."""
+    return bool(result) and any(segment.get("words") for segment in result.get("segments", ()))
+
+
+# Silence trimming: 20 ms analysis frames; speech is any frame within 40 dB of the
+# loudest one, kept with a little padding so word onsets and tails aren't clipped
+_TRIM_FRAME_SECONDS = 0.02
+_TRIM_THRESHOLD_RATIO = 0.01
+_TRIM_PADDING_SECONDS = 0.2
+
+
+def _trim_silence(audio_path: str) -> tuple[np.ndarray, float]:
+    """Load audio for Whisper with its leading and trailing silence cut off.
+
+    The encoder's cost grows with the audio length, and TTS output often starts and ends
+    with silence, so transcribing only the speech saves encoder work.
+
+    Args:
+        audio_path: Path to the audio file
+
+    Returns:
+        tuple: 16 kHz float32 samples of the speech, and the seconds trimmed from the start
+    """
+    sample_rate = whisper.audio.SAMPLE_RATE
+    samples = whisper.load_audio(audio_path)
+    frame_length = int(sample_rate * _TRIM_FRAME_SECONDS)
+    frame_count = len(samples) // frame_length
+    if frame_count == 0:
+        return samples, 0.0
+
+    frames = samples[: frame_count * frame_length].reshape(frame_count, frame_length)
+    peaks = np.abs(frames).max(axis=1)
+    if peaks.max() == 0:
+        return samples, 0.0  # All silence; leave it to Whisper's no-speech handling
+    loud = np.flatnonzero(peaks >= peaks.max() * _TRIM_THRESHOLD_RATIO)
+
+    padding = int(sample_rate * _TRIM_PADDING_SECONDS)
+    start = max(0, loud[0] * frame_length - padding)
+    end = min(len(samples), (loud[-1] + 1) * frame_length + padding)
+    return samples[start:end], start / sample_rate
+
+
+def _shift_result_times(result: dict, offset: float) -> None:
+    """Shift a Whisper result's segment and word times later by offset seconds."""
+    for segment in result.get("segments", ()):
+        for item in (segment, *segment.get("words", ())):
+            for key in ("start", "end"):
+                if key in item:
+                    item[key] += offset
+
+
+def _transcription_guard(model):
+    """Return the lock that limits concurrent transcriptions on a model.
+
+    faster-whisper models overlap up to GANGLIA_WHISPER_CONCURRENCY (default 2) calls;
+    openai-whisper models keep per-call state on the model itself and run one at a time.
+    """
+    if isinstance(model, FasterWhisperModel):
+        return _faster_whisper_slots
+    return _openai_transcribe_lock
+
+
+def _transcribe_with_whisper(model, audio_path, text, model_size):
+    """Transcribe audio with Whisper model and return result.
+
+    Results with word timestamps are cached per audio file version, text and model size,
+    so word alignment and caption generation for the same audio share one transcription.
+    Callers must not modify the returned result.
+
+    Set GANGLIA_WHISPER_TRIM_SILENCE=true to transcribe only the audio between the first
+    and last sounds; times in the result still refer to the untrimmed file.
+    """
+    try:
+        key = (
             audio_path,
+            os.path.getmtime(audio_path),
+            hashlib.blake2b(text.encode("utf-8")).digest(),
+            model_size,
+        )
+    except OSError:
+        key = None  # Can't tell file versions apart, so don't cache
+
+    if key is not None:
+        with _transcription_cache_lock:
+            result = _transcription_cache.get(key)
+            if result is not None:
+                _transcription_cache.move_to_end(key)
+                return result
+
+    audio, offset = audio_path, 0.0
+    if os.getenv("GANGLIA_WHISPER_TRIM_SILENCE", "false").lower() == "true":
+        audio, offset = _trim_silence(audio_path)
+
+    with _transcription_guard(model), torch.inference_mode():
+        result = model.transcribe(
+            audio,
             word_timestamps=True,
-            initial_prompt=text,
-            condition_on_previous_text=False,
-            language="en",
-            temperature=0.0,
-            no_speech_threshold=0.3,
-            logprob_threshold=-0.7,
-            compression_ratio_threshold=2.0,
-            best_of=5,
+            initial_prompt=text,  # Add text as initial prompt to guide transcription
+            condition_on_previous_text=False,  # Don't condition on previous text
+            language="en",  # Pass language in decode_options
+            temperature=0.0,  # Use greedy decoding for more consistent results
+            no_speech_threshold=0.3,  # Lower threshold since we know we have speech
+            logprob_threshold=-0.7,  # More strict about word confidence
+            compression_ratio_threshold=2.0,  # Help detect hallucinations
+            best_of=5,  # Try multiple candidates and take the best one
+            fp16=_whisper_device() == "cuda",  # Half precision only on the GPU
         )
+    if offset and result:
+        _shift_result_times(result, offset)
+
+    # Leave failed transcriptions uncached so that retries run Whisper again
+    if key is not None and _has_word_timestamps(result):
+        with _transcription_cache_lock:
+            _transcription_cache[key] = result
+            while len(_transcription_cache) > _TRANSCRIPTION_CACHE_SIZE:
+                _transcription_cache.popitem(last=False)
+    return result
 
 
-def _extract_word_timings(result):
+def _extract_word_timings(result) -> WordTimings:
     """Extract word timings from Whisper result."""
-    word_timings = []
+    # Size the arrays for every word up front, then trim off the malformed entries skipped
+    capacity = sum(len(segment.get("words", ())) for segment in result["segments"])
+    texts = []
+    # float64, so the times Whisper reported come back from the arrays unchanged
+    starts = np.empty(capacity, dtype=np.float64)
+    ends = np.empty(capacity, dtype=np.float64)
     for segment in result["segments"]:
         if "words" not in segment:
             continue
@@ -154,10 +456,10 @@ def _extract_word_timings(result):
                 continue
             if not all(k in word for k in ["word", "start", "end"]):
                 continue
-            word_timings.append(
-                WordTiming(text=word["word"].strip(), start=word["start"], end=word["end"])
-            )
-    return word_timings
+            starts[len(texts)] = word["start"]
+            ends[len(texts)] = word["end"]
+            texts.append(word["word"].strip())
+    return WordTimings(texts, starts[: len(texts)], ends[: len(texts)])
 
 
 def _should_retry(attempt, max_retries, error_msg):
@@ -192,11 +494,7 @@ def align_words_with_audio(
         try:
             model = get_whisper_model(model_size)
 
-            # Clear any existing cache
-            if hasattr(model, "decoder") and hasattr(model.decoder, "_kv_cache"):
-                model.decoder._kv_cache = {}
-
-            result = _transcribe_with_whisper(model, audio_path, text)
+            result = _transcribe_with_whisper(model, audio_path, text, model_size)
 
             if not result or "segments" not in result:
                 if _should_retry(attempt, max_retries, "No segments found in result"):
@@ -205,14 +503,14 @@ def align_words_with_audio(
 
             word_timings = _extract_word_timings(result)
 
-            if not word_timings:
+            if not word_timings.texts:
                 if _should_retry(attempt, max_retries, "No word timings found"):
                     continue
                 return create_evenly_distributed_timings(audio_path, text)
 
             if attempt > 0:
                 Logger.print_info(f"✓ Whisper alignment succeeded on attempt {attempt + 1}")
-            return word_timings
+            return word_timings.as_list()
 
         except Exception as e:
             Logger.print_error(f"Whisper alignment failed on attempt {attempt + 1}: {str(e)}")
@@ -240,36 +538,22 @@ def create_evenly_distributed_timings(audio_path: str, text: str) -> list[WordTi
     """
     try:
         # Get total audio duration using ffprobe
-        result = subprocess.run(
-            [
-                "ffprobe",
-                "-v",
-                "error",
-                "-show_entries",
-                "format=duration",
-                "-of",
-                "default=noprint_wrappers=1:nokey=1",
-                audio_path,
-            ],
-            check=True,
-            capture_output=True,
-        )
-        total_duration = float(result.stdout)
+        total_duration = _get_duration(audio_path)
 
         # Split text into words
         words = text.split()
         if not words:
             return []
 
-        # Calculate time per word
+        # Word boundaries, computed in one pass; word i spans boundaries i to i + 1
         time_per_word = total_duration / len(words)
+        boundaries = (np.arange(len(words) + 1, dtype=np.float64) * time_per_word).tolist()
 
         # Create evenly distributed timings
-        word_timings = []
-        for i, word in enumerate(words):
-            start_time = i * time_per_word
-            end_time = (i + 1) * time_per_word
-            word_timings.append(WordTiming(text=word, start=start_time, end=end_time))
+        word_timings = [
+            WordTiming(text=word, start=start_time, end=end_time)
+            for word, (start_time, end_time) in zip(words, pairwise(boundaries), strict=True)
+        ]
 
         Logger.print_info(
             f"Created fallback evenly distributed timings for {len(words)} words over "
@@ -305,24 +589,8 @@ def create_word_level_captions(
         def load_and_process_model():
             model = get_whisper_model(model_name)
 
-            # Clear any existing cache
-            if hasattr(model, "decoder") and hasattr(model.decoder, "_kv_cache"):
-                model.decoder._kv_cache = {}
-
-            # Process audio with lock
-            with whisper_lock:
-                result = model.transcribe(
-                    audio_file,
-                    word_timestamps=True,
-                    initial_prompt=text,  # Add text as initial prompt to guide transcription
-                    condition_on_previous_text=False,  # Don't condition on previous text
-                    language="en",  # Pass language in decode_options
-                    temperature=0.0,  # Use greedy decoding for more consistent results
-                    no_speech_threshold=0.3,  # Lower threshold since we know we have speech
-                    logprob_threshold=-0.7,  # More strict about word confidence
-                    compression_ratio_threshold=2.0,  # Help detect hallucinations
-                    best_of=5,  # Try multiple candidates and take the best one
-                )
+            # Process audio, reusing a transcription made for word alignment
+            result = _transcribe_with_whisper(model, audio_file, text, model_name)
             return model, result
 
         # Use exponential backoff for model loading and processing
@@ -405,36 +673,22 @@ def create_evenly_distributed_captions(
     thread_prefix = f"{thread_id} " if thread_id else ""
     try:
         # Get total audio duration using ffprobe
-        result = subprocess.run(
-            [
-                "ffprobe",
-                "-v",
-                "error",
-                "-show_entries",
-                "format=duration",
-                "-of",
-                "default=noprint_wrappers=1:nokey=1",
-                audio_file,
-            ],
-            check=True,
-            capture_output=True,
-        )
-        total_duration = float(result.stdout)
+        total_duration = _get_duration(audio_file)
 
         # Split text into words
         words = text.split()
         if not words:
             return []
 
-        # Calculate time per word
+        # Word boundaries, computed in one pass; word i spans boundaries i to i + 1
         time_per_word = total_duration / len(words)
+        boundaries = (np.arange(len(words) + 1, dtype=np.float64) * time_per_word).tolist()
 
         # Create evenly distributed captions
-        captions = []
-        for i, word in enumerate(words):
-            start_time = i * time_per_word
-            end_time = (i + 1) * time_per_word
-            captions.append(CaptionEntry(text=word, start_time=start_time, end_time=end_time))
+        captions = [
+            CaptionEntry(text=word, start_time=start_time, end_time=end_time)
+            for word, (start_time, end_time) in zip(words, pairwise(boundaries), strict=True)
+        ]
 
         Logger.print_info(
             f"{thread_prefix}Created evenly distributed captions for {len(words)} words over "
@@ -447,6 +701,33 @@ def create_evenly_distributed_captions(
         return []
 
 
+def get_audio_durations(audio_files: list[str], thread_id: str = None) -> dict[str, float]:
+    """Get the durations of several audio files in seconds.
+
+    Files are probed in-process with PyAV when it is installed, so a batch costs no
+    subprocess spawns; ffprobe is only run per file as a fallback.
+
+    Args:
+        audio_files: Paths to the audio files
+        thread_id: Optional thread ID for logging
+
+    Returns:
+        dict[str, float]: Duration in seconds for each path
+    """
+    thread_prefix = f"{thread_id} " if thread_id else ""
+    durations = {}
+    for audio_file in audio_files:
+        try:
+            durations[audio_file] = _get_duration(audio_file)
+        except subprocess.CalledProcessError as e:
+            Logger.print_error(f"{thread_prefix}FFprobe failed with exit code {e.returncode}")
+            raise
+        except (ValueError, OSError) as e:
+            Logger.print_error(f"{thread_prefix}Error getting audio duration: {str(e)}")
+            raise
+    return durations
+
+
 def get_audio_duration(audio_file: str, thread_id: str = None) -> float:
     """Get the duration of an audio file in seconds.
 
@@ -457,30 +738,44 @@ def get_audio_duration(audio_file: str, thread_id: str = None) -> float:
     Returns:
         float: Duration in seconds
     """
+    thread_prefix = f"{thread_id} " if thread_id else ""
+    Logger.print_info(f"{thread_prefix}Getting duration for audio file: {audio_file}")
+
+    duration = get_audio_durations([audio_file], thread_id)[audio_file]
+
+    Logger.print_info(f"{thread_prefix}Audio duration: {duration:.2f} seconds")
+    return duration
+
+
+def _preload_whisper_model(model_size: str) -> None:
+    """Load the Whisper model ahead of the first transcription, logging any failure."""
     try:
-        thread_prefix = f"{thread_id} " if thread_id else ""
-        Logger.print_info(f"{thread_prefix}Getting duration for audio file: {audio_file}")
-
-        # Use ffprobe to get duration
-        cmd = [
-            "ffprobe",
-            "-v",
-            "error",
-            "-show_entries",
-            "format=duration",
-            "-of",
-            "default=noprint_wrappers=1:nokey=1",
-            audio_file,
-        ]
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        duration = float(result.stdout.strip())
+        get_whisper_model(model_size)
+    except Exception as e:
+        # The first transcription will load the model (and report errors) itself
+        Logger.print_warning(f"Could not preload Whisper model '{model_size}': {e}")
+
+
+def _start_whisper_preload() -> threading.Thread | None:
+    """Start loading the Whisper model in the background if GANGLIA_PRELOAD_WHISPER is set.
+
+    Loading takes seconds, so a worker that starts it at import has the model ready by
+    its first transcription. Callers arriving mid-load wait on the shared loading event.
+    GANGLIA_WHISPER_SIZE picks the model size (default "small").
+
+    Returns:
+        Optional[threading.Thread]: The preload thread, or None if preloading is off
+    """
+    if os.getenv("GANGLIA_PRELOAD_WHISPER", "false").lower() != "true":
+        return None
+    thread = threading.Thread(
+        target=_preload_whisper_model,
+        args=(os.getenv("GANGLIA_WHISPER_SIZE", "small"),),
+        name="whisper-preload",
+        daemon=True,
+    )
+    thread.start()
+    return thread
 
-        Logger.print_info(f"{thread_prefix}Audio duration: {duration:.2f} seconds")
-        return duration
 
-    except subprocess.CalledProcessError as e:
-        Logger.print_error(f"{thread_prefix}FFprobe error: {e.stderr.decode()}")
-        raise
-    except (ValueError, OSError) as e:
-        Logger.print_error(f"{thread_prefix}Error getting audio duration: {str(e)}")
-        raise
+_start_whisper_preload()
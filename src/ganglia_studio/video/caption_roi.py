@@ -10,9 +10,71 @@ Note: Current implementation analyzes only the first frame.
 TODO: Expand to analyze multiple frames for true video content.
 """
 
+import cv2
 import numpy as np
 from moviepy.video.io.VideoFileClip import VideoFileClip
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba comes with openai-whisper; without it the kernels use NumPy
+    njit = None
+    prange = range
+
+# Frames are subsampled to about this many rows before the ROI position search
+ANALYSIS_HEIGHT = 480
+
+
+def _to_gray(frame: np.ndarray) -> np.ndarray:
+    """Convert an RGB frame to a 2D grayscale array with OpenCV's BT.601 weights.
+
+    OpenCV converts 8-bit frames to 8-bit gray, a quarter of the bytes of a float32 copy;
+    other dtypes are converted as float32, the widest type cvtColor accepts.
+    """
+    if frame.dtype not in (np.uint8, np.float32):
+        frame = frame.astype(np.float32)
+    return cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+
+
+def _block_std_numpy(gray, block_size, blocks_h, blocks_w):
+    """Return the standard deviation of each block's gray levels, as a 2D array.
+
+    Args:
+        gray: Grayscale frame covering exactly blocks_h by blocks_w blocks
+        block_size: Size of blocks to analyze
+        blocks_h: Number of whole blocks down the frame
+        blocks_w: Number of whole blocks across the frame
+    """
+    # View the frame as a grid of blocks and take each block's standard deviation at once
+    blocks = gray.reshape(blocks_h, block_size, blocks_w, block_size)
+    return blocks.std(axis=(1, 3), dtype=np.float32)
+
+
+def _block_std_loop(gray, block_size, blocks_h, blocks_w):
+    """Scalar equivalent of _block_std_numpy, for compiling with numba.
+
+    Accumulates the sum and sum of squares in one pass over each block.
+    """
+    count = block_size * block_size
+    activity_map = np.empty((blocks_h, blocks_w))
+    for i in prange(blocks_h):
+        for j in range(blocks_w):
+            total = 0.0
+            total_sq = 0.0
+            for dy in range(block_size):
+                for dx in range(block_size):
+                    value = float(gray[i * block_size + dy, j * block_size + dx])
+                    total += value
+                    total_sq += value * value
+            mean = total / count
+            activity_map[i, j] = np.sqrt(max(total_sq / count - mean * mean, 0.0))
+    return activity_map
+
+
+# Blocks are independent, so the compiled kernel spreads block rows across cores
+_block_std = (
+    njit(parallel=True, cache=True)(_block_std_loop) if njit is not None else _block_std_numpy
+)
+
 
 def calculate_activity_map(frame: np.ndarray, block_size: int = 32) -> np.ndarray:
     """Calculate activity level for each block in the frame.
@@ -28,27 +90,16 @@ def calculate_activity_map(frame: np.ndarray, block_size: int = 32) -> np.ndarra
         2D numpy array of activity levels
     """
     height, width = frame.shape[:2]
-    gray = np.mean(frame, axis=2)  # Convert to grayscale
 
     # Calculate number of blocks in each dimension
     blocks_h = height // block_size
     blocks_w = width // block_size
+    if blocks_h == 0 or blocks_w == 0:
+        return np.empty((blocks_h, blocks_w))
 
-    # Initialize activity map
-    activity_map = np.zeros((blocks_h, blocks_w))
-
-    # Calculate standard deviation for each block
-    for i in range(blocks_h):
-        for j in range(blocks_w):
-            h_start = i * block_size
-            h_end = (i + 1) * block_size
-            w_start = j * block_size
-            w_end = (j + 1) * block_size
-
-            block = gray[h_start:h_end, w_start:w_end]
-            activity_map[i, j] = np.std(block)
-
-    return activity_map
+    # Convert to grayscale, dropping the partial blocks at the right and bottom edges
+    gray = _to_gray(frame[: blocks_h * block_size, : blocks_w * block_size])
+    return _block_std(gray, block_size, blocks_h, blocks_w)
 
 
 def _crop_frame_with_buffer(frame: np.ndarray, buffer_ratio: float = 0.05):
@@ -77,6 +128,53 @@ def _calculate_roi_dimensions(cropped_frame, border_x, border_y):
     return min(roi_width, available_width), min(roi_height, available_height)
 
 
+def _search_windows_numpy(sat, tops, lefts, window_h, window_w):
+    """Return the (row, col) of the candidate window with the lowest summed activity.
+
+    Args:
+        sat: Zero-padded summed-area table of the activity map
+        tops: Top block row of each candidate row
+        lefts: Left block column of each candidate column
+        window_h: Window height in blocks
+        window_w: Window width in blocks
+    """
+    top = tops[:, None]
+    left = lefts[None, :]
+    bottom = top + window_h
+    right = left + window_w
+    window_sums = sat[bottom, right] - sat[top, right] - sat[bottom, left] + sat[top, left]
+
+    # argmin takes the first minimum in row-major order, i.e. the topmost, then leftmost
+    best_row, best_col = np.unravel_index(np.argmin(window_sums), window_sums.shape)
+    return best_row, best_col
+
+
+def _search_windows_loop(sat, tops, lefts, window_h, window_w):
+    """Scalar equivalent of _search_windows_numpy, for compiling with numba."""
+    best_sum = np.inf
+    best_row = 0
+    best_col = 0
+    for row in range(tops.shape[0]):
+        top = tops[row]
+        bottom = top + window_h
+        for col in range(lefts.shape[0]):
+            left = lefts[col]
+            right = left + window_w
+            window_sum = sat[bottom, right] - sat[top, right] - sat[bottom, left] + sat[top, left]
+            if window_sum < best_sum:
+                best_sum = window_sum
+                best_row = row
+                best_col = col
+    return best_row, best_col
+
+
+# The compiled loop skips the NumPy temporaries; cache=True keeps the compiled kernel
+# across processes so only the first run pays for compilation
+_search_windows = (
+    njit(cache=True)(_search_windows_loop) if njit is not None else _search_windows_numpy
+)
+
+
 def _locate_roi_position(
     cropped_frame,
     *,
@@ -90,7 +188,11 @@ def _locate_roi_position(
     activity_map = calculate_activity_map(cropped_frame, block_size)
     blocks_h = cropped_frame.shape[0] // block_size
     blocks_w = cropped_frame.shape[1] // block_size
-    is_uniform = np.std(activity_map) < 0.01
+    # Near-flat activity gives no reason to prefer any position, so center the ROI without
+    # searching; peak-to-peak is a single min/max pass, and std still catches lone outliers
+    is_uniform = activity_map.size > 0 and (
+        np.ptp(activity_map) < 0.5 or np.std(activity_map) < 0.01
+    )
 
     if is_uniform:
         return (
@@ -100,50 +202,101 @@ def _locate_roi_position(
 
     valid_y = cropped_frame.shape[0] - roi_height - 2 * border_y
     valid_x = cropped_frame.shape[1] - roi_width - 2 * border_x
-    min_activity = float("inf")
-    best_x = border_x
-    best_y = border_y
-
-    for y in range(border_y, valid_y + 1, block_size):
-        for x in range(border_x, valid_x + 1, block_size):
-            block_y = y // block_size
-            block_x = x // block_size
-            if (
-                block_y + (roi_height // block_size) > blocks_h
-                or block_x + (roi_width // block_size) > blocks_w
-            ):
-                continue
-
-            activity = np.mean(
-                activity_map[
-                    block_y : block_y + (roi_height // block_size),
-                    block_x : block_x + (roi_width // block_size),
-                ]
-            )
-            if activity < min_activity:
-                min_activity = activity
-                best_x = x
-                best_y = y
-
-    return best_x, best_y
+    window_h = roi_height // block_size
+    window_w = roi_width // block_size
+
+    # Candidate positions on the block grid whose ROI window fits inside the activity map
+    ys = np.arange(border_y, valid_y + 1, block_size)
+    xs = np.arange(border_x, valid_x + 1, block_size)
+    ys = ys[ys // block_size + window_h <= blocks_h]
+    xs = xs[xs // block_size + window_w <= blocks_w]
+    if not (ys.size and xs.size and window_h and window_w):
+        return border_x, border_y
+
+    # Every window is the same size, so the lowest sum is the lowest mean; a summed-area
+    # table gives each window's sum from four lookups
+    sat = np.pad(activity_map.cumsum(axis=0, dtype=np.float64).cumsum(axis=1), ((1, 0), (1, 0)))
+    best_row, best_col = _search_windows(
+        sat, ys // block_size, xs // block_size, window_h, window_w
+    )
+    return int(xs[best_col]), int(ys[best_row])
 
 
 def find_roi_in_frame(frame, block_size=32):
-    """Find optimal ROI in a single frame."""
+    """Find optimal ROI in a single frame.
+
+    The ROI is sized on the full frame, but its position is searched on a copy subsampled
+    to about ANALYSIS_HEIGHT rows; activity is measured per block, so the skipped pixels
+    add little beyond memory traffic.
+    """
     cropped_frame, buffer_x, buffer_y = _crop_frame_with_buffer(frame)
     border_x, border_y = _compute_borders(cropped_frame)
     roi_width, roi_height = _calculate_roi_dimensions(cropped_frame, border_x, border_y)
+
+    scale = max(1, min(frame.shape[:2]) // ANALYSIS_HEIGHT)
     best_x, best_y = _locate_roi_position(
-        cropped_frame,
-        border_x=border_x,
-        border_y=border_y,
-        roi_width=roi_width,
-        roi_height=roi_height,
-        block_size=block_size,
+        cropped_frame[::scale, ::scale],
+        border_x=border_x // scale,
+        border_y=border_y // scale,
+        roi_width=roi_width // scale,
+        roi_height=roi_height // scale,
+        block_size=max(1, block_size // scale),
     )
+
+    # Map the position back to full resolution, keeping the ROI inside the cropped frame
+    best_x = min(best_x * scale, cropped_frame.shape[1] - roi_width)
+    best_y = min(best_y * scale, cropped_frame.shape[0] - roi_height)
     return (best_x + buffer_x, best_y + buffer_y, roi_width, roi_height)
 
 
+def _read_first_frame_with_av(video_path: str) -> tuple[np.ndarray, float] | None:
+    """Decode a video's first frame and read its duration in-process with PyAV.
+
+    Args:
+        video_path: Path to video file
+
+    Returns:
+        Optional[tuple]: The first frame as (height, width, 3) uint8 and the duration in
+            seconds, or None if PyAV is not installed or could not read them
+    """
+    try:
+        import av
+    except ImportError:
+        return None
+
+    try:
+        with av.open(video_path) as container:
+            if not container.streams.video or container.duration is None:
+                return None
+            duration = container.duration / av.time_base
+            for frame in container.decode(container.streams.video[0]):
+                return frame.to_ndarray(format="rgb24"), duration
+    except (av.error.FFmpegError, OSError, ValueError):
+        return None
+    return None
+
+
+def read_first_frame_and_duration(video_path: str) -> tuple[np.ndarray, float]:
+    """Read a video's first frame and its duration, preferring PyAV over moviepy.
+
+    Args:
+        video_path: Path to video file
+
+    Returns:
+        tuple: The first frame as an RGB array and the duration in seconds
+
+    Raises:
+        Exception: If moviepy cannot read the video either
+    """
+    # PyAV decodes one frame without spawning moviepy's ffmpeg reader process
+    first_frame_and_duration = _read_first_frame_with_av(video_path)
+    if first_frame_and_duration is None:
+        # Closing on exit releases the reader process even if get_frame fails
+        with VideoFileClip(video_path, audio=False) as video:
+            first_frame_and_duration = video.get_frame(0), video.duration
+    return first_frame_and_duration
+
+
 def find_optimal_roi(video_path: str, block_size: int = 32) -> tuple[int, int, int, int] | None:
     """Find optimal ROI for captions in a video.
 
@@ -159,10 +312,7 @@ def find_optimal_roi(video_path: str, block_size: int = 32) -> tuple[int, int, i
         or None if analysis fails
     """
     try:
-        video = VideoFileClip(video_path)
-        first_frame = video.get_frame(0)
-        video.close()
-
+        first_frame, _duration = read_first_frame_and_duration(video_path)
         return find_roi_in_frame(frame=first_frame, block_size=block_size)
 
     except Exception as e:
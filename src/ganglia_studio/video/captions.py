@@ -5,25 +5,45 @@ import random
 import subprocess
 import tempfile
 import textwrap
+import threading
 import traceback
 import uuid
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from itertools import pairwise
 
 import numpy as np
 from ganglia_common.logger import Logger
 from moviepy.video.compositing.CompositeVideoClip import CompositeVideoClip
 from moviepy.video.io.VideoFileClip import VideoFileClip
-from moviepy.video.VideoClip import TextClip
+from moviepy.video.VideoClip import VideoClip
 from PIL import Image, ImageDraw, ImageFont
 
-from ganglia_studio.utils.ffmpeg_utils import run_ffmpeg_command
+from ganglia_studio.utils.ffmpeg_utils import (
+    FFMPEG_THREAD_COUNT,
+    ffmpeg_thread_manager,
+    run_ffmpeg_command,
+)
 
-from .caption_roi import find_roi_in_frame
-from .color_utils import get_vibrant_palette
+from .caption_roi import find_roi_in_frame, read_first_frame_and_duration
+from .color_utils import get_average_color, get_closest_palette_color
 
+try:
+    from numba import njit
+except ImportError:  # numba comes with openai-whisper; without it the layout runs as Python
+    njit = None
 
+
+@lru_cache(maxsize=1)
 def get_default_font() -> str:
-    """Get default font name."""
+    """Get default font name.
+
+    The font is looked up on first use rather than at import, and the path is cached.
+    """
     # Common paths for DejaVu Sans font
     font_paths = [
         "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",  # Linux/Docker
@@ -46,24 +66,44 @@ def get_default_font() -> str:
     )
 
 
-@dataclass
+@lru_cache(maxsize=128)
+def _load_font(font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font, parsing each path and size only once."""
+    return ImageFont.truetype(font_path, font_size)
+
+
+@lru_cache(maxsize=4096)
+def _measure_length(font_path: str, font_size: int, text: str) -> float:
+    """Advance width of text in a font; words repeat, so each is measured once."""
+    return _load_font(font_path, font_size).getlength(text)
+
+
+@lru_cache(maxsize=4096)
+def _measure_bbox(font_path: str, font_size: int, text: str) -> tuple[int, int, int, int]:
+    """Bounding box of text drawn at the origin in a font, measured once per text."""
+    draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+    return draw.textbbox((0, 0), text, font=_load_font(font_path, font_size))
+
+
+@dataclass(slots=True)
 class WordLayout:
     """Layout metadata for a caption word."""
 
     line_number: int = 0
     font_size: int = 0
     x_position: int = 0
+    y_position: int = 0
     width: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Word:
     """Represents a single word in a caption with timing and display properties."""
 
     text: str
     start_time: float
     end_time: float
-    font_name: str = get_default_font()
+    font_name: str = field(default_factory=get_default_font)
     layout: WordLayout = field(default_factory=WordLayout)
 
     @property
@@ -90,6 +130,14 @@ class Word:
     def x_position(self, value: int):
         self.layout.x_position = value
 
+    @property
+    def y_position(self) -> int:
+        return self.layout.y_position
+
+    @y_position.setter
+    def y_position(self, value: int):
+        self.layout.y_position = value
+
     @property
     def width(self) -> int:
         return self.layout.width
@@ -100,27 +148,100 @@ class Word:
 
     @classmethod
     def from_timed_word(
-        cls, text: str, start_time: float, end_time: float, font_name: str = get_default_font()
+        cls, text: str, start_time: float, end_time: float, font_name: str | None = None
     ) -> "Word":
         """Create a Word instance from pre-timed word (e.g. from Whisper alignment)."""
-        return cls(text=text, start_time=start_time, end_time=end_time, font_name=font_name)
+        return cls(
+            text=text,
+            start_time=start_time,
+            end_time=end_time,
+            font_name=font_name or get_default_font(),
+        )
 
     @classmethod
-    def from_text(cls, text: str, font_name: str = get_default_font()) -> "Word":
+    def from_text(cls, text: str, font_name: str | None = None) -> "Word":
         """Create a Word instance from text only, timing to be calculated later."""
-        return cls(text=text, start_time=0.0, end_time=0.0, font_name=font_name)
+        return cls(
+            text=text, start_time=0.0, end_time=0.0, font_name=font_name or get_default_font()
+        )
 
     def calculate_width(self, font_size):
         """Calculate exact text width using PIL's ImageFont."""
         try:
-            font = ImageFont.truetype(self.font_name, font_size)
+            self.width = _measure_length(self.font_name, font_size, self.text)
         except OSError:
             # Fallback to loading system font by name
-            font = ImageFont.load_default()
-        self.width = font.getlength(self.text)
+            self.width = ImageFont.load_default().getlength(self.text)
 
 
 @dataclass
+class WordArray:
+    """Caption words as parallel columns, so sizing and layout work on whole arrays."""
+
+    texts: list[str]
+    font_names: list[str]
+    start_times: np.ndarray
+    end_times: np.ndarray
+    font_sizes: np.ndarray
+    widths: np.ndarray
+    x_positions: np.ndarray
+    y_positions: np.ndarray
+    line_numbers: np.ndarray
+
+    @classmethod
+    def from_words(cls, words: list[Word]) -> "WordArray":
+        """Gather the words' timing and layout into columns."""
+        return cls(
+            texts=[word.text for word in words],
+            font_names=[word.font_name for word in words],
+            start_times=np.array([word.start_time for word in words], dtype=np.float64),
+            end_times=np.array([word.end_time for word in words], dtype=np.float64),
+            font_sizes=np.array([word.font_size for word in words], dtype=np.int64),
+            widths=np.array([word.width for word in words], dtype=np.float64),
+            x_positions=np.array([word.x_position for word in words], dtype=np.int64),
+            y_positions=np.array([word.y_position for word in words], dtype=np.int64),
+            line_numbers=np.array([word.line_number for word in words], dtype=np.int64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def to_words(self) -> list[Word]:
+        """Build a Word for each row, with its layout filled in."""
+        words = [
+            Word(text, start_time, end_time, font_name)
+            for text, font_name, start_time, end_time in zip(
+                self.texts,
+                self.font_names,
+                self.start_times.tolist(),
+                self.end_times.tolist(),
+                strict=True,
+            )
+        ]
+        self.update_layouts(words)
+        return words
+
+    def update_layouts(self, words: list[Word]) -> None:
+        """Write the layout columns back onto the words the array was built from."""
+        for word, font_size, width, x_position, y_position, line_number in zip(
+            words,
+            self.font_sizes.tolist(),
+            self.widths.tolist(),
+            self.x_positions.tolist(),
+            self.y_positions.tolist(),
+            self.line_numbers.tolist(),
+            strict=True,
+        ):
+            word.layout = WordLayout(
+                line_number=line_number,
+                font_size=font_size,
+                x_position=x_position,
+                y_position=y_position,
+                width=width,
+            )
+
+
+@dataclass(slots=True)
 class CaptionWindow:
     """Groups words into a display window with shared timing and font size."""
 
@@ -130,22 +251,6 @@ class CaptionWindow:
     font_size: int
 
 
-@dataclass
-class CaptionWindowState:
-    """Track mutable state while building caption windows."""
-
-    words: list[Word]
-    cursor_x: int = 0
-    cursor_y: int = 0
-    line_number: int = 0
-
-    def reset(self):
-        self.words = []
-        self.cursor_x = 0
-        self.cursor_y = 0
-        self.line_number = 0
-
-
 @dataclass
 class WordClipGeometry:
     """Precomputed geometry for rendering word clips."""
@@ -155,14 +260,12 @@ class WordClipGeometry:
     base_position: tuple[int, int]
     outer_shadow_position: tuple[int, int]
     inner_shadow_position: tuple[int, int]
-    new_cursor: tuple[int, int]
 
 
 @dataclass
 class DynamicCaptionContext:
     """Metadata collected from the source video for dynamic captions."""
 
-    video: VideoFileClip
     duration: float
     first_frame: np.ndarray
     roi: tuple[int, int, int, int]
@@ -171,6 +274,8 @@ class DynamicCaptionContext:
 class CaptionEntry:
     """Represents a complete caption with text and timing information."""
 
+    __slots__ = ("text", "start_time", "end_time", "timed_words")
+
     def __init__(
         self,
         text: str,
@@ -185,13 +290,14 @@ class CaptionEntry:
 
 
 def split_into_words(
-    caption: CaptionEntry, words_per_second: float = 2.0, font_name: str = get_default_font()
+    caption: CaptionEntry, words_per_second: float = 2.0, font_name: str | None = None
 ) -> list[Word]:
     """Split caption text into words with timing.
 
     If caption.timed_words is provided, uses those timings.
     Otherwise, calculates timing based on words_per_second.
     """
+    font_name = font_name or get_default_font()
     if caption.timed_words:
         # Use pre-calculated word timings (e.g. from Whisper)
         return [
@@ -236,79 +342,136 @@ def assign_word_sizes(words: list[Word], min_font_size: int, max_font_ratio: flo
         min_font_size: Minimum font size in pixels
         max_font_ratio: Ratio to determine max font size (max = min * ratio)
     """
+    word_array = WordArray.from_words(words)
+    _assign_word_array_sizes(word_array, min_font_size, max_font_ratio)
+    word_array.update_layouts(words)
+
+
+def _assign_word_array_sizes(
+    word_array: WordArray, min_font_size: int, max_font_ratio: float
+) -> None:
+    """Fill the font size and width columns, as described in assign_word_sizes."""
+    word_count = len(word_array)
     max_font_size = int(min_font_size * max_font_ratio)
     size_range = max_font_size - min_font_size
 
     # Calculate number of distinct sizes we want (about 1 size per 2-3 words)
-    num_sizes = max(5, len(words) // 2)
+    num_sizes = max(5, word_count // 2)
     step = size_range / (num_sizes - 1)
 
     # Create a list of available sizes
-    available_sizes = [int(min_font_size + (i * step)) for i in range(num_sizes)]
-    if available_sizes[-1] > max_font_size:
-        available_sizes[-1] = max_font_size
-
-    # First, ensure each size is used at least once (if we have enough words)
-    shuffled_words = list(words)
-    random.shuffle(shuffled_words)
-
-    for i, word in enumerate(shuffled_words):
-        if i < len(available_sizes):
-            # Assign one of each size first
-            word.font_size = available_sizes[i]
+    available_sizes = np.minimum(
+        (min_font_size + np.arange(num_sizes) * step).astype(np.int64), max_font_size
+    ).tolist()
+
+    # Draw every word's size up front: each size once (if we have enough words), then
+    # random sizes for the rest, shuffled so the guaranteed sizes land on random words
+    assigned_sizes = available_sizes[:word_count] + random.choices(
+        available_sizes, k=max(0, word_count - num_sizes)
+    )
+    random.shuffle(assigned_sizes)
+    word_array.font_sizes[:] = assigned_sizes
+
+    # Sizes are ints in a narrow range, so many words share one; measure them per size
+    # with a single font lookup
+    indices_by_size = defaultdict(list)
+    for index, size_key in enumerate(zip(word_array.font_names, assigned_sizes, strict=True)):
+        indices_by_size[size_key].append(index)
+    for (font_name, font_size), indices in indices_by_size.items():
+        word_array.widths[indices] = _measure_widths(
+            [word_array.texts[index] for index in indices], font_name, font_size
+        )
+
+
+def _measure_widths(texts: list[str], font_name: str, font_size: int) -> list[float]:
+    """Return the rendered widths of texts sharing one font and size."""
+    try:
+        font = _load_font(font_name, font_size)
+    except OSError:
+        # Fallback to loading system font by name
+        font = ImageFont.load_default()
+    widths = {}
+    for text in texts:
+        if text not in widths:
+            widths[text] = font.getlength(text)
+    return [widths[text] for text in texts]
+
+
+def _layout_words_loop(widths, font_sizes, roi_width, roi_height):
+    """Lay out words left to right and top to bottom, starting a window when one fills.
+
+    Each word follows the last on its line, a buffer apart; a word that would pass 90% of
+    the region's width starts a new line, and one whose line would not fit below starts a
+    new window. Only numbers are used so that numba can compile it.
+
+    Args:
+        widths: Rendered width of each word
+        font_sizes: Font size of each word
+        roi_width: Width of the caption region
+        roi_height: Height of the caption region
+
+    Returns:
+        tuple: Arrays of each word's x and y position within its window, line number and
+            window index
+    """
+    count = len(widths)
+    x_positions = np.empty(count, dtype=np.int64)
+    y_positions = np.empty(count, dtype=np.int64)
+    line_numbers = np.empty(count, dtype=np.int64)
+    window_ids = np.empty(count, dtype=np.int64)
+    effective_width = int(roi_width * 0.9)  # Wrap before the edge
+
+    window_id = 0
+    window_empty = True
+    cursor_x = 0
+    cursor_y = 0
+    i = 0
+    while i < count:
+        width = widths[i]
+        font_size = font_sizes[i]
+        # Line height and buffers scale with the font size: 1.2 and 0.4 times it, rounded
+        # down, in integer arithmetic so no float rounding creeps in at any size
+        line_height = font_size * 12 // 10
+        buffer_pixels = max(font_size * 4 // 10, 8)
+        line_advance = line_height + max(line_height * 4 // 10, 8)
+
+        if window_empty:
+            # First word in window
+            word_x = 0
+            word_y = cursor_y
+            cursor_x = int(width + buffer_pixels)
+        elif cursor_x + width + buffer_pixels <= effective_width:
+            # Word fits on current line
+            word_x = cursor_x + buffer_pixels
+            word_y = cursor_y
+            cursor_x = int(word_x + width)
+        elif cursor_y + line_height + line_advance <= roi_height:
+            # Start new line
+            word_x = 0
+            word_y = cursor_y + line_advance
+            cursor_x = int(width + buffer_pixels)
+            cursor_y = word_y
         else:
-            # Then randomly assign remaining words
-            word.font_size = random.choice(available_sizes)
-        word.calculate_width(word.font_size)
+            # No room for new line - place the word again in a new window
+            window_id += 1
+            window_empty = True
+            cursor_x = 0
+            cursor_y = 0
+            continue
 
+        # Line number from the y position, spacing lines by their unrounded height plus
+        # buffer: word_y / (font_size * 6 / 5 + buffer), exactly, in integers
+        x_positions[i] = word_x
+        y_positions[i] = word_y
+        line_numbers[i] = 5 * word_y // (6 * font_size + 5 * max(font_size * 48 // 100, 8))
+        window_ids[i] = window_id
+        window_empty = False
+        i += 1
+    return x_positions, y_positions, line_numbers, window_ids
 
-def calculate_word_position(
-    word: Word,
-    cursor_x: int,
-    cursor_y: int,
-    *,
-    line_height: int,
-    roi_width: int,
-    roi_height: int,
-    previous_word: Word | None = None,
-) -> tuple[int, int, int, int, bool]:
-    """Calculate position for a word in the caption window."""
-    # Calculate buffer pixels based on font size
-    buffer_pixels = max(int(word.font_size * 0.4), 8)  # Reduced from 0.5 to 0.4
-
-    # Calculate word position
-    if previous_word is None:
-        # First word in window
-        word_x = 0
-        word_y = cursor_y
-        new_cursor_x = int(word.width + buffer_pixels)
-        new_cursor_y = cursor_y
-        return new_cursor_x, new_cursor_y, word_x, word_y, False
-
-    # Check if word fits on current line
-    # Use 90% of ROI width to force wrapping sooner
-    effective_width = int(roi_width * 0.9)
-    if cursor_x + word.width + buffer_pixels <= effective_width:
-        # Word fits on current line
-        word_x = int(cursor_x + buffer_pixels)  # Add buffer after previous word
-        word_y = cursor_y
-        new_cursor_x = int(word_x + word.width)
-        new_cursor_y = int(cursor_y)
-        return new_cursor_x, new_cursor_y, word_x, word_y, False
-
-    # Word doesn't fit - check if we have room for a new line
-    # Add extra vertical buffer between lines
-    vertical_buffer = max(int(line_height * 0.4), 8)  # Reduced from 0.5 to 0.4
-    if cursor_y + (2 * line_height) + vertical_buffer <= roi_height:
-        # Start new line
-        word_x = 0
-        word_y = int(cursor_y + line_height + vertical_buffer)
-        new_cursor_x = int(word.width + buffer_pixels)
-        new_cursor_y = word_y
-        return new_cursor_x, new_cursor_y, word_x, word_y, False
-
-    # No room for new line - need new window
-    return 0, 0, 0, 0, True
+
+# Layout walks every caption word; compiled, the loop avoids per-word interpreter overhead
+_layout_words = njit(cache=True)(_layout_words_loop) if njit is not None else _layout_words_loop
 
 
 def create_caption_windows(
@@ -319,64 +482,35 @@ def create_caption_windows(
     roi_height: int,
 ) -> list[CaptionWindow]:
     """Group words into caption windows with appropriate line breaks."""
-    # First, assign random sizes to all words
-    assign_word_sizes(words, min_font_size, max_font_ratio)
-
-    windows = []
-    window_state = CaptionWindowState([])
-
-    i = 0
-    while i < len(words):
-        word = words[i]
-        previous_word = window_state.words[-1] if window_state.words else None
-
-        new_cursor_x, new_cursor_y, word_x, word_y, needs_new_window = calculate_word_position(
-            word=word,
-            cursor_x=int(window_state.cursor_x),
-            cursor_y=int(window_state.cursor_y),
-            line_height=int(word.font_size * 1.2),
-            roi_width=int(roi_width),
-            roi_height=int(roi_height),
-            previous_word=previous_word,
-        )
-
-        if needs_new_window:
-            _finalize_caption_window(window_state, windows, min_font_size)
-            continue
-
-        # Update word position and line number
-        word.x_position = word_x
-        # Calculate line number based on y position, accounting for line height and vertical buffer
-        vertical_buffer = max(
-            int(word.font_size * 1.2 * 0.4), 8
-        )  # Same as in calculate_word_position
-        line_spacing = word.font_size * 1.2 + vertical_buffer
-        word.line_number = int(word_y / line_spacing)
-        window_state.words.append(word)
-        window_state.cursor_x = new_cursor_x
-        window_state.cursor_y = new_cursor_y
-        if window_state.cursor_y > window_state.line_number * line_spacing:
-            window_state.line_number += 1
-        i += 1
-
-    # Add any remaining words as the last window
-    _finalize_caption_window(window_state, windows, min_font_size)
-
-    return windows
+    if not words:
+        return []
+
+    # Size and lay out the words as columns, then write each word's layout back once
+    word_array = WordArray.from_words(words)
+    _assign_word_array_sizes(word_array, min_font_size, max_font_ratio)
+    (
+        word_array.x_positions,
+        word_array.y_positions,
+        word_array.line_numbers,
+        window_ids,
+    ) = _layout_words(word_array.widths, word_array.font_sizes, int(roi_width), int(roi_height))
+    word_array.update_layouts(words)
+
+    # Window ids never decrease, so each window starts where the id changes
+    bounds = [0, *(np.flatnonzero(np.diff(window_ids)) + 1).tolist(), len(words)]
+    return [
+        _make_caption_window(words[start:end], min_font_size) for start, end in pairwise(bounds)
+    ]
 
 
-def _finalize_caption_window(state, windows, min_font_size):
-    """Finalize current window if it contains words."""
-    if not state.words:
-        return
-    window = CaptionWindow(
-        words=state.words,
-        start_time=state.words[0].start_time,
-        end_time=state.words[-1].end_time,
+def _make_caption_window(words: list[Word], min_font_size: int) -> CaptionWindow:
+    """Create a caption window spanning its words' display times."""
+    return CaptionWindow(
+        words=words,
+        start_time=words[0].start_time,
+        end_time=words[-1].end_time,
         font_size=min_font_size,
     )
-    windows.append(window)
-    state.reset()
 
 
 def calculate_word_positions(
@@ -388,48 +522,35 @@ def calculate_word_positions(
     Calculate the (x, y) positions for each word in a caption window.
     Returns a list of (x, y) coordinates in the same order as window.words.
     """
-    positions = []
+    font_sizes = np.fromiter((w.font_size for w in window.words), dtype=np.int64)
+    line_numbers = np.fromiter((w.line_number for w in window.words), dtype=np.int64)
+    x_positions = np.fromiter((w.x_position for w in window.words), dtype=np.int64)
+
     line_height = int(window.font_size * 1.2)  # Add some spacing between lines
-    total_lines = max(w.line_number for w in window.words) + 1
+    total_lines = int(line_numbers.max()) + 1
     window_height = total_lines * line_height
     window_top = video_height - margin - window_height  # Start position of window
 
-    # Calculate positions for each word
-    for word in window.words:
-        # Calculate y position
-        y_position = window_top + (word.line_number * line_height)  # Lines flow downward
-
-        # Adjust y position for larger font sizes to align baselines
-        if word.font_size > window.font_size:
-            baseline_offset = word.font_size - window.font_size
-            y_position -= baseline_offset
-
-        # X position is already calculated in try_fit_words and stored in word.x_position
-        # Just add the left margin
-        x_position = margin + word.x_position
+    # Lines flow downward; words larger than the window's font size are raised by the
+    # difference to align baselines
+    baseline_offsets = np.maximum(font_sizes - window.font_size, 0)
+    y_positions = window_top + line_numbers * line_height - baseline_offsets
 
-        positions.append((x_position, y_position))
-
-    return positions
+    # X positions were calculated when laying out the window; just add the left margin
+    return list(zip((margin + x_positions).tolist(), y_positions.tolist(), strict=True))
 
 
 def calculate_text_size(text, font_size, font_path=None):
     """Calculate the size of text when rendered with the given font size."""
-    # Create a PIL Image to measure text size
-    img = Image.new("RGB", (1, 1))
-    draw = ImageDraw.Draw(img)
-
-    # Load font
+    # Get text size, falling back to the default font if the given one can't be loaded
+    bbox = None
     if font_path and os.path.exists(font_path):
         try:
-            font = ImageFont.truetype(font_path, font_size)
+            bbox = _measure_bbox(font_path, font_size, text)
         except Exception:
-            font = ImageFont.truetype(get_default_font(), font_size)
-    else:
-        font = ImageFont.truetype(get_default_font(), font_size)
-
-    # Get text size
-    bbox = draw.textbbox((0, 0), text, font=font)
+            bbox = None
+    if bbox is None:
+        bbox = _measure_bbox(get_default_font(), font_size, text)
     width = bbox[2] - bbox[0]
     height = bbox[3] - bbox[1]
     text_width = width
@@ -440,68 +561,109 @@ def calculate_text_size(text, font_size, font_path=None):
     return width + buffer_pixels * 2, height + buffer_pixels * 2, text_width, text_height
 
 
-def _create_text_clip(
+# Shadows under each word, drawn farthest first: (position attribute, opacity)
+_SHADOW_LAYERS = (("outer_shadow_position", 0.4), ("inner_shadow_position", 0.7))
+
+
+def _text_origin(
+    font: ImageFont.FreeTypeFont,
+    text: str,
+    *,
+    clip_dimensions: tuple[int, int],
+    margins: tuple[int, int, int, int],
+    border_thickness: int,
+) -> tuple[float, float]:
+    """Left-baseline point that centers text in a clip, as MoviePy's TextClip places it."""
+    left, top, right, bottom = font.getbbox(text, stroke_width=border_thickness, anchor="ls")
+    ascent, _ = font.getmetrics()
+    text_width = int(right - left)
+    text_height = int(bottom - top)
+    x = (clip_dimensions[0] - text_width) / 2 + margins[0] + border_thickness
+    y = (clip_dimensions[1] - text_height) / 2 + ascent + margins[1] + border_thickness
+    return x, y
+
+
+def render_word_rgba(
     word: Word,
+    geometry: WordClipGeometry,
     *,
-    position: tuple[int, int],
     text_color: tuple[int, int, int],
     stroke_color: tuple[int, int, int],
-    clip_dimensions: tuple[int, int],
-    margins: tuple[int, int, int, int],
     border_thickness: int,
-    duration: float,
-    start_time: float,
-) -> TextClip:
-    """Create a text clip with the given parameters."""
-    return (
-        TextClip(
-            text=word.text,
-            font=word.font_name,
-            method="caption",
-            color=text_color,
-            stroke_color=stroke_color,
-            stroke_width=border_thickness,
-            font_size=word.font_size,
-            size=clip_dimensions,
-            margin=margins,
-            text_align="left",
-            duration=duration,
-        )
-        .with_position(position)
-        .with_start(start_time)
+) -> tuple[np.ndarray, tuple[int, int]]:
+    """Rasterize a word and its two drop shadows into one RGBA image.
+
+    The glyphs are drawn once with PIL, so the compositor blends a single image per
+    word instead of three text clips.
+
+    Args:
+        word: Word to render, with its font size set
+        geometry: Clip dimensions, margins and the text and shadow positions
+        text_color: Fill color of the text
+        stroke_color: Color of the text outline
+        border_thickness: Width of the text outline in pixels
+
+    Returns:
+        tuple: The (height, width, 4) uint8 image, and its top-left position in the video
+    """
+    margin_left, margin_top, margin_right, margin_bottom = geometry.margins
+    layer_size = (
+        geometry.clip_dimensions[0] + margin_left + margin_right,
+        geometry.clip_dimensions[1] + margin_top + margin_bottom,
+    )
+    positions = [geometry.base_position] + [
+        getattr(geometry, attribute) for attribute, _ in _SHADOW_LAYERS
+    ]
+    left = min(x for x, _ in positions)
+    top = min(y for _, y in positions)
+    image = Image.new(
+        "RGBA",
+        (
+            max(x for x, _ in positions) - left + layer_size[0],
+            max(y for _, y in positions) - top + layer_size[1],
+        ),
+        (0, 0, 0, 0),
     )
 
+    font = _load_font(word.font_name, word.font_size)
+    origin = _text_origin(
+        font,
+        word.text,
+        clip_dimensions=geometry.clip_dimensions,
+        margins=geometry.margins,
+        border_thickness=border_thickness,
+    )
 
-def _create_shadow_clip(
-    word: Word,
-    *,
-    position: tuple[int, int],
-    clip_dimensions: tuple[int, int],
-    margins: tuple[int, int, int, int],
-    border_thickness: int,
-    duration: float,
-    start_time: float,
-    opacity: float,
-) -> TextClip:
-    """Create a shadow clip with the given parameters."""
-    return (
-        TextClip(
-            text=word.text,
-            font=word.font_name,
-            method="caption",
-            color=(0, 0, 0),  # Black shadow
-            stroke_color=(0, 0, 0),
-            stroke_width=border_thickness,
-            font_size=word.font_size,
-            size=clip_dimensions,
-            margin=margins,
-            text_align="left",
-            duration=duration,
-        )
-        .with_position(position)
-        .with_start(start_time)
-        .with_opacity(opacity)
+    # Black shadows share one coverage mask, scaled by each shadow's opacity
+    coverage = Image.new("L", layer_size, 0)
+    ImageDraw.Draw(coverage).text(
+        origin,
+        word.text,
+        fill=255,
+        font=font,
+        stroke_width=border_thickness,
+        stroke_fill=255,
+        anchor="ls",
+    )
+    for attribute, opacity in _SHADOW_LAYERS:
+        shadow = Image.new("RGBA", layer_size, (0, 0, 0, 0))
+        shadow.putalpha(coverage.point(lambda value, opacity=opacity: int(value * opacity)))
+        x, y = getattr(geometry, attribute)
+        image.alpha_composite(shadow, (x - left, y - top))
+
+    text_layer = Image.new("RGBA", layer_size, (0, 0, 0, 0))
+    ImageDraw.Draw(text_layer).text(
+        origin,
+        word.text,
+        fill=text_color,
+        font=font,
+        stroke_width=border_thickness,
+        stroke_fill=stroke_color,
+        anchor="ls",
     )
+    x, y = geometry.base_position
+    image.alpha_composite(text_layer, (x - left, y - top))
+    return np.array(image), (left, top)
 
 
 def _calculate_clip_dimensions(
@@ -523,32 +685,22 @@ def _calculate_clip_dimensions(
 
 def _calculate_word_clip_geometry(
     word: Word,
-    cursor_pos: tuple[int, int],
-    previous_word: Word | None,
     *,
     roi_x: int,
     roi_y: int,
-    roi_width: int,
-    roi_height: int,
     shadow_offset: tuple[int, int],
     max_font_size: int,
     border_thickness: int,
 ) -> WordClipGeometry:
-    """Calculate positions and dimensions for word rendering."""
+    """Calculate positions and dimensions for word rendering.
+
+    The word's position within its window comes from create_caption_windows.
+    """
     clip_dimensions, margins = _calculate_clip_dimensions(word, border_thickness, shadow_offset)
     baseline_offset = max_font_size - word.font_size
-    cursor_result = calculate_word_position(
-        word=word,
-        cursor_x=int(cursor_pos[0]),
-        cursor_y=int(cursor_pos[1]),
-        line_height=int(word.font_size * 1.2),
-        roi_width=int(roi_width),
-        roi_height=int(roi_height),
-        previous_word=previous_word,
-    )
     margin_left = margins[0]
-    base_x = int(roi_x + cursor_result[2] - margin_left)
-    base_y = int(roi_y + cursor_result[3] + baseline_offset)
+    base_x = int(roi_x + word.x_position - margin_left)
+    base_y = int(roi_y + word.y_position + baseline_offset)
     outer_shadow_position = (
         base_x + int(shadow_offset[0] * 1.5),
         base_y + int(shadow_offset[1] * 1.5),
@@ -560,74 +712,85 @@ def _calculate_word_clip_geometry(
         base_position=(base_x, base_y),
         outer_shadow_position=outer_shadow_position,
         inner_shadow_position=inner_shadow_position,
-        new_cursor=(cursor_result[0], cursor_result[1]),
     )
 
 
-def _create_word_clips(
-    word: Word,
+def render_window_rgba(
     window: CaptionWindow,
     *,
     roi_x: int,
     roi_y: int,
-    roi_width: int,
-    roi_height: int,
     text_color: tuple[int, int, int],
     stroke_color: tuple[int, int, int],
     border_thickness: int,
     shadow_offset: tuple[int, int],
     max_font_size: int,
-    cursor_pos: tuple[int, int],
-    previous_word: Word | None,
-) -> tuple[list[TextClip], tuple[int, int]]:
-    """Create all clips (text and shadows) for a single word."""
-    geometry = _calculate_word_clip_geometry(
-        word,
-        cursor_pos,
-        previous_word,
-        roi_x=roi_x,
-        roi_y=roi_y,
-        roi_width=roi_width,
-        roi_height=roi_height,
-        shadow_offset=shadow_offset,
-        max_font_size=max_font_size,
-        border_thickness=border_thickness,
-    )
+) -> list[tuple[np.ndarray, tuple[int, int]]]:
+    """Rasterize each word of a caption window into an image cropped to that word.
 
-    # Create outer shadow
-    return [
-        _create_shadow_clip(
-            word=word,
-            position=geometry.outer_shadow_position,
-            clip_dimensions=geometry.clip_dimensions,
-            margins=geometry.margins,
-            border_thickness=border_thickness,
-            duration=window.end_time - word.start_time,
-            start_time=word.start_time,
-            opacity=0.4,
-        ),
-        _create_shadow_clip(
-            word=word,
-            position=geometry.inner_shadow_position,
-            clip_dimensions=geometry.clip_dimensions,
-            margins=geometry.margins,
-            border_thickness=border_thickness,
-            duration=window.end_time - word.start_time,
-            start_time=word.start_time,
-            opacity=0.7,
-        ),
-        _create_text_clip(
-            word=word,
-            position=geometry.base_position,
-            text_color=text_color,
-            stroke_color=stroke_color,
-            clip_dimensions=geometry.clip_dimensions,
-            margins=geometry.margins,
+    Returns:
+        list: For each word, the (height, width, 4) uint8 image of the word and its
+            shadows, and its top-left position in the video
+    """
+    rendered = []
+    for word in window.words:
+        geometry = _calculate_word_clip_geometry(
+            word,
+            roi_x=roi_x,
+            roi_y=roi_y,
+            shadow_offset=shadow_offset,
+            max_font_size=max_font_size,
             border_thickness=border_thickness,
-            duration=window.end_time - word.start_time,
-            start_time=word.start_time,
-        ),
-    ], geometry.new_cursor
+        )
+        rendered.append(
+            render_word_rgba(
+                word,
+                geometry,
+                text_color=text_color,
+                stroke_color=stroke_color,
+                border_thickness=border_thickness,
+            )
+        )
+    return rendered
+
+
+class _WindowCanvas:
+    """A caption window's image, built up by pasting each word's image onto one canvas.
+
+    Only the canvas and the frame of the latest stage requested are kept, so memory stays
+    at one window's area however many words the window holds.
+    """
+
+    def __init__(self, rendered: list[tuple[np.ndarray, tuple[int, int]]]):
+        self.position = (
+            min(x for _, (x, _) in rendered),
+            min(y for _, (_, y) in rendered),
+        )
+        self._size = (
+            max(x + rgba.shape[1] for rgba, (x, _) in rendered) - self.position[0],
+            max(y + rgba.shape[0] for rgba, (_, y) in rendered) - self.position[1],
+        )
+        self._rendered = rendered
+        self._canvas = Image.new("RGBA", self._size, (0, 0, 0, 0))
+        self._pasted = 0
+        self._stage = None
+        self._lock = threading.Lock()
+
+    def stage(self, index: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return the window's RGB frame and mask once words up to index are shown."""
+        with self._lock:
+            if self._stage is None or self._stage[0] != index:
+                if self._pasted > index + 1:
+                    # Stages are normally asked for in order; start over if one goes back
+                    self._canvas = Image.new("RGBA", self._size, (0, 0, 0, 0))
+                    self._pasted = 0
+                left, top = self.position
+                for rgba, (x, y) in self._rendered[self._pasted : index + 1]:
+                    self._canvas.alpha_composite(Image.fromarray(rgba), (x - left, y - top))
+                self._pasted = index + 1
+                pixels = np.asarray(self._canvas)
+                self._stage = (index, pixels[:, :, :3], pixels[:, :, 3] / 255)
+            return self._stage[1], self._stage[2]
 
 
 def _process_caption_window(
@@ -635,61 +798,51 @@ def _process_caption_window(
     *,
     roi_x: int,
     roi_y: int,
-    roi_width: int,
-    roi_height: int,
-    first_frame: np.ndarray,
+    text_color: tuple[int, int, int],
+    stroke_color: tuple[int, int, int],
     min_font_size: int,
     max_font_ratio: float,
     border_thickness: int,
     shadow_offset: tuple[int, int],
-) -> list[TextClip]:
-    """Process a single caption window and create all necessary clips."""
-    text_color, stroke_color = _determine_text_colors(
-        first_frame, roi_x, roi_y, roi_width, roi_height
-    )
-
-    # Process all words in the window
-    text_clips = []
-    cursor_x, cursor_y = 0, 0
-    previous_word = None
-    max_font_size = int(min_font_size * max_font_ratio)
-
-    for word in window.words:
-        clips, (cursor_x, cursor_y) = _create_word_clips(
-            word=word,
-            window=window,
+) -> list[VideoClip]:
+    """Create one clip per word, showing the window up to that word until the next one."""
+    canvas = _WindowCanvas(
+        render_window_rgba(
+            window,
             roi_x=roi_x,
             roi_y=roi_y,
-            roi_width=roi_width,
-            roi_height=roi_height,
             text_color=text_color,
             stroke_color=stroke_color,
             border_thickness=border_thickness,
             shadow_offset=shadow_offset,
-            max_font_size=max_font_size,
-            cursor_pos=(cursor_x, cursor_y),
-            previous_word=previous_word,
+            max_font_size=int(min_font_size * max_font_ratio),
         )
-        text_clips.extend(clips)
-        previous_word = word
+    )
 
+    text_clips = []
+    end_times = [word.start_time for word in window.words[1:]] + [window.end_time]
+    for index, (word, end_time) in enumerate(zip(window.words, end_times, strict=True)):
+        duration = max(end_time - word.start_time, 0)
+        stage = partial(canvas.stage, index)
+        mask = VideoClip(lambda _t, stage=stage: stage()[1], is_mask=True, duration=duration)
+        text_clips.append(
+            VideoClip(lambda _t, stage=stage: stage()[0], duration=duration)
+            .with_mask(mask)
+            .with_position(canvas.position)
+            .with_start(word.start_time)
+        )
     return text_clips
 
 
 def _determine_text_colors(first_frame, roi_x, roi_y, roi_width, roi_height):
     """Determine text/stroke colors based on ROI background."""
     window_roi = first_frame[roi_y : roi_y + roi_height, roi_x : roi_x + roi_width]
-    avg_bg_color = tuple(map(int, np.mean(window_roi, axis=(0, 1))))
+    avg_bg_color = get_average_color(window_roi)
     complement = tuple(255 - c for c in avg_bg_color)
-    palette = get_vibrant_palette()
-    color_diffs = [
-        sum(abs(c1 - c2) for c1, c2 in zip(complement, palette_color, strict=False))
-        for palette_color in palette
-    ]
-    text_color = palette[color_diffs.index(min(color_diffs))]
+    text_color = get_closest_palette_color(complement)
     stroke_color = tuple(c // 3 for c in text_color)
     Logger.print_info(
-        f"Using color {text_color} for window (background: {avg_bg_color}, "
+        f"Using color {text_color} for captions (background: {avg_bg_color}, "
         f"complement: {complement})"
     )
     return text_color, stroke_color
@@ -697,23 +850,13 @@ def _determine_text_colors(first_frame, roi_x, roi_y, roi_width, roi_height):
 
 def _prepare_dynamic_caption_context(input_video: str) -> DynamicCaptionContext | None:
     """Load video metadata needed for dynamic captions."""
-    video = VideoFileClip(input_video)
-    try:
-        first_frame = video.get_frame(0)
-        roi = find_roi_in_frame(first_frame)
-        if roi is None:
-            Logger.print_error("Failed to find ROI for captions")
-            video.close()
-            return None
-        return DynamicCaptionContext(
-            video=video,
-            duration=video.duration,
-            first_frame=first_frame,
-            roi=roi,
-        )
-    except Exception:
-        video.close()
-        raise
+    first_frame, duration = read_first_frame_and_duration(input_video)
+
+    roi = find_roi_in_frame(first_frame)
+    if roi is None:
+        Logger.print_error("Failed to find ROI for captions")
+        return None
+    return DynamicCaptionContext(duration=duration, first_frame=first_frame, roi=roi)
 
 
 def _collect_caption_words(
@@ -746,99 +889,315 @@ def _create_text_clips_for_windows(
     max_font_ratio: float,
     border_thickness: int,
     shadow_offset: tuple[int, int],
-) -> list[TextClip]:
+) -> list[VideoClip]:
     """Render all text clips for the provided caption windows."""
     roi_x, roi_y, roi_width, roi_height = roi
-    text_clips = []
+    # Every window sits over the same ROI of the same frame, so they share one color pair
+    text_color, stroke_color = _determine_text_colors(
+        first_frame, roi_x, roi_y, roi_width, roi_height
+    )
+    render_window = partial(
+        _process_caption_window,
+        roi_x=roi_x,
+        roi_y=roi_y,
+        text_color=text_color,
+        stroke_color=stroke_color,
+        min_font_size=min_font_size,
+        max_font_ratio=max_font_ratio,
+        border_thickness=border_thickness,
+        shadow_offset=shadow_offset,
+    )
+
+    # Windows share no state, so they render concurrently; threads, because the clips
+    # hold closures that can't be pickled to worker processes. map keeps window order.
+    workers = min(len(windows), os.cpu_count() or 1)
+    if workers <= 1:
+        clips_per_window = map(render_window, windows)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            clips_per_window = list(executor.map(render_window, windows))
+    return [clip for window_clips in clips_per_window for clip in window_clips]
+
+
+# x264 options for the captioned encode, on top of the ultrafast preset. zerolatency turns
+# on sliced threads and drops lookahead, so every encoder thread works on the current frame.
+# The default quality is kept: at a higher CRF the flat caption colors pick up artifacts.
+_X264_CAPTION_ARGS = ("-tune", "zerolatency")
+
+# One escape pass per parsing level: drawtext's option parser, then the filtergraph parser
+_OPTION_ESCAPES = str.maketrans({"\\": "\\\\", "'": "\\'", ":": "\\:"})
+_FILTERGRAPH_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "'": "\\'", "[": "\\[", "]": "\\]", ",": "\\,", ";": "\\;"}
+)
+
+
+def _escape_filter_value(value: str) -> str:
+    """Escape a string so it reaches a filter option verbatim through a filtergraph."""
+    return value.translate(_OPTION_ESCAPES).translate(_FILTERGRAPH_ESCAPES)
+
+
+def _write_filter_script(filters: list[str], output_path: str, temp_files: list[str]) -> str:
+    """Write a filter chain to a script file next to the output and return its path.
+
+    ffmpeg reads the script with -filter_script, which keeps thousands of filters clear
+    of the command-line length limit.
+    """
+    filter_script = os.path.join(os.path.dirname(output_path), f"temp_filters_{uuid.uuid4()}.txt")
+    temp_files.append(filter_script)
+    with open(filter_script, "w", encoding="utf-8") as script:
+        script.write(",\n".join(filters))
+    return filter_script
+
+
+def _ffmpeg_color(color: tuple[int, int, int], opacity: float | None = None) -> str:
+    """Format an RGB color, optionally with an opacity, as an ffmpeg color string."""
+    red, green, blue = color
+    hex_color = f"0x{red:02X}{green:02X}{blue:02X}"
+    return hex_color if opacity is None else f"{hex_color}@{opacity}"
+
+
+@lru_cache(maxsize=1)
+def _ffmpeg_has_drawtext() -> bool:
+    """Whether the ffmpeg on PATH was built with the drawtext filter (needs libfreetype)."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-filters"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+    except OSError:
+        return False
+    return b" drawtext " in result.stdout
+
+
+def _build_word_drawtext_filters(
+    windows: list[CaptionWindow],
+    *,
+    roi: tuple[int, int, int, int],
+    text_color: tuple[int, int, int],
+    stroke_color: tuple[int, int, int],
+    min_font_size: int,
+    max_font_ratio: float,
+    border_thickness: int,
+    shadow_offset: tuple[int, int],
+) -> list[str]:
+    """Build drawtext filters drawing each word and its shadows where its clip would be.
+
+    Words are laid out exactly as for the MoviePy clips; each shadow is its own drawtext
+    so that, like the rendered clips, it covers the outline as well as the glyphs.
+    """
+    roi_x, roi_y, _, _ = roi
+    max_font_size = int(min_font_size * max_font_ratio)
+    fill = _ffmpeg_color(text_color)
+    stroke = _ffmpeg_color(stroke_color)
+    filters = []
     for window in windows:
-        text_clips.extend(
-            _process_caption_window(
-                window=window,
+        for word in window.words:
+            geometry = _calculate_word_clip_geometry(
+                word,
                 roi_x=roi_x,
                 roi_y=roi_y,
-                roi_width=roi_width,
-                roi_height=roi_height,
-                first_frame=first_frame,
-                min_font_size=min_font_size,
-                max_font_ratio=max_font_ratio,
-                border_thickness=border_thickness,
                 shadow_offset=shadow_offset,
+                max_font_size=max_font_size,
+                border_thickness=border_thickness,
             )
-        )
-    return text_clips
+            origin_x, origin_y = _text_origin(
+                _load_font(word.font_name, word.font_size),
+                word.text,
+                clip_dimensions=geometry.clip_dimensions,
+                margins=geometry.margins,
+                border_thickness=border_thickness,
+            )
+            # Options shared by the word's shadows and text; drawtext's y is the top of
+            # the text, so the baseline is placed by subtracting the rendered ascent
+            common = (
+                f"drawtext=text={_escape_filter_value(word.text)}"
+                f":fontfile={_escape_filter_value(word.font_name)}"
+                f":fontsize={word.font_size}"
+                f":expansion=none"
+                f":borderw={border_thickness}"
+                f":enable=between(t\\,{word.start_time}\\,{window.end_time})"
+            )
+            layers = [
+                (getattr(geometry, attribute), _ffmpeg_color((0, 0, 0), opacity), None)
+                for attribute, opacity in _SHADOW_LAYERS
+            ]
+            layers.append((geometry.base_position, fill, stroke))
+            for (x, y), color, border_color in layers:
+                filters.append(
+                    f"{common}"
+                    f":fontcolor={color}"
+                    f":bordercolor={border_color or color}"
+                    f":x={round(x + origin_x)}"
+                    f":y={round(y + origin_y)}-ascent"
+                )
+    return filters
 
 
-def _export_captioned_video(
-    context: DynamicCaptionContext,
-    text_clips: list[TextClip],
+def _export_with_drawtext(
+    filters: list[str],
     *,
     input_video: str,
     output_path: str,
     temp_files: list[str],
 ) -> bool:
-    """Export composite video with audio handling."""
-    final_video = CompositeVideoClip([context.video] + text_clips)
-
-    temp_audio = os.path.join(os.path.dirname(output_path), f"temp_audio_{uuid.uuid4()}.m4a")
-    temp_video = os.path.join(os.path.dirname(output_path), f"temp_video_{uuid.uuid4()}.mp4")
-    temp_files.extend([temp_audio, temp_video])
-
-    audio_extract_cmd = [
+    """Burn the drawtext filters into the video in a single ffmpeg pass, keeping the audio."""
+    filter_script = _write_filter_script(filters, output_path, temp_files)
+    cmd = [
         "ffmpeg",
         "-y",
         "-i",
         input_video,
-        "-vn",
-        "-acodec",
-        "copy",
-        temp_audio,
+        "-filter_script:v",
+        filter_script,
+        "-map",
+        "0:v:0",
+        "-map",
+        "0:a:0?",
+        "-c:v",
+        "libx264",
+        "-preset",
+        "ultrafast",
+        *_X264_CAPTION_ARGS,
+        "-c:a",
+        "aac",
+        "-b:a",
+        "192k",
+        output_path,
     ]
-    if not run_ffmpeg_command(audio_extract_cmd):
-        Logger.print_error("Failed to extract audio")
-        final_video.close()
-        context.video.close()
+    if not run_ffmpeg_command(cmd):
+        Logger.print_error("Failed to burn dynamic captions into video")
         return False
 
-    final_video.write_videofile(
-        temp_video,
-        codec="libx264",
-        audio=False,
-        preset="ultrafast",
-        threads=4,
-    )
+    Logger.print_info(f"Successfully added dynamic captions to video: {output_path}")
+    return True
 
-    combine_cmd = [
+
+class _TimeIndexedCompositeVideoClip(CompositeVideoClip):
+    """CompositeVideoClip that looks up the clips playing at a time instead of testing each.
+
+    The clips' start and end times split the timeline into segments over which the same
+    clips play. The playing clips of every segment are listed once, up front, so each
+    frame costs a binary search rather than a visibility check per caption clip.
+    """
+
+    def __init__(self, clips, *args, use_bgclip=False, **kwargs):
+        super().__init__(clips, *args, use_bgclip=use_bgclip, **kwargs)
+        if use_bgclip and None not in (self.end, self.bg.end):
+            # MoviePy leaves the background out of the duration; it should last as long
+            self.duration = self.end = max(self.end, self.bg.end)
+
+        self._segment_starts = sorted(
+            {clip.start for clip in self.clips}
+            | {clip.end for clip in self.clips if clip.end is not None}
+        )
+        self._segment_clips = [[] for _ in self._segment_starts]
+        # Clips are appended in layer order, which is the order they are drawn in
+        for clip in self.clips:
+            first = bisect_left(self._segment_starts, clip.start)
+            last = (
+                len(self._segment_starts)
+                if clip.end is None
+                else bisect_left(self._segment_starts, clip.end)
+            )
+            for segment in self._segment_clips[first:last]:
+                segment.append(clip)
+
+    def playing_clips(self, t=0):
+        """Return the clips playing at time t, as a plain clip list in drawing order."""
+        if not isinstance(t, (int, float)):
+            return super().playing_clips(t)
+        segment = bisect_right(self._segment_starts, t) - 1
+        return self._segment_clips[segment] if segment >= 0 else []
+
+
+def _export_captioned_video(
+    text_clips: list[VideoClip],
+    *,
+    input_video: str,
+    output_path: str,
+) -> bool:
+    """Encode the composited frames and the input's audio in one ffmpeg run.
+
+    Frames are piped to ffmpeg as raw RGB, so the captioned video is written once, with
+    the audio muxed in, rather than to a temporary file that is then remuxed.
+    """
+    # The video is only opened for compositing; ffmpeg takes the audio from the input
+    video = VideoFileClip(input_video, audio=False)
+    # The opaque video is the background itself, so no mask or backdrop is composited
+    final_video = _TimeIndexedCompositeVideoClip([video] + text_clips, use_bgclip=True)
+    width, height = final_video.size
+
+    encode_cmd = [
         "ffmpeg",
         "-y",
+        "-loglevel",
+        "error",
+        "-threads",
+        str(FFMPEG_THREAD_COUNT),
+        "-f",
+        "rawvideo",
+        "-pix_fmt",
+        "rgb24",
+        "-s",
+        f"{width}x{height}",
+        "-r",
+        str(video.fps),
         "-i",
-        temp_video,
+        "-",
         "-i",
-        temp_audio,
+        input_video,
         "-map",
         "0:v:0",
         "-map",
-        "1:a:0",
+        "1:a:0?",
         "-c:v",
-        "copy",
+        "libx264",
+        "-preset",
+        "ultrafast",
+        *_X264_CAPTION_ARGS,
+        "-pix_fmt",
+        "yuv420p",
         "-c:a",
         "aac",
         "-b:a",
         "192k",
         output_path,
     ]
-    result = run_ffmpeg_command(combine_cmd)
-
-    final_video.close()
-    context.video.close()
-    for clip in text_clips:
-        clip.close()
+    try:
+        with ffmpeg_thread_manager:
+            process = subprocess.Popen(
+                encode_cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+            try:
+                for frame in final_video.iter_frames(fps=video.fps, dtype="uint8"):
+                    process.stdin.write(np.ascontiguousarray(frame).data)
+            except BrokenPipeError:
+                pass  # ffmpeg exited early; its error is reported below
+            finally:
+                with suppress(BrokenPipeError):
+                    process.stdin.close()
+                stderr = process.stderr.read()
+                process.wait()
+    finally:
+        final_video.close()
+        video.close()
+        for clip in text_clips:
+            clip.close()
 
-    if not result:
-        Logger.print_error("Failed to combine video with audio")
+    if process.returncode != 0:
+        Logger.print_error(f"Failed to encode captioned video: {stderr.decode('utf-8')}")
         return False
 
     Logger.print_info(f"Successfully added dynamic captions to video: {output_path}")
     return True
+
+
 def create_dynamic_captions(
     input_video: str,
     captions: list[CaptionEntry],
@@ -846,12 +1205,17 @@ def create_dynamic_captions(
     *,
     min_font_size: int = 32,
     max_font_ratio: float = 1.5,
-    font_name: str = get_default_font(),
+    font_name: str | None = None,
     words_per_second: float = 2.0,
     shadow_offset: tuple[int, int] = (8, 8),
     border_thickness: int = 5,
 ) -> str | None:
-    """Add Instagram-style dynamic captions to a video using MoviePy."""
+    """Add Instagram-style dynamic captions to a video.
+
+    Words are drawn by ffmpeg's drawtext filter in a single encode when ffmpeg has it,
+    and otherwise composited with MoviePy.
+    """
+    font_name = font_name or get_default_font()
     temp_files = []  # Keep track of temp files for cleanup
     try:
         context = _prepare_dynamic_caption_context(input_video)
@@ -878,23 +1242,42 @@ def create_dynamic_captions(
             roi_height=roi_height,
         )
 
-        text_clips = _create_text_clips_for_windows(
-            windows,
-            roi=context.roi,
-            first_frame=context.first_frame,
-            min_font_size=min_font_size,
-            max_font_ratio=max_font_ratio,
-            border_thickness=border_thickness,
-            shadow_offset=shadow_offset,
-        )
-
-        if not _export_captioned_video(
-            context,
-            text_clips,
-            input_video=input_video,
-            output_path=output_path,
-            temp_files=temp_files,
-        ):
+        if _ffmpeg_has_drawtext():
+            # ffmpeg draws the words while encoding, so no frame passes through Python
+            text_color, stroke_color = _determine_text_colors(context.first_frame, *context.roi)
+            filters = _build_word_drawtext_filters(
+                windows,
+                roi=context.roi,
+                text_color=text_color,
+                stroke_color=stroke_color,
+                min_font_size=min_font_size,
+                max_font_ratio=max_font_ratio,
+                border_thickness=border_thickness,
+                shadow_offset=shadow_offset,
+            )
+            exported = _export_with_drawtext(
+                filters,
+                input_video=input_video,
+                output_path=output_path,
+                temp_files=temp_files,
+            )
+        else:
+            # Without drawtext, composite pre-rendered word images with MoviePy
+            text_clips = _create_text_clips_for_windows(
+                windows,
+                roi=context.roi,
+                first_frame=context.first_frame,
+                min_font_size=min_font_size,
+                max_font_ratio=max_font_ratio,
+                border_thickness=border_thickness,
+                shadow_offset=shadow_offset,
+            )
+            exported = _export_captioned_video(
+                text_clips,
+                input_video=input_video,
+                output_path=output_path,
+            )
+        if not exported:
             return None
 
         return output_path
@@ -913,6 +1296,14 @@ def create_dynamic_captions(
                 Logger.print_error(f"Error cleaning up temporary file {temp_file}: {exception}")
 
 
+def _format_srt_time(seconds: float) -> str:
+    """Convert seconds to SRT time format (HH:MM:SS,mmm)"""
+    # Whole milliseconds, so rounding carries into the seconds, minutes and hours
+    minutes, milliseconds = divmod(round(seconds * 1000), 60_000)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{milliseconds // 1000:02d},{milliseconds % 1000:03d}"
+
+
 def create_srt_captions(captions: list[CaptionEntry], output_path: str | None = None) -> str | None:
     """Create an SRT subtitle file from caption entries."""
     try:
@@ -920,18 +1311,15 @@ def create_srt_captions(captions: list[CaptionEntry], output_path: str | None =
             with tempfile.NamedTemporaryFile(suffix=".srt", mode="w", delete=False) as srt_file:
                 output_path = srt_file.name
 
-        def format_time(seconds: float) -> str:
-            """Convert seconds to SRT time format (HH:MM:SS,mmm)"""
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            seconds = seconds % 60
-            return f"{hours:02d}:{minutes:02d}:{seconds:06.3f}".replace(".", ",")
-
+        # Build the whole file first and write it in one call
+        entries = [
+            f"{index}\n"
+            f"{_format_srt_time(caption.start_time)} --> {_format_srt_time(caption.end_time)}\n"
+            f"{caption.text}\n\n"
+            for index, caption in enumerate(captions, 1)
+        ]
         with open(output_path, "w", encoding="utf-8") as f:
-            for i, caption in enumerate(captions, 1):
-                f.write(f"{i}\n")
-                f.write(f"{format_time(caption.start_time)} --> {format_time(caption.end_time)}\n")
-                f.write(f"{caption.text}\n\n")
+            f.write("".join(entries))
         return output_path
     except OSError as exception:
         Logger.print_error(f"Error creating SRT file: {exception}")
@@ -944,7 +1332,7 @@ def create_static_captions(
     output_path: str,
     *,
     font_size: int = 40,
-    font_name: str = get_default_font(),
+    font_name: str | None = None,
     box_color: str = "black@0.5",  # Semi-transparent background
     position: str = "bottom",
     margin: int = 40,
@@ -957,11 +1345,12 @@ def create_static_captions(
         captions: List of CaptionEntry objects
         output_path: Path where the output video will be saved
         font_size: Font size for captions
-        font_name: Name of the font to use
+        font_name: Name of the font to use; defaults to get_default_font()
         box_color: Color and opacity of the background box
         position: Vertical position of captions ('bottom' or 'center')
         margin: Margin from screen edges in pixels
     """
+    font_name = font_name or get_default_font()
     temp_files = []  # Keep track of temp files for cleanup
     try:
         video_width = _get_video_width(input_video)
@@ -975,12 +1364,11 @@ def create_static_captions(
             font_size=font_size,
             box_color=box_color,
         )
-        complete_filter = ",".join(drawtext_filters)
 
         if not _compose_static_caption_video(
             input_video,
             output_path=output_path,
-            filter_graph=complete_filter,
+            filters=drawtext_filters,
             temp_files=temp_files,
         ):
             return None
@@ -1049,11 +1437,12 @@ def _build_drawtext_filters(
     for caption in captions:
         y_position = f"h-{margin}-th" if position == "bottom" else "(h-th)/2"
         wrapped_lines = textwrap.wrap(caption.text, width=max_chars_per_line) or [caption.text]
-        escaped_text = "\n".join(line.replace("'", "\\'") for line in wrapped_lines)
+        escaped_text = _escape_filter_value("\n".join(wrapped_lines))
         filters.append(
-            f"drawtext=text='{escaped_text}'"
-            f":font={font_name}"
+            f"drawtext=text={escaped_text}"
+            f":font={_escape_filter_value(font_name)}"
             f":fontsize={font_size}"
+            f":expansion=none"
             f":fontcolor=white"
             f":x=(w-text_w)/2"
             f":y={y_position}"
@@ -1068,7 +1457,7 @@ def _compose_static_caption_video(
     input_video: str,
     *,
     output_path: str,
-    filter_graph: str,
+    filters: list[str],
     temp_files: list[str],
 ) -> bool:
     """Run ffmpeg steps to burn in captions and restore audio."""
@@ -1095,8 +1484,8 @@ def _compose_static_caption_video(
         "-y",
         "-i",
         input_video,
-        "-vf",
-        filter_graph,
+        "-filter_script:v",
+        _write_filter_script(filters, output_path, temp_files),
         "-an",
         temp_video,
     ]
@@ -7,30 +7,45 @@ This module provides functionality for:
 4. Finding optimal text colors for contrast
 """
 
-from colorsys import hsv_to_rgb, rgb_to_hsv
-
+import cv2
 import numpy as np
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba comes with openai-whisper; without it batches average per frame
+    njit = None
+    prange = range
+
+# Built once; a tuple so callers cannot mutate the shared palette
+_VIBRANT_PALETTE = (
+    (240, 46, 230),  # Hot Pink
+    (157, 245, 157),  # Lime Green
+    (52, 235, 222),  # Cyan
+    (247, 158, 69),  # Bright Orange
+    (247, 247, 17),  # Hot Yellow
+    (167, 96, 247),  # Royal Purple
+)
+
+# The same palette as an (n, 3) array, so whole-palette searches run as one NumPy pass
+_VIBRANT_PALETTE_ARRAY = np.array(_VIBRANT_PALETTE, dtype=np.uint8)
+_VIBRANT_PALETTE_ARRAY.flags.writeable = False
+
 
-def get_vibrant_palette() -> list[tuple[int, int, int]]:
-    """Get a list of vibrant colors for captions.
+def get_vibrant_palette() -> tuple[tuple[int, int, int], ...]:
+    """Get the vibrant colors for captions.
 
     Returns:
-        List[Tuple[int, int, int]]: List of RGB color tuples
+        Tuple[Tuple[int, int, int], ...]: RGB color tuples
     """
-    return [
-        (240, 46, 230),  # Hot Pink
-        (157, 245, 157),  # Lime Green
-        (52, 235, 222),  # Cyan
-        (247, 158, 69),  # Bright Orange
-        (247, 247, 17),  # Hot Yellow
-        (167, 96, 247),  # Royal Purple
-    ]
+    return _VIBRANT_PALETTE
 
 
 def get_color_complement(color: tuple[int, int, int]) -> tuple[int, int, int]:
     """
-    Calculate the complement of a color using HSV color space for better results.
+    Calculate the complement of a color by shifting its HSV hue by 180 degrees.
+
+    Shifting the hue half a turn keeps saturation and value, so the brightest and
+    darkest channels keep their levels and every channel c maps to max + min - c.
 
     Args:
         color: RGB color tuple
@@ -38,16 +53,35 @@ def get_color_complement(color: tuple[int, int, int]) -> tuple[int, int, int]:
     Returns:
         RGB color tuple of the complement
     """
-    # Convert RGB to HSV
-    r, g, b = [x / 255.0 for x in color]
-    h, s, v = rgb_to_hsv(r, g, b)
+    r, g, b = color
+    total = max(r, g, b) + min(r, g, b)
+    return (total - r, total - g, total - b)
+
+
+_VIBRANT_COMPLEMENTS = tuple(get_color_complement(color) for color in _VIBRANT_PALETTE)
+
+
+def get_vibrant_complements() -> tuple[tuple[int, int, int], ...]:
+    """Get the complement of each vibrant palette color, in palette order.
+
+    Returns:
+        Tuple[Tuple[int, int, int], ...]: RGB color tuples
+    """
+    return _VIBRANT_COMPLEMENTS
 
-    # Calculate complement by shifting hue by 180 degrees
-    h = (h + 0.5) % 1.0
 
-    # Convert back to RGB
-    r, g, b = hsv_to_rgb(h, s, v)
-    return (int(r * 255), int(g * 255), int(b * 255))
+def get_closest_palette_color(color: tuple[int, int, int]) -> tuple[int, int, int]:
+    """
+    Find the vibrant palette color closest to a color by L1 distance.
+
+    Args:
+        color: RGB color tuple
+
+    Returns:
+        RGB color tuple from the vibrant palette, the first one on ties
+    """
+    distances = np.abs(_VIBRANT_PALETTE_ARRAY.astype(np.int16) - np.asarray(color)).sum(axis=1)
+    return _VIBRANT_PALETTE[int(distances.argmin())]
 
 
 def mix_colors(
@@ -70,6 +104,65 @@ def mix_colors(
     return (r, g, b)
 
 
+def mix_colors_batch(colors1: np.ndarray, colors2: np.ndarray, ratio: float = 0.8) -> np.ndarray:
+    """
+    Mix many pairs of colors at once, matching mix_colors for each pair.
+
+    Args:
+        colors1: (..., 3) array of RGB primary colors
+        colors2: (..., 3) array of RGB secondary colors, broadcast against colors1
+        ratio: Weight of the first colors (0.0 to 1.0)
+
+    Returns:
+        (..., 3) uint8 array of the mixed colors
+    """
+    colors1 = np.asarray(colors1, dtype=np.float64)
+    colors2 = np.asarray(colors2, dtype=np.float64)
+    # Same arithmetic as mix_colors, truncated toward zero by the cast
+    return (colors1 * ratio + colors2 * (1 - ratio)).astype(np.uint8)
+
+
+# (text_color, stroke_color) pairs chosen by get_contrasting_color
+_LIGHT_RED_CONTRAST = ((205, 255, 255), (68, 85, 85))  # Light cyan on dark cyan
+_DARK_RED_CONTRAST = ((231, 255, 255), (77, 85, 85))  # Light cyan on dark cyan
+_GREEN_CONTRAST = ((255, 205, 255), (85, 68, 85))  # Light magenta on dark magenta
+_DARK_CONTRAST = ((255, 255, 255), (85, 85, 85))  # White on dark gray
+_LIGHT_CONTRAST = ((0, 0, 0), (255, 255, 255))  # Black on white
+
+# Contrast pairs indexed by a 4-bit key: red dominant (8), red above 200 (4),
+# brightness at least 128 (2), green dominant (1). Red-dominant regions are split by
+# red level alone; otherwise green-dominant regions get magenta at any brightness.
+_CONTRAST_LUT = tuple(
+    (_LIGHT_RED_CONTRAST if key & 4 else _DARK_RED_CONTRAST)
+    if key & 8
+    else _GREEN_CONTRAST
+    if key & 1
+    else (_LIGHT_CONTRAST if key & 2 else _DARK_CONTRAST)
+    for key in range(16)
+)
+
+
+def get_average_color(region: np.ndarray) -> tuple[int, int, int]:
+    """
+    Calculate the average color of an image region, truncated to integers.
+
+    8-bit regions go through cv2.mean, which sums each channel in integer accumulators
+    with SIMD and reads a strided ROI view in place rather than widening every pixel to
+    float64 as np.mean does; other dtypes fall back to NumPy.
+
+    Args:
+        region: (height, width, 3 or 4) image array
+
+    Returns:
+        RGB color tuple of the average
+    """
+    if region.dtype == np.uint8 and region.ndim == 3 and region.shape[2] in (3, 4):
+        mean = cv2.mean(region)
+    else:
+        mean = np.mean(region, axis=(0, 1))
+    return int(mean[0]), int(mean[1]), int(mean[2])
+
+
 def get_contrasting_color(
     frame: np.ndarray, roi: tuple[int, int, int, int]
 ) -> tuple[tuple[int, int, int], tuple[int, int, int]]:
@@ -88,40 +181,93 @@ def get_contrasting_color(
     roi_region = frame[y : y + height, x : x + width]
 
     # Calculate average color in ROI
-    avg_color = tuple(map(int, np.mean(roi_region, axis=(0, 1))))
-
-    # For red-dominant regions, use a modified brightness calculation
-    if avg_color[0] > avg_color[1] and avg_color[0] > avg_color[2]:
-        # For red regions, if red component is high enough, treat as light
-        if avg_color[0] > 200:  # High red value indicates light region
-            text_color = (205, 255, 255)  # Light cyan for light red
-            stroke_color = (68, 85, 85)  # Dark cyan
-        else:
-            text_color = (231, 255, 255)  # Light cyan for dark red
-            stroke_color = (77, 85, 85)  # Dark cyan
-    else:
-        # Calculate perceived brightness using standard coefficients
-        brightness = 0.299 * avg_color[0] + 0.587 * avg_color[1] + 0.114 * avg_color[2]
-
-        # For dark backgrounds, use light colors
-        if brightness < 128:
-            # For dark green, use light magenta
-            if avg_color[1] > avg_color[0] and avg_color[1] > avg_color[2]:
-                text_color = (255, 205, 255)  # Light magenta
-                stroke_color = (85, 68, 85)  # Dark magenta
-            # For dark blue or black, use white
-            else:
-                text_color = (255, 255, 255)  # White
-                stroke_color = (85, 85, 85)  # Dark gray
-        # For light backgrounds, use dark colors
-        else:
-            # For light green, use light magenta
-            if avg_color[1] > avg_color[0] and avg_color[1] > avg_color[2]:
-                text_color = (255, 205, 255)  # Light magenta
-                stroke_color = (85, 68, 85)  # Dark magenta
-            # For light blue or white, use black
-            else:
-                text_color = (0, 0, 0)  # Black
-                stroke_color = (255, 255, 255)  # White
-
-    return text_color, stroke_color
+    red, green, blue = get_average_color(roi_region)
+    return _CONTRAST_LUT[_contrast_key(red, green, blue)]
+
+
+def get_contrasting_colors_batch(
+    frames: np.ndarray, roi: tuple[int, int, int, int]
+) -> list[tuple[tuple[int, int, int], tuple[int, int, int]]]:
+    """
+    Determine contrasting text and stroke colors for many frames sharing one ROI.
+
+    Gives the same result as calling get_contrasting_color on each frame, but classifies
+    all of the ROI averages in one pass.
+
+    Args:
+        frames: Video frames as an (n, height, width, channels) array or a sequence of
+            (height, width, channels) arrays
+        roi: Tuple of (x, y, width, height) defining the ROI
+
+    Returns:
+        List of (text_color, stroke_color) RGB tuples, one per frame
+    """
+    x, y, width, height = roi
+    averages = None
+    if (
+        _batch_roi_sums is not None
+        and isinstance(frames, np.ndarray)
+        and frames.dtype == np.uint8
+        and frames.ndim == 4
+        and frames.shape[3] in (3, 4)
+    ):
+        # Clip the ROI to the frame the way slicing does
+        bottom = min(y + height, frames.shape[1])
+        right = min(x + width, frames.shape[2])
+        count = (bottom - y) * (right - x)
+        if bottom > y and right > x:
+            # Floor division truncates the nonnegative means as get_average_color does
+            averages = _batch_roi_sums(frames, y, bottom, x, right) // count
+    if averages is None:
+        averages = np.array(
+            [get_average_color(frame[y : y + height, x : x + width]) for frame in frames],
+            dtype=np.int64,
+        ).reshape(-1, 3)
+    keys = _contrast_key(averages[:, 0], averages[:, 1], averages[:, 2])
+    return [_CONTRAST_LUT[key] for key in keys.tolist()]
+
+
+def _batch_roi_sums_loop(frames, top, bottom, left, right):
+    """Sum the RGB channels of the same ROI in every frame, as an (n, 3) int64 array.
+
+    A scalar loop for compiling with numba; frames are spread across cores.
+    """
+    sums = np.zeros((frames.shape[0], 3), dtype=np.int64)
+    for index in prange(frames.shape[0]):
+        red = 0
+        green = 0
+        blue = 0
+        for row in range(top, bottom):
+            for col in range(left, right):
+                red += int(frames[index, row, col, 0])
+                green += int(frames[index, row, col, 1])
+                blue += int(frames[index, row, col, 2])
+        sums[index, 0] = red
+        sums[index, 1] = green
+        sums[index, 2] = blue
+    return sums
+
+
+# The compiled kernel sums every frame in one call instead of one cv2.mean per frame;
+# cache=True keeps it across processes so only the first run pays for compilation
+_batch_roi_sums = (
+    njit(parallel=True, cache=True)(_batch_roi_sums_loop) if njit is not None else None
+)
+
+
+def _contrast_key(red, green, blue):
+    """Return the _CONTRAST_LUT index for average channel levels.
+
+    Works on ints and on integer arrays alike, since it only uses integer arithmetic,
+    comparisons and bitwise operators.
+    """
+    # Perceived brightness using the BT.601 coefficients scaled by 1000, so the threshold
+    # test is exact integer arithmetic; in floats, backgrounds at exactly 128 could round
+    # to just below it
+    brightness_x1000 = 299 * red + 587 * green + 114 * blue
+    return (
+        ((red > green) & (red > blue)) << 3
+        | (red > 200) << 2
+        | (brightness_x1000 >= 128_000) << 1
+        | ((green > red) & (green > blue))
+    )
@@ -1,8 +1,11 @@
 """Module for loading and validating TTV (text-to-video) configuration files."""
 
 import json
+import os
+import time
 from dataclasses import dataclass, field
-from typing import Literal
+from functools import lru_cache
+from typing import Any, Literal
 
 
 @dataclass
@@ -94,6 +97,34 @@ def validate_caption_style(caption_style: str | None) -> str:
     return caption_style
 
 
+# Files modified this recently are parsed without caching: a rewrite within the same
+# timestamp tick could keep both the mtime and the size, so the cache key cannot tell
+# the two versions apart until the file has settled
+_UNSETTLED_MTIME_NS = 2_000_000_000
+
+
+def _parse_config_file(path: str) -> dict[str, Any]:
+    """Parse a config file's JSON, with orjson when it is installed."""
+    with open(path, "rb") as json_file:
+        raw = json_file.read()
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(raw)
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+    return orjson.loads(raw)
+
+
+@lru_cache(maxsize=32)
+def _read_config_data(real_path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a config file, cached by path and the file's modification time and size.
+
+    The stat fields are part of the cache key, so editing the file invalidates its entry.
+    The parsed data is shared between calls and must not be mutated.
+    """
+    return _parse_config_file(real_path)
+
+
 def load_input(ttv_config: str) -> TTVConfig:
     """Load and validate the TTV config file.
 
@@ -108,8 +139,12 @@ def load_input(ttv_config: str) -> TTVConfig:
         JSONDecodeError: If JSON is invalid
         FileNotFoundError: If config file doesn't exist
         ValueError: If music configuration is invalid"""
-    with open(ttv_config, encoding="utf-8") as json_file:
-        data = json.load(json_file)
+    real_path = os.path.realpath(ttv_config)
+    stat = os.stat(real_path)
+    if time.time_ns() - stat.st_mtime_ns < _UNSETTLED_MTIME_NS:
+        data = _parse_config_file(real_path)
+    else:
+        data = _read_config_data(real_path, stat.st_mtime_ns, stat.st_size)
 
     # Create music configs if present
     background_music = None
@@ -144,7 +179,7 @@ def load_input(ttv_config: str) -> TTVConfig:
     # Create and validate full config
     config = TTVConfig(
         style=data["style"],
-        story=data["story"],
+        story=list(data["story"]),  # A copy, so callers cannot edit the cached data
         title=data["title"],
         caption_style=caption_style,
         music=music_options,
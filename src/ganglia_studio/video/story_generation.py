@@ -1,5 +1,6 @@
 import json
 import os
+import random
 import time
 from functools import lru_cache
 from typing import Any
@@ -8,6 +9,19 @@ import requests
 from ganglia_common.logger import Logger
 from openai import OpenAI
 
+# Longest wait between retries of a story or poster API call, in seconds
+MAX_RETRY_WAIT = 30.0
+
+
+def _retry_delay(attempt: int, base_delay: float, max_delay: float = MAX_RETRY_WAIT) -> float:
+    """Return how long to wait before retrying after failed attempt ``attempt`` (0-based).
+
+    Draws a jittered delay from a range that triples with each attempt, capped at
+    max_delay, so concurrent callers spread their retries instead of waiting out a
+    doubling schedule in lockstep.
+    """
+    return min(max_delay, random.uniform(base_delay, base_delay * 3**attempt))
+
 
 @lru_cache(maxsize=1)
 def get_openai_client():
@@ -21,6 +35,25 @@ def get_openai_client():
     return OpenAI(api_key=api_key)
 
 
+def _loads_json(text):
+    """Parse JSON text, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(text)
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+    return orjson.loads(text)
+
+
+def _dumps_json(obj) -> str:
+    """Serialize an object to compact JSON text, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return orjson.dumps(obj).decode("utf-8")
+
+
 def generate_filtered_story(context, style, story_title, query_dispatcher):
     """
     Generates a filtered story based on the provided context and style using ChatGPT.
@@ -41,7 +74,9 @@ def generate_filtered_story(context, style, story_title, query_dispatcher):
         success, filtered_content = query_dispatcher.filter_content_for_dalle(context)
         if not success:
             Logger.print_error("Failed to filter story content")
-            return json.dumps({"style": style, "title": story_title, "story": "No story generated"})
+            return _dumps_json(
+                {"style": style, "title": story_title, "story": "No story generated"}
+            )
 
         # Then format it into the required JSON structure
         response = query_dispatcher.send_query(
@@ -58,7 +93,7 @@ def generate_filtered_story(context, style, story_title, query_dispatcher):
         )
 
         # Parse the response to extract the filtered story
-        response_json = json.loads(response)
+        response_json = _loads_json(response)
 
         filtered_style = response_json["style"]
         filtered_title = response_json["title"]
@@ -71,12 +106,12 @@ def generate_filtered_story(context, style, story_title, query_dispatcher):
             )
 
         Logger.print_info(f"Generated filtered story: {filtered_story}")
-        return json.dumps(
+        return _dumps_json(
             {"style": filtered_style, "title": filtered_title, "story": filtered_story}
         )
     except Exception as e:
         Logger.print_error(f"Error generating filtered story: {e}")
-        return json.dumps({"style": style, "title": story_title, "story": "No story generated"})
+        return _dumps_json({"style": style, "title": story_title, "story": "No story generated"})
 
 
 def _parse_story_context(filtered_story_json, thread_prefix):
@@ -122,11 +157,12 @@ def _generate_poster_image(client, prompt, output_dir, thread_id, thread_prefix)
 def _handle_poster_generation_error(e, attempt, retries, wait_time, thread_prefix):
     """Handle errors during poster generation and return action."""
     if "Rate limit exceeded" in str(e):
+        retry_wait = _retry_delay(attempt, wait_time)
         Logger.print_warning(
-            f"{thread_prefix}Rate limit exceeded. Retrying in {wait_time} seconds... "
+            f"{thread_prefix}Rate limit exceeded. Retrying in {retry_wait:.1f} seconds... "
             f"(Attempt {attempt + 1} of {retries})"
         )
-        time.sleep(wait_time)
+        time.sleep(retry_wait)
         return "retry"
 
     if "safety system" in str(e).lower():
@@ -156,10 +192,20 @@ def generate_movie_poster(
     prompt = _build_poster_prompt(story_title, style, filtered_context)
     safety_retries = 3
 
+    # Look the client up once; retries reuse it rather than re-resolving it every attempt
+    try:
+        client = get_openai_client()
+    except ValueError as e:
+        Logger.print_error(
+            f"{thread_prefix}An error occurred while generating the movie poster: {e}"
+        )
+        return None
+
+    # Content the safety system has rejected; sending any of it again would be rejected too
+    rejected_contexts: set[str] = set()
     for safety_attempt in range(safety_retries):
         for attempt in range(retries):
             try:
-                client = get_openai_client()
                 return _generate_poster_image(client, prompt, output_dir, thread_id, thread_prefix)
 
             except Exception as e:
@@ -174,9 +220,16 @@ def generate_movie_poster(
                         f"{thread_prefix}Safety system rejection. Attempting to filter content "
                         f"(Attempt {safety_attempt + 1} of {safety_retries})"
                     )
+                    rejected_contexts.add(filtered_context)
                     success, filtered_context = query_dispatcher.filter_content_for_dalle(
                         filtered_context
                     )
+                    if success and filtered_context in rejected_contexts:
+                        Logger.print_error(
+                            f"{thread_prefix}Content filtering returned content the safety "
+                            "system already rejected; not retrying it"
+                        )
+                        return None
                     if success:
                         prompt = _build_poster_prompt(story_title, style, filtered_context)
                         break
@@ -212,7 +265,8 @@ def filter_text(
         style: Optional style to apply
         query_dispatcher: Optional query dispatcher
         retries: Number of retry attempts
-        wait_time: Wait time between retries in seconds
+        wait_time: Base wait between retries in seconds; each wait is jittered and capped
+            at MAX_RETRY_WAIT
         thread_id: Optional thread ID for logging
 
     Returns:
@@ -243,10 +297,10 @@ def filter_text(
 
         except Exception as e:
             if attempt < retries - 1:
-                retry_wait = wait_time * (2**attempt)  # Exponential backoff
+                retry_wait = _retry_delay(attempt, wait_time)
                 Logger.print_warning(
                     f"{thread_prefix}Error filtering text: {str(e)}. "
-                    f"Retrying in {retry_wait} seconds... "
+                    f"Retrying in {retry_wait:.1f} seconds... "
                     f"(Attempt {attempt + 1} of {retries})"
                 )
                 time.sleep(retry_wait)
@@ -268,9 +322,12 @@ def save_image_without_caption(image_url, filename, thread_id=None):
         thread_id: Optional thread ID for logging
     """
     thread_prefix = f"{thread_id} " if thread_id else ""
-    response = requests.get(image_url, timeout=30)  # 30 second timeout
-    if response.status_code == 200:
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        with open(filename, "wb") as file:
-            file.write(response.content)
+    # Stream the body to disk in chunks rather than holding the whole PNG in memory;
+    # the context manager returns the connection to the pool once the body is read
+    with requests.get(image_url, stream=True, timeout=30) as response:  # 30 second timeout
+        if response.status_code == 200:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            with open(filename, "wb") as file:
+                for chunk in response.iter_content(chunk_size=65536):
+                    file.write(chunk)
     Logger.print_info(f"{thread_prefix}Movie poster saved to {filename}")
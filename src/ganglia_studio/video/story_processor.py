@@ -605,7 +605,10 @@ def process_story(
 
         music_generator = MusicGenerator(config=config) if _needs_music(config) else None
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=total_segments + 2) as executor:
+        # One thread per segment plus the movie poster, background music and closing
+        # credits tasks, so a poster or music request waiting on its API never keeps a
+        # segment queued behind it
+        with concurrent.futures.ThreadPoolExecutor(max_workers=total_segments + 3) as executor:
             futures = _submit_parallel_tasks(
                 executor,
                 story,
@@ -71,13 +71,6 @@ def generate_dummy_tts_audio(
 # Whisper mocking utilities
 # ---------------------------------------------------------------------------
 
-class _DummyDecoder:
-    """Minimal decoder stub to satisfy code that clears `_kv_cache`."""
-
-    def __init__(self) -> None:
-        self._kv_cache: dict[str, float] = {}
-
-
 class DummyWhisperModel:
     """
     Lightweight Whisper model stub used in tests.
@@ -87,8 +80,9 @@ class DummyWhisperModel:
     exercised deterministically.
     """
 
-    def __init__(self) -> None:
-        self.decoder = _DummyDecoder()
+    def eval(self) -> DummyWhisperModel:
+        """Mirror nn.Module.eval(), which returns the module itself."""
+        return self
 
     @staticmethod
     def _build_segments_from_prompt(prompt: str) -> list[dict[str, object]]:
@@ -2,8 +2,12 @@
 
 import json
 import os
+import tempfile
+import time
 import unittest
+from unittest.mock import patch
 
+from ganglia_studio.video import config_loader
 from ganglia_studio.video.config_loader import MusicConfig, TTVConfig, load_input
 
 
@@ -255,6 +259,43 @@ class TestConfigLoader(unittest.TestCase):
         self.assertIsNone(result.preloaded_images_dir)
         os.remove("tests/unit/ttv/test_data/temp_config.json")
 
+
+    def test_settled_config_parsed_once(self):
+        """Test that an unchanged config file is parsed once and reparsed after edits."""
+        config_loader._read_config_data.cache_clear()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = os.path.join(temp_dir, "config.json")
+            with open(config_path, "w") as f:
+                json.dump({"style": "test style", "story": ["one"], "title": "first"}, f)
+            # Date the file back so it counts as settled
+            settled = time.time() - 60
+            os.utime(config_path, (settled, settled))
+
+            with patch.object(
+                config_loader, "_parse_config_file", wraps=config_loader._parse_config_file
+            ) as mock_parse:
+                first = load_input(config_path)
+                first.story.append("two")
+                second = load_input(config_path)
+                self.assertEqual(mock_parse.call_count, 1)
+                # Each call builds its own config, so edits do not leak between them
+                self.assertEqual(second.story, ["one"])
+
+                with open(config_path, "w") as f:
+                    json.dump({"style": "test style", "story": ["one"], "title": "second"}, f)
+                os.utime(config_path, (settled + 1, settled + 1))
+                self.assertEqual(load_input(config_path).title, "second")
+                self.assertEqual(mock_parse.call_count, 2)
+
+                # A freshly written file is parsed on every call
+                with open(config_path, "w") as f:
+                    json.dump({"style": "test style", "story": ["one"], "title": "third"}, f)
+                self.assertEqual(load_input(config_path).title, "third")
+                self.assertEqual(load_input(config_path).title, "third")
+                self.assertEqual(mock_parse.call_count, 4)
+        config_loader._read_config_data.cache_clear()
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -1,15 +1,22 @@
 import os
 import tempfile
+import threading
+import wave
 from typing import Union
 from unittest.mock import Mock, patch
 
 import pytest
 from ganglia_common.logger import Logger
 
+from ganglia_studio.music.backends.base import NonRetryableError, RateLimitedError
 from ganglia_studio.music.backends.foxai_suno import FoxAISunoBackend
 from ganglia_studio.music.backends.meta import MetaMusicBackend
 from ganglia_studio.music.backends.suno_api_org import SunoApiOrgBackend
-from ganglia_studio.music.music_lib import MusicGenerator, _exponential_backoff
+from ganglia_studio.music.music_lib import (
+    MusicGenerator,
+    _exponential_backoff,
+    _materialize_output,
+)
 from ganglia_studio.video.config_loader import MusicOptions, TTVConfig
 
 
@@ -525,3 +532,162 @@ def test_thread_id_propagation():
         assert thread_id_messages, "No thread ID messages found"
         for message in thread_id_messages:
             assert "test_thread" in message, f"Thread ID not found in message: {message}"
+
+def test_estimate_background_duration():
+    """Test that background duration estimates are clamped and stable across calls."""
+    generator = MusicGenerator(backend=MockSunoBackend())
+
+    assert generator._estimate_background_duration(None) == MusicGenerator.MIN_BACKGROUND_DURATION
+    assert generator._estimate_background_duration([]) == MusicGenerator.MIN_BACKGROUND_DURATION
+
+    long_story = ["word " * 200] * 5  # 1000 words -> 400s, clamped to max
+    assert generator._estimate_background_duration(long_story) == \
+        MusicGenerator.MAX_BACKGROUND_DURATION
+
+    story = ["one two three " * 50]  # 150 words -> 60s
+    assert generator._estimate_background_duration(story) == 60
+    assert generator._estimate_background_duration(list(story)) == 60
+
+def test_materialize_output(temp_output_dir):
+    """Test that generated files are placed at the output path with or without the source."""
+    src = os.path.join(temp_output_dir, "generated.mp3")
+    with open(src, "wb") as f:
+        f.write(b"audio")
+
+    kept = os.path.join(temp_output_dir, "kept.mp3")
+    _materialize_output(src, kept)
+    assert os.path.exists(src)
+    with open(kept, "rb") as f:
+        assert f.read() == b"audio"
+
+    moved = os.path.join(temp_output_dir, "moved.mp3")
+    _materialize_output(src, moved, keep_source=False)
+    assert not os.path.exists(src)
+    with open(moved, "rb") as f:
+        assert f.read() == b"audio"
+
+def test_poll_stops_when_completion_event_is_set():
+    """Test that polling returns as soon as the backend signals completion."""
+    class EventBackend(ThreadTestBackend):
+        def __init__(self):
+            super().__init__()
+            self.event = threading.Event()
+            self.event.set()
+
+        def completion_event(self, job_id):
+            return self.event
+
+        def check_progress(self, job_id: str) -> tuple[str, float]:
+            self.check_progress_called = True
+            return "Failed", 0
+
+    backend = EventBackend()
+    generator = MusicGenerator(backend=backend)
+
+    with patch('time.sleep') as mock_sleep:
+        generator._poll_until_complete(backend, "mock_job_id")
+
+    assert backend.check_progress_called
+    mock_sleep.assert_not_called()
+
+def test_non_retryable_error_skips_retries():
+    """Test that permanent backend errors fail fast instead of exhausting retries."""
+    backend = RetryTestBackend([NonRetryableError("HTTP 401: bad key")] * 5)
+    generator = MusicGenerator(backend=backend)
+
+    with patch('time.sleep') as mock_sleep:
+        result = generator.generate_instrumental("test prompt")
+
+    assert result == (None, None)
+    assert backend.attempts == 1
+    mock_sleep.assert_not_called()
+
+def test_background_music_duration_is_clamped():
+    """Test that caller-provided background durations are clamped to the supported range."""
+    backend = DurationTestBackend()
+    generator = MusicGenerator(backend=backend)
+    output_dir = os.path.join(tempfile.gettempdir(), "output")
+
+    generator.get_background_music_from_prompt(
+        prompt="test prompt", output_dir=output_dir, target_duration=5
+    )
+    assert backend.last_duration == MusicGenerator.MIN_BACKGROUND_DURATION
+
+    generator.get_background_music_from_prompt(
+        prompt="test prompt", output_dir=output_dir, target_duration=10_000
+    )
+    assert backend.last_duration == MusicGenerator.MAX_BACKGROUND_DURATION
+
+def test_probe_audio_stream(temp_output_dir):
+    """Test in-process audio stream detection, with None signalling an ffprobe fallback."""
+    pytest.importorskip("av")
+
+    wav_path = os.path.join(temp_output_dir, "tone.wav")
+    with wave.open(wav_path, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(8000)
+        wav_file.writeframes(b"\x00\x00" * 800)
+    assert MusicGenerator._probe_audio_stream(wav_path) is True
+
+    text_path = os.path.join(temp_output_dir, "notes.txt")
+    with open(text_path, "w", encoding="utf-8") as f:
+        f.write("not audio")
+    assert MusicGenerator._probe_audio_stream(text_path) is None
+
+def test_rate_limit_uses_retry_after():
+    """Test that a provider's Retry-After delay replaces the backoff delay."""
+    backend = RetryTestBackend([RateLimitedError("HTTP 429: slow down", retry_after=7)])
+    generator = MusicGenerator(backend=backend)
+
+    with patch('time.sleep') as mock_sleep:
+        result = generator.generate_instrumental("test prompt")
+
+    assert result == ("/mock/path/to/audio.mp3", None)
+    assert backend.attempts == 2
+    mock_sleep.assert_called_once_with(7)
+
+def test_identical_concurrent_requests_share_one_job():
+    """Test that concurrent identical instrumental requests are coalesced into one job."""
+    class BlockingBackend(ThreadTestBackend):
+        def __init__(self):
+            super().__init__()
+            self.started = threading.Event()
+            self.release = threading.Event()
+            self.start_count = 0
+
+        def start_generation(self, prompt: str, **kwargs) -> str:
+            self.start_count += 1
+            self.started.set()
+            self.release.wait(timeout=5)
+            return "mock_job_id"
+
+    backend = BlockingBackend()
+    generator = MusicGenerator(backend=backend)
+    results = []
+    follower_waiting = threading.Event()
+    print_info = Logger.print_info
+
+    def spy_print_info(message, *args, **kwargs):
+        if message.startswith("Waiting for in-flight generation"):
+            follower_waiting.set()
+        return print_info(message, *args, **kwargs)
+
+    def generate():
+        results.append(generator.generate_instrumental("same prompt", duration=30))
+
+    with patch.object(Logger, 'print_info', side_effect=spy_print_info):
+        leader = threading.Thread(target=generate)
+        leader.start()
+        assert backend.started.wait(timeout=5)
+
+        follower = threading.Thread(target=generate)
+        follower.start()
+        assert follower_waiting.wait(timeout=5)
+
+        backend.release.set()
+        leader.join(timeout=5)
+        follower.join(timeout=5)
+
+    assert backend.start_count == 1
+    assert results == [("/mock/path/to/audio.mp3", None)] * 2
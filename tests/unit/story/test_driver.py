@@ -4,8 +4,11 @@ This module contains tests for the story generation driver, which manages
 the process of gathering information for text-to-video generation.
 """
 
+import json
 import tempfile
+import threading
 import unittest
+from dataclasses import asdict
 from unittest.mock import MagicMock, patch
 
 from ganglia_common.pubsub import Event, EventType
@@ -14,7 +17,9 @@ from ganglia_studio.story.story_generation_driver import (
     StoryGenerationDriver,
     StoryGenerationState,
     StoryInfoType,
+    flush_published_events,
     get_story_generation_driver,
+    release_story_generation_driver,
 )
 
 
@@ -42,6 +47,8 @@ class TestStoryGenerationDriver(unittest.TestCase):
 
     def tearDown(self):
         """Tear down test fixtures."""
+        # Let queued events reach this test's mock pubsub before it is unpatched
+        flush_published_events()
         # Stop the pubsub patcher
         self.pubsub_patcher.stop()
 
@@ -55,13 +62,20 @@ class TestStoryGenerationDriver(unittest.TestCase):
         # Verify pubsub subscriptions were set up
         self.mock_pubsub.subscribe.assert_any_call(
             EventType.CONVERSATION_STARTED,
-            self.driver._handle_conversation_started
+            StoryGenerationDriver._route_conversation_started
         )
         self.mock_pubsub.subscribe.assert_any_call(
             EventType.STORY_INFO_RECEIVED,
-            self.driver._handle_story_info_received
+            StoryGenerationDriver._route_story_info_received
         )
 
+    def test_drivers_share_one_subscription_per_pubsub(self):
+        """Test that further drivers on the same pubsub do not subscribe again."""
+        StoryGenerationDriver(query_dispatcher=self.mock_query_dispatcher)
+        StoryGenerationDriver(query_dispatcher=self.mock_query_dispatcher, user_id="user_a")
+
+        self.assertEqual(self.mock_pubsub.subscribe.call_count, 2)
+
     def test_start_story_gathering(self):
         """Test starting the story gathering process."""
         # Start story gathering
@@ -71,11 +85,117 @@ class TestStoryGenerationDriver(unittest.TestCase):
         self.assertEqual(self.driver.state, StoryGenerationState.GATHERING_STORY_IDEA)
 
         # Verify event was published
+        flush_published_events()
         self.mock_pubsub.publish.assert_called_once()
         event = self.mock_pubsub.publish.call_args[0][0]
         self.assertEqual(event.event_type, EventType.STORY_INFO_NEEDED)
         self.assertEqual(event.data['info_type'], StoryInfoType.STORY_IDEA)
         self.assertEqual(event.target, "test_user_123")
+        self.assertEqual(event.data['current_state'], "gathering_story_idea")
+
+    def test_nested_publish_is_queued_until_dispatch_returns(self):
+        """Test that events published during dispatch are pumped after it returns."""
+        dispatch_log = []
+        follow_up = Event(
+            event_type=EventType.STORY_INFO_NEEDED,
+            data={"info_type": "follow_up"},
+            source="test",
+        )
+
+        def publish(event):
+            dispatch_log.append(("start", event.data["info_type"]))
+            if event is not follow_up:
+                # A subscriber reacting to the first event publishes another one
+                self.driver._publish(follow_up)
+            dispatch_log.append(("end", event.data["info_type"]))
+
+        self.mock_pubsub.publish.side_effect = publish
+
+        self.driver._request_story_idea()
+        flush_published_events()
+
+        self.assertEqual(dispatch_log, [
+            ("start", StoryInfoType.STORY_IDEA),
+            ("end", StoryInfoType.STORY_IDEA),
+            ("start", "follow_up"),
+            ("end", "follow_up"),
+        ])
+
+    def test_repeated_story_info_requests_are_coalesced(self):
+        """Test that identical story info requests queued back to back publish once."""
+        started = threading.Event()
+        release = threading.Event()
+        blocker = Event(event_type=EventType.TTV_PROCESS_STARTED, data={}, source="test")
+
+        def publish(event):
+            if event is blocker:
+                started.set()
+                release.wait(timeout=5)
+
+        self.mock_pubsub.publish.side_effect = publish
+
+        # Hold the publisher on one event so the requests queue up behind it
+        self.driver._publish(blocker)
+        self.assertTrue(started.wait(timeout=5))
+        self.driver._request_story_idea()
+        self.driver._request_story_idea()
+        self.driver._request_artistic_style()
+        release.set()
+        flush_published_events()
+
+        published = [call[0][0] for call in self.mock_pubsub.publish.call_args_list]
+        self.assertEqual(
+            [event.data.get("info_type") for event in published[1:]],
+            [StoryInfoType.STORY_IDEA, StoryInfoType.ARTISTIC_STYLE],
+        )
+
+    def test_slow_subscriber_does_not_hold_up_other_users(self):
+        """Test that each user's events are published without waiting on other users."""
+        started = threading.Event()
+        release = threading.Event()
+        delivered = threading.Event()
+        blocker = Event(event_type=EventType.TTV_PROCESS_STARTED, data={}, source="test")
+        other = Event(event_type=EventType.TTV_PROCESS_STARTED, data={}, source="test")
+
+        def publish(event):
+            if event is blocker:
+                started.set()
+                release.wait(timeout=5)
+            elif event is other:
+                delivered.set()
+
+        self.mock_pubsub.publish.side_effect = publish
+
+        driver_a = StoryGenerationDriver(self.mock_query_dispatcher, user_id="slow_user")
+        driver_b = StoryGenerationDriver(self.mock_query_dispatcher, user_id="other_user")
+        try:
+            driver_a._publish(blocker)
+            self.assertTrue(started.wait(timeout=5))
+            driver_b._publish(other)
+            self.assertTrue(delivered.wait(timeout=5))
+        finally:
+            release.set()
+            release_story_generation_driver("slow_user")
+            release_story_generation_driver("other_user")
+
+    def test_released_publisher_publishes_late_events_directly(self):
+        """Test that events published after a user's driver is released are not queued."""
+        driver = StoryGenerationDriver(self.mock_query_dispatcher, user_id="released_user")
+        publisher = driver._publisher
+        first = Event(event_type=EventType.TTV_PROCESS_STARTED, data={}, source="test")
+        late = Event(event_type=EventType.TTV_PROCESS_COMPLETED, data={}, source="test")
+
+        driver._publish(first)
+        thread = publisher._thread
+        release_story_generation_driver("released_user")
+        driver._publish(late)
+
+        # The late event is published before _publish returns, without a new thread
+        self.mock_pubsub.publish.assert_any_call(late)
+        self.assertIs(publisher._thread, thread)
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+        self.mock_pubsub.publish.assert_any_call(first)
 
     def test_handle_conversation_started(self):
         """Test handling a conversation started event."""
@@ -98,13 +218,18 @@ class TestStoryGenerationDriver(unittest.TestCase):
         # Mock the timestamped directory
         mock_get_dir.return_value = tempfile.mkdtemp()
 
-        # Set up the query dispatcher to return mock responses
-        self.mock_query_dispatcher.send_query.side_effect = [
-            "Scene 1\nScene 2\nScene 3\nScene 4\nScene 5",  # Story scenes
-            "The Epic Journey",  # Title
-            # Add this third response for the artistic style processing
-            "Visual style: fantasy\nBackground music: epic orchestral\nClosing credits: gentle piano"
-        ]
+        # Set up the query dispatcher to answer each prompt; the style fields
+        # are queried concurrently, so responses are matched by prompt content
+        responses = {
+            "create a short story": "Scene 1\nScene 2\nScene 3\nScene 4\nScene 5",
+            "catchy title": "The Epic Journey",
+            "visual style for images": "fantasy",
+            "background music": "epic orchestral",
+            "closing credits": "gentle piano",
+        }
+        self.mock_query_dispatcher.send_query.side_effect = lambda prompt: next(
+            response for key, response in responses.items() if key in prompt
+        )
 
         # Start with story idea
         self.driver.state = StoryGenerationState.GATHERING_STORY_IDEA
@@ -128,10 +253,11 @@ class TestStoryGenerationDriver(unittest.TestCase):
         self.assertEqual(self.driver.state, StoryGenerationState.GATHERING_ARTISTIC_STYLE)
 
         # Verify story info was processed
-        self.assertEqual(len(self.driver.story_info['story']), 5)
-        self.assertEqual(self.driver.story_info['title'], "The Epic Journey")
+        self.assertEqual(len(self.driver.story_info.story), 5)
+        self.assertEqual(self.driver.story_info.title, "The Epic Journey")
 
         # Verify artistic style request was published
+        flush_published_events()
         self.mock_pubsub.publish.assert_called()
         style_request = self.mock_pubsub.publish.call_args[0][0]
         self.assertEqual(style_request.event_type, EventType.STORY_INFO_NEEDED)
@@ -152,8 +278,10 @@ class TestStoryGenerationDriver(unittest.TestCase):
             target="test_user_123"
         )
 
-        # Mock the open function for config file writing
-        with patch('builtins.open', unittest.mock.mock_open()) as mock_open:
+        # Mock the open function for config file writing, and keep the TTV thread
+        # from racing the state assertions below
+        with patch('builtins.open', unittest.mock.mock_open()) as mock_open, \
+                patch.object(self.driver, '_run_ttv_process'):
             # Handle the event
             self.driver._handle_story_info_received(style_event)
 
@@ -161,18 +289,171 @@ class TestStoryGenerationDriver(unittest.TestCase):
             self.assertEqual(self.driver.state, StoryGenerationState.RUNNING_TTV)
 
             # Verify style info was processed
-            self.assertEqual(self.driver.story_info['style'], "fantasy")
-            self.assertEqual(self.driver.story_info['background_music']['prompt'], "epic orchestral")
-            self.assertEqual(self.driver.story_info['closing_credits']['prompt'], "gentle piano")
+            self.assertEqual(self.driver.story_info.style, "fantasy")
+            self.assertEqual(self.driver.story_info.background_music.prompt, "epic orchestral")
+            self.assertEqual(self.driver.story_info.closing_credits.prompt, "gentle piano")
+            self.assertEqual(self.mock_query_dispatcher.send_query.call_count, 5)
 
             # Verify config file was written
+            self.assertTrue(self.driver._config_written.wait(timeout=5))
             mock_open.assert_called()
 
             # Verify TTV process started event was published
+            flush_published_events()
             self.mock_pubsub.publish.assert_called()
             ttv_start_event = self.mock_pubsub.publish.call_args[0][0]
             self.assertEqual(ttv_start_event.event_type, EventType.TTV_PROCESS_STARTED)
 
+    def test_streamed_scenes_stop_reading_after_last_scene(self):
+        """Test that streamed scenes are taken line by line and the stream is abandoned."""
+        chunks_read = []
+
+        class StreamingDispatcher:
+            def send_query_stream(self, prompt):
+                for chunk in ["Scene 1\nSce", "ne 2\n\nScene 3\n", "Scene 4\nScene 5\n",
+                              "Scene 6\n", "Scene 7"]:
+                    chunks_read.append(chunk)
+                    yield chunk
+
+            def send_query(self, prompt):
+                return "The Epic Journey\n"
+
+        self.driver.query_dispatcher = StreamingDispatcher()
+
+        self.driver._process_story_idea("A hero's journey through a magical land")
+
+        self.assertEqual(
+            self.driver.story_info.story,
+            ["Scene 1", "Scene 2", "Scene 3", "Scene 4", "Scene 5"],
+        )
+        self.assertEqual(self.driver.story_info.title, "The Epic Journey")
+        self.assertNotIn("Scene 7", chunks_read)
+
+    def test_cached_scenes_normalized_like_live_responses(self):
+        """Test that a cached raw scene response is stripped and filtered like a live one."""
+        idea = "A hero's journey through a magical land"
+
+        class StreamingDispatcher:
+            def send_query_stream(self, prompt):
+                raise AssertionError("cached scenes should not be queried")
+
+            def send_query(self, prompt):
+                return "The Epic Journey\n"
+
+        self.driver.query_dispatcher = StreamingDispatcher()
+        self.driver.query_cache.put(
+            "story", idea, "  Scene 1\n\n Scene 2 \n\nScene 3\nScene 4\nScene 5\nScene 6\n"
+        )
+
+        self.driver._process_story_idea(idea)
+
+        self.assertEqual(
+            self.driver.story_info.story,
+            ["Scene 1", "Scene 2", "Scene 3", "Scene 4", "Scene 5"],
+        )
+
+    def test_artistic_style_reused_for_repeated_answer(self):
+        """Test that style fragments cached for the same answer skip the LLM query."""
+        answer = "dark fantasy visuals with epic orchestral music and gentle piano credits"
+        cache = self.driver.query_cache
+        cache.put("visual_style", answer, "dark fantasy")
+        cache.put("background_music", answer, "epic orchestral")
+        cache.put("closing_credits", answer, "gentle piano")
+
+        self.driver._process_artistic_style(answer.upper())
+
+        self.mock_query_dispatcher.send_query.assert_not_called()
+        self.assertEqual(self.driver.story_info.style, "dark fantasy")
+        self.assertEqual(self.driver.story_info.background_music.prompt, "epic orchestral")
+        self.assertEqual(self.driver.story_info.closing_credits.prompt, "gentle piano")
+
+    def _cache_watercolor_styles(self):
+        """Cache the styles extracted from a watercolor answer."""
+        answer = "watercolor painting with sad piano music and upbeat jazz for the credits"
+        cache = self.driver.query_cache
+        cache.put("visual_style", answer, "watercolor painting")
+        cache.put("background_music", answer, "sad piano")
+        cache.put("closing_credits", answer, "upbeat jazz")
+
+    def test_artistic_style_with_changed_visual_style_is_queried(self):
+        """Test that a new visual style is not answered from another answer's fragments."""
+        self._cache_watercolor_styles()
+        self.mock_query_dispatcher.send_query.return_value = "anime"
+
+        self.driver._process_artistic_style(
+            "anime style with sad piano music and upbeat jazz for the credits"
+        )
+
+        self.assertEqual(self.mock_query_dispatcher.send_query.call_count, 3)
+        self.assertEqual(self.driver.story_info.style, "anime")
+
+    def test_artistic_style_with_changed_music_is_queried(self):
+        """Test that new background music is not answered from another answer's fragments."""
+        self._cache_watercolor_styles()
+        self.mock_query_dispatcher.send_query.return_value = "heavy metal"
+
+        self.driver._process_artistic_style(
+            "watercolor painting with heavy metal music and upbeat jazz for the credits"
+        )
+
+        self.assertEqual(self.mock_query_dispatcher.send_query.call_count, 3)
+        self.assertEqual(self.driver.story_info.background_music.prompt, "heavy metal")
+
+    def test_artistic_style_queries_only_uncached_fields(self):
+        """Test that only style fields missing from the cache are sent to the LLM."""
+        answer = "noir visuals with smoky jazz music and a slow blues for the credits"
+        self.driver.query_cache.put("visual_style", answer, "film noir")
+        self.driver.query_cache.put("background_music", answer, "smoky jazz")
+        self.mock_query_dispatcher.send_query.return_value = " slow blues \n"
+
+        self.driver._process_artistic_style(answer)
+
+        self.mock_query_dispatcher.send_query.assert_called_once()
+        self.assertIn("closing credits", self.mock_query_dispatcher.send_query.call_args[0][0])
+        self.assertEqual(self.driver.story_info.style, "film noir")
+        self.assertEqual(self.driver.story_info.closing_credits.prompt, "slow blues")
+
+    def test_artistic_style_strips_echoed_labels(self):
+        """Test that a label echoed ahead of a style is dropped from the value."""
+        answer = "watercolor art with lo-fi beats"
+        self.driver.query_cache.put("visual_style", answer, "watercolor")
+        self.driver.query_cache.put("background_music", answer, "lo-fi beats")
+        self.mock_query_dispatcher.send_query.return_value = "Closing credits: soft ukulele"
+
+        self.driver._process_artistic_style(answer)
+
+        self.assertEqual(self.driver.story_info.closing_credits.prompt, "soft ukulele")
+        self.assertEqual(self.driver.query_cache.get("closing_credits", answer), "soft ukulele")
+
+    def test_story_info_in_unexpected_state_is_ignored(self):
+        """Test that story info received while not gathering leaves the state alone."""
+        self.driver.state = StoryGenerationState.RUNNING_TTV
+        event = Event(
+            event_type=EventType.STORY_INFO_RECEIVED,
+            data={"user_response": "More ideas", "is_valid": True},
+            source="conversation",
+            target="test_user_123"
+        )
+
+        self.driver._handle_story_info_received(event)
+
+        self.assertEqual(self.driver.state, StoryGenerationState.RUNNING_TTV)
+        self.mock_query_dispatcher.send_query.assert_not_called()
+        flush_published_events()
+        self.mock_pubsub.publish.assert_not_called()
+
+    @patch('ganglia_studio.story.story_generation_driver.get_timestamped_ttv_dir')
+    def test_generate_config_file_writes_story_info(self, mock_get_dir):
+        """Test that the config file is written in the background with the story info."""
+        mock_get_dir.return_value = tempfile.mkdtemp()
+        self.driver.story_info.title = "The Epic Journey"
+
+        self.driver._generate_config_file()
+
+        self.assertTrue(self.driver._config_written.wait(timeout=5))
+        with open(self.driver.config_path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), asdict(self.driver.story_info))
+
     def test_invalid_story_info(self):
         """Test handling invalid story information."""
         # Start with story idea
@@ -197,6 +478,7 @@ class TestStoryGenerationDriver(unittest.TestCase):
         self.assertEqual(self.driver.state, StoryGenerationState.CANCELLED)
 
         # Verify cancellation event was published
+        flush_published_events()
         self.mock_pubsub.publish.assert_called_once()
         cancel_event = self.mock_pubsub.publish.call_args[0][0]
         self.assertEqual(cancel_event.event_type, EventType.STORY_INFO_NEEDED)
@@ -231,6 +513,7 @@ class TestStoryGenerationDriver(unittest.TestCase):
         self.assertEqual(self.driver.state, StoryGenerationState.COMPLETED)
 
         # Verify completion event was published
+        flush_published_events()
         self.mock_pubsub.publish.assert_called_once()
         complete_event = self.mock_pubsub.publish.call_args[0][0]
         self.assertEqual(complete_event.event_type, EventType.TTV_PROCESS_COMPLETED)
@@ -257,6 +540,7 @@ class TestStoryGenerationDriver(unittest.TestCase):
         self.assertEqual(self.driver.state, StoryGenerationState.FAILED)
 
         # Verify failure event was published
+        flush_published_events()
         self.mock_pubsub.publish.assert_called_once()
         fail_event = self.mock_pubsub.publish.call_args[0][0]
         self.assertEqual(fail_event.event_type, EventType.TTV_PROCESS_FAILED)
@@ -274,6 +558,42 @@ class TestStoryGenerationDriver(unittest.TestCase):
         # Verify the instance has the expected type
         self.assertIsInstance(instance1, StoryGenerationDriver)
 
+    def test_per_user_drivers(self):
+        """Test that each user gets a dedicated driver that keeps its user ID."""
+        driver_a = get_story_generation_driver(self.mock_query_dispatcher, user_id="user_a")
+        driver_b = get_story_generation_driver(self.mock_query_dispatcher, user_id="user_b")
+        try:
+            self.assertIsNot(driver_a, driver_b)
+            self.assertIs(get_story_generation_driver(user_id="user_a"), driver_a)
+            self.assertIs(driver_a.query_cache, driver_b.query_cache)
+
+            # Another user's conversation must not re-target a dedicated driver
+            driver_a._handle_conversation_started(Event(
+                event_type=EventType.CONVERSATION_STARTED,
+                data={"user_id": "user_b"},
+                source="conversation"
+            ))
+            self.assertEqual(driver_a.user_id, "user_a")
+
+            # Story info targeted at a user is routed to that user's driver only
+            with patch.object(driver_a, "_handle_story_info_received") as handler_a, \
+                    patch.object(driver_b, "_handle_story_info_received") as handler_b:
+                event = Event(
+                    event_type=EventType.STORY_INFO_RECEIVED,
+                    data={"info_type": StoryInfoType.STORY_IDEA, "user_response": "idea"},
+                    source="conversation",
+                    target="user_a"
+                )
+                StoryGenerationDriver._route_story_info_received(event)
+            handler_a.assert_called_once_with(event)
+            handler_b.assert_not_called()
+        finally:
+            release_story_generation_driver("user_a")
+            release_story_generation_driver("user_b")
+
+        self.assertIsNot(get_story_generation_driver(user_id="user_a"), driver_a)
+        release_story_generation_driver("user_a")
+
 
 if __name__ == "__main__":
     unittest.main()
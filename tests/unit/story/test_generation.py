@@ -1,10 +1,17 @@
 import json
+import os
+import sys
+import tempfile
 import unittest
 from unittest.mock import MagicMock, Mock, patch
 
 from ganglia_common.utils.file_utils import get_timestamped_ttv_dir
 
 from ganglia_studio.video.story_generation import (
+    MAX_RETRY_WAIT,
+    _dumps_json,
+    _loads_json,
+    _retry_delay,
     filter_text,
     generate_filtered_story,
     generate_movie_poster,
@@ -104,19 +111,55 @@ class TestStoryGeneration(unittest.TestCase):
 
     @patch('requests.get')
     def test_save_image_without_caption(self, mock_get):
-        # Mock successful response
-        mock_response = Mock()
+        # Mock successful streamed response
+        mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.content = b"fake image content"
-        mock_get.return_value = mock_response
-
-        test_filename = "/tmp/test_image.png"
+        mock_response.iter_content.return_value = [b"fake image ", b"content"]
+        mock_get.return_value.__enter__.return_value = mock_response
 
-        with patch('builtins.open', unittest.mock.mock_open()) as mock_file:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            test_filename = os.path.join(temp_dir, "posters", "test_image.png")
             save_image_without_caption("http://example.com/image.png", test_filename)
-            mock_get.assert_called_once_with("http://example.com/image.png", timeout=30)
-            mock_file.assert_any_call(test_filename, 'wb')
-            mock_file().write.assert_any_call(b"fake image content")
+
+            mock_get.assert_called_once_with(
+                "http://example.com/image.png", stream=True, timeout=30
+            )
+            with open(test_filename, "rb") as saved:
+                self.assertEqual(saved.read(), b"fake image content")
+    def test_json_helpers_match_without_orjson(self):
+        story = {"style": "noir", "title": "Café Nights", "story": "Rain on the “neon”"}
+        encoded = _dumps_json(story)
+        self.assertEqual(_loads_json(encoded), story)
+
+        # The stdlib fallback writes the same compact text as orjson
+        with patch.dict(sys.modules, {"orjson": None}):
+            self.assertEqual(_dumps_json(story), encoded)
+            self.assertEqual(_loads_json(encoded), story)
+
+    def test_retry_delay_is_jittered_and_capped(self):
+        for attempt in range(5):
+            for _ in range(50):
+                delay = _retry_delay(attempt, 2.0)
+                self.assertGreaterEqual(delay, min(2.0, MAX_RETRY_WAIT))
+                self.assertLessEqual(delay, min(2.0 * 3**attempt, MAX_RETRY_WAIT))
+
+        # A long base wait is capped on every attempt
+        self.assertEqual(_retry_delay(0, 60.0), MAX_RETRY_WAIT)
+        self.assertEqual(_retry_delay(0, 0.0), 0.0)
+
+    @patch('ganglia_studio.video.story_generation.time.sleep')
+    def test_filter_text_retries_with_capped_wait(self, mock_sleep):
+        self.query_dispatcher.send_query.side_effect = [Exception("busy"), "filtered"]
+
+        result = filter_text(
+            "A robot learns about emotions",
+            query_dispatcher=self.query_dispatcher,
+            wait_time=60.0,
+        )
+
+        self.assertEqual(result, {"text": "filtered"})
+        mock_sleep.assert_called_once_with(MAX_RETRY_WAIT)
+
 
 if __name__ == '__main__':
     unittest.main()
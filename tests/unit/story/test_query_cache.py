@@ -0,0 +1,108 @@
+"""Unit tests for the query cache used by the story generation driver."""
+
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from ganglia_studio.story.query_cache import QueryCache
+
+
+def test_same_words_hit_cache():
+    """An input differing only in case and punctuation reuses the cached response."""
+    dispatcher = MagicMock()
+    dispatcher.send_query.return_value = "Scene 1\nScene 2"
+    cache = QueryCache()
+
+    first = cache.query(dispatcher, "story", "A hero's journey through a magical land", "p1")
+    second = cache.query(dispatcher, "story", "a hero's journey through a magical land!", "p2")
+
+    assert first == second == "Scene 1\nScene 2"
+    dispatcher.send_query.assert_called_once_with("p1")
+
+
+def test_different_input_or_kind_misses_cache():
+    """Unrelated inputs and other query kinds are sent to the dispatcher."""
+    dispatcher = MagicMock()
+    dispatcher.send_query.side_effect = ["story a", "story b", "style a"]
+    cache = QueryCache()
+
+    cache.query(dispatcher, "story", "A knight fights a dragon", "p1")
+    assert cache.query(dispatcher, "story", "A robot learns to paint", "p2") == "story b"
+    assert cache.query(dispatcher, "style", "A knight fights a dragon", "p3") == "style a"
+    assert dispatcher.send_query.call_count == 3
+
+
+def test_input_differing_in_one_word_misses_cache():
+    """Inputs that change a single word are sent to the dispatcher, not served cached."""
+    dispatcher = MagicMock()
+    dispatcher.send_query.side_effect = ["chicago scenes", "paris scenes", "village", "princess"]
+    cache = QueryCache()
+
+    cache.query(dispatcher, "story", "A jazz singer falls in love in 1920s chicago", "p1")
+    paris = cache.query(dispatcher, "story", "A jazz singer falls in love in 1920s paris", "p2")
+    cache.query(dispatcher, "story", "A young farmer sets out on a quest to save the village", "p3")
+    princess = cache.query(
+        dispatcher, "story", "A young farmer sets out on a quest to save the princess", "p4"
+    )
+
+    assert (paris, princess) == ("paris scenes", "princess")
+    assert dispatcher.send_query.call_count == 4
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Entries beyond max_entries are evicted oldest-first."""
+    cache = QueryCache(max_entries=2)
+    cache.put("story", "first idea", "one")
+    cache.put("story", "second idea", "two")
+    assert cache.get("story", "first idea") == "one"
+
+    cache.put("story", "third idea", "three")
+
+    assert cache.get("story", "second idea") is None
+    assert cache.get("story", "first idea") == "one"
+    assert cache.get("story", "third idea") == "three"
+
+
+def test_entries_persist_across_instances(tmp_path):
+    """A cache with a path reloads entries saved by an earlier instance."""
+    path = str(tmp_path / "cache.json")
+    cache = QueryCache(path)
+    cache.put("title", "Scene 1 Scene 2", "The Epic Journey")
+    cache.flush()
+
+    assert QueryCache(path).get("title", "scene 1 scene 2") == "The Epic Journey"
+
+
+@pytest.mark.parametrize(
+    "stored",
+    [{"story": "scenes"}, [["story", "idea"]], [["story", "idea", None]], "scenes"],
+)
+def test_malformed_cache_file_is_ignored(tmp_path, stored):
+    """A cache file that parses but has the wrong shape is treated as unreadable."""
+    path = tmp_path / "cache.json"
+    path.write_text(json.dumps(stored), encoding="utf-8")
+    cache = QueryCache(str(path))
+
+    assert cache.get("story", "idea") is None
+    cache.put("story", "idea", "scenes")
+    assert cache.get("story", "idea") == "scenes"
+
+
+def test_puts_are_written_together_after_flush_delay(tmp_path):
+    """Puts only mark the cache changed; one delayed flush writes them all."""
+    path = tmp_path / "cache.json"
+    cache = QueryCache(str(path), flush_delay=0.2)
+    cache.put("visual_style", "noir", "film noir")
+    cache.put("background_music", "noir", "smoky jazz")
+
+    assert not path.exists()
+    deadline = time.monotonic() + 5
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    reloaded = QueryCache(str(path))
+    assert reloaded.get("visual_style", "noir") == "film noir"
+    assert reloaded.get("background_music", "noir") == "smoky jazz"
+    assert not (tmp_path / "cache.json.tmp").exists()
@@ -1,13 +1,21 @@
 """Unit tests for color utilities."""
 
+from colorsys import hsv_to_rgb, rgb_to_hsv
+
 import numpy as np
 import pytest
 
+from ganglia_studio.video import color_utils
 from ganglia_studio.video.color_utils import (
+    get_average_color,
+    get_closest_palette_color,
     get_color_complement,
     get_contrasting_color,
+    get_contrasting_colors_batch,
+    get_vibrant_complements,
     get_vibrant_palette,
     mix_colors,
+    mix_colors_batch,
 )
 
 
@@ -15,8 +23,9 @@ def test_get_vibrant_palette():
     """Test vibrant color palette generation."""
     palette = get_vibrant_palette()
 
-    # Should return a list
-    assert isinstance(palette, list)
+    # Should return a shared, immutable tuple
+    assert isinstance(palette, tuple)
+    assert get_vibrant_palette() is palette
 
     # Should have multiple colors
     assert len(palette) > 0
@@ -50,6 +59,46 @@ def test_get_color_complement():
     assert isinstance(complement, tuple)
 
 
+def _colorsys_complement(color):
+    """Reference complement that rotates the hue through colorsys."""
+    h, s, v = rgb_to_hsv(*(x / 255.0 for x in color))
+    r, g, b = hsv_to_rgb((h + 0.5) % 1.0, s, v)
+    return (int(r * 255), int(g * 255), int(b * 255))
+
+
+def test_get_color_complement_matches_hsv_rotation():
+    """The closed form should match an HSV hue rotation up to float truncation."""
+    rng = np.random.default_rng(0)
+    for color in rng.integers(0, 256, size=(500, 3)).tolist():
+        complement = get_color_complement(tuple(color))
+        reference = _colorsys_complement(color)
+        assert all(abs(a - b) <= 1 for a, b in zip(complement, reference, strict=True))
+
+    # Grays have no hue and are their own complement
+    assert get_color_complement((128, 128, 128)) == (128, 128, 128)
+
+
+def test_get_vibrant_complements():
+    """Precomputed complements should match complementing each palette color."""
+    complements = get_vibrant_complements()
+
+    assert complements == tuple(get_color_complement(c) for c in get_vibrant_palette())
+
+
+def test_get_closest_palette_color():
+    """The closest palette color should minimize the L1 distance, first one on ties."""
+    palette = get_vibrant_palette()
+    for color in palette:
+        assert get_closest_palette_color(color) == color
+
+    rng = np.random.default_rng(0)
+    for color in rng.integers(0, 256, size=(100, 3)).tolist():
+        distances = [
+            sum(abs(a - b) for a, b in zip(color, entry, strict=True)) for entry in palette
+        ]
+        assert get_closest_palette_color(tuple(color)) == palette[distances.index(min(distances))]
+
+
 def test_mix_colors():
     """Test color mixing."""
     red = (255, 0, 0)
@@ -72,6 +121,26 @@ def test_mix_colors():
     assert mixed_blue[2] > mixed_blue[0]
 
 
+def test_mix_colors_batch_matches_mix_colors():
+    """Batch mixing should give mix_colors' result for every pair."""
+    rng = np.random.default_rng(0)
+    colors1 = rng.integers(0, 256, size=(200, 3), dtype=np.uint8)
+    colors2 = rng.integers(0, 256, size=(200, 3), dtype=np.uint8)
+
+    for ratio in (0.0, 0.2, 0.5, 0.8, 1.0):
+        mixed = mix_colors_batch(colors1, colors2, ratio)
+        assert mixed.dtype == np.uint8
+        expected = [
+            mix_colors(tuple(c1), tuple(c2), ratio)
+            for c1, c2 in zip(colors1.tolist(), colors2.tolist(), strict=True)
+        ]
+        assert mixed.tolist() == [list(color) for color in expected]
+
+    # A single secondary color broadcasts across the batch
+    mixed = mix_colors_batch(colors1, (0, 0, 0), 0.5)
+    assert mixed.tolist() == (colors1 // 2).tolist()
+
+
 def test_get_contrasting_color_dark_background():
     """Test contrasting color selection for dark backgrounds."""
     # Create a dark frame (black)
@@ -117,3 +186,83 @@ def test_get_contrasting_color_red_background():
     assert isinstance(text_color, tuple)
     assert isinstance(stroke_color, tuple)
 
+
+def test_get_average_color_matches_numpy_mean():
+    """The 8-bit ROI mean should truncate to the same channels as np.mean."""
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, size=(120, 160, 3), dtype=np.uint8)
+    roi_region = frame[15:95, 30:110]
+
+    expected = tuple(int(value) for value in np.mean(roi_region, axis=(0, 1)))
+    assert get_average_color(roi_region) == expected
+    assert get_average_color(roi_region.astype(np.float32)) == expected
+
+
+@pytest.mark.parametrize(
+    ("background", "expected"),
+    [
+        ((230, 40, 40), ((205, 255, 255), (68, 85, 85))),
+        ((150, 40, 40), ((231, 255, 255), (77, 85, 85))),
+        ((40, 90, 40), ((255, 205, 255), (85, 68, 85))),
+        ((150, 240, 150), ((255, 205, 255), (85, 68, 85))),
+        ((20, 20, 80), ((255, 255, 255), (85, 85, 85))),
+        ((230, 230, 250), ((0, 0, 0), (255, 255, 255))),
+    ],
+)
+def test_get_contrasting_color_palette_lookup(background, expected):
+    """Each background class should map to its fixed text and stroke pair."""
+    frame = np.full((20, 20, 3), background, dtype=np.uint8)
+
+    assert get_contrasting_color(frame, (0, 0, 20, 20)) == expected
+
+
+def test_get_contrasting_colors_batch_matches_per_frame():
+    """Batched classification should match get_contrasting_color frame by frame."""
+    rng = np.random.default_rng(0)
+    backgrounds = rng.integers(0, 256, size=(64, 3), dtype=np.uint8)
+    frames = np.broadcast_to(backgrounds[:, None, None, :], (64, 40, 60, 3)).copy()
+    roi = (5, 10, 30, 20)
+
+    expected = [get_contrasting_color(frame, roi) for frame in frames]
+    assert get_contrasting_colors_batch(frames, roi) == expected
+    assert get_contrasting_colors_batch(list(frames), roi) == expected
+    assert get_contrasting_colors_batch(frames[:0], roi) == []
+
+
+def test_get_contrasting_color_brightness_threshold_is_exact():
+    """A background at exactly 128 brightness counts as light, with no float rounding."""
+    # 0.299 * 24 + 0.587 * 160 + 0.114 * 236 is exactly 128
+    frame = np.full((4, 4, 3), (24, 160, 236), dtype=np.uint8)
+
+    assert get_contrasting_color(frame, (0, 0, 4, 4)) == ((0, 0, 0), (255, 255, 255))
+    assert get_contrasting_colors_batch(frame[None], (0, 0, 4, 4)) == [((0, 0, 0), (255, 255, 255))]
+
+
+def test_get_contrasting_color_returns_shared_pairs():
+    """Frames of the same class should get the same preallocated color pair object."""
+    first = np.full((10, 10, 3), (20, 20, 80), dtype=np.uint8)
+    second = np.full((10, 10, 3), (10, 30, 60), dtype=np.uint8)
+
+    pair = get_contrasting_color(first, (0, 0, 10, 10))
+    assert get_contrasting_color(second, (0, 0, 10, 10)) is pair
+    assert get_contrasting_colors_batch(np.stack([first, second]), (0, 0, 10, 10))[1] is pair
+
+
+def test_batch_roi_sums_loop_matches_numpy():
+    """The batch ROI kernel's scalar loop should sum channels like NumPy."""
+    rng = np.random.default_rng(0)
+    frames = rng.integers(0, 256, size=(3, 12, 16, 4), dtype=np.uint8)
+
+    sums = color_utils._batch_roi_sums_loop(frames, 2, 10, 3, 15)
+    expected = frames[:, 2:10, 3:15, :3].sum(axis=(1, 2), dtype=np.int64)
+    np.testing.assert_array_equal(sums, expected)
+
+
+def test_get_contrasting_colors_batch_clips_roi_like_slicing():
+    """ROIs running past the frame edge should be clipped on every batch path."""
+    rng = np.random.default_rng(1)
+    frames = rng.integers(0, 256, size=(16, 30, 40, 3), dtype=np.uint8)
+    roi = (25, 20, 50, 50)
+
+    expected = [get_contrasting_color(frame, roi) for frame in frames]
+    assert get_contrasting_colors_batch(frames, roi) == expected
@@ -1,8 +1,12 @@
 """Unit tests for FFmpeg utilities."""
 
+import threading
+import time
+
 import pytest
 
 from ganglia_studio.utils.ffmpeg_utils import (
+    FFMPEG_THREAD_COUNT,
     FFmpegThreadManager,
     get_ffmpeg_thread_count,
     get_system_info,
@@ -41,20 +45,61 @@ def test_get_ffmpeg_thread_count():
         assert local_threads >= ci_threads
 
 
+def test_default_thread_count_is_precomputed_constant():
+    """Without an explicit CI flag the precomputed constant for this environment is used."""
+    assert get_ffmpeg_thread_count() == FFMPEG_THREAD_COUNT
+    assert FFMPEG_THREAD_COUNT >= 1
+
+
 def test_ffmpeg_thread_manager_context():
     """Test FFmpegThreadManager context manager."""
     manager = FFmpegThreadManager()
 
     # Initially no active operations
-    assert len(manager.active_operations) == 0
+    assert manager.active_count == 0
 
     # Enter context
     with manager:
         # Should have one active operation
-        assert len(manager.active_operations) == 1
+        assert manager.active_count == 1
 
     # After context exit, should be cleaned up
-    assert len(manager.active_operations) == 0
+    assert manager.active_count == 0
+
+
+def test_ffmpeg_thread_manager_counts_operation_for_whole_context():
+    """An operation stays registered until its context exits, however long it runs."""
+    manager = FFmpegThreadManager()
+    entered = threading.Event()
+    release = threading.Event()
+
+    def long_operation():
+        with manager:
+            entered.set()
+            release.wait(timeout=5)
+
+    worker = threading.Thread(target=long_operation)
+    worker.start()
+    assert entered.wait(timeout=5)
+    time.sleep(0.2)
+
+    assert manager.active_count == 1
+
+    release.set()
+    worker.join(timeout=5)
+    assert manager.active_count == 0
+
+
+def test_ffmpeg_thread_manager_failed_operation_unregisters_once():
+    """An operation that raises is unregistered once, leaving other operations counted."""
+    manager = FFmpegThreadManager()
+
+    with manager:
+        with pytest.raises(RuntimeError), manager:
+            raise RuntimeError("ffmpeg failed")
+        assert manager.active_count == 1
+
+    assert manager.active_count == 0
 
 
 def test_ffmpeg_thread_manager_get_threads():
@@ -84,6 +129,5 @@ def test_ffmpeg_thread_manager_cleanup():
 
     # Cleanup should remove all operations
     manager.cleanup()
-    assert len(manager.active_operations) == 0
-    assert manager.operation_queue.empty()
+    assert manager.active_count == 0
 
@@ -0,0 +1,48 @@
+"""Unit tests for video utilities."""
+
+import os
+import shutil
+
+from ganglia_studio.utils import video_utils
+
+
+def _fake_encode(video_path, duration, size, color):
+    """Stand in for ffmpeg by writing a small file."""
+    with open(video_path, "wb") as video_file:
+        video_file.write(bytes(color))
+    return video_path
+
+
+def test_cached_test_videos_share_one_temp_dir(monkeypatch):
+    """Cached encodes live in one temp dir and callers get copies they can delete."""
+    monkeypatch.setattr(video_utils, "_encode_test_video", _fake_encode)
+    monkeypatch.setattr(video_utils, "_test_video_cache", {})
+    cache_dir = video_utils._test_video_cache_dir()
+
+    first = video_utils.create_test_video(duration=1, size=(32, 32), color=(1, 2, 3))
+    second = video_utils.create_test_video(duration=1, size=(32, 32), color=(1, 2, 3))
+    try:
+        assert first != second
+        cached = list(video_utils._test_video_cache.values())
+        assert len(cached) == 1
+        assert os.path.dirname(cached[0]) == cache_dir
+    finally:
+        os.unlink(first)
+        os.unlink(second)
+
+
+def test_cached_test_video_reencoded_when_removed(monkeypatch):
+    """A cached encode deleted from disk is encoded again rather than copied."""
+    monkeypatch.setattr(video_utils, "_encode_test_video", _fake_encode)
+    monkeypatch.setattr(video_utils, "_test_video_cache", {})
+
+    first = video_utils.create_test_video(duration=1, size=(32, 32), color=(4, 5, 6))
+    os.unlink(first)
+    shutil.rmtree(video_utils._test_video_cache_dir())
+
+    second = video_utils.create_test_video(duration=1, size=(32, 32), color=(4, 5, 6))
+    try:
+        with open(second, "rb") as video_file:
+            assert video_file.read() == bytes((4, 5, 6))
+    finally:
+        os.unlink(second)
@@ -1,8 +1,15 @@
 """Tests for audio alignment functionality."""
 
 import os
+import subprocess
+import sys
 import threading
+import time
+import wave
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 import whisper
 
@@ -183,3 +190,300 @@ def test_thread_safe_model_loading(tmp_path):
         audio_alignment_module._whisper_state = original_whisper_state
         if os.path.exists(audio_path):
             os.remove(audio_path)
+
+
+def test_audio_duration_is_probed_once_per_file_version(tmp_path):
+    """Repeat duration lookups reuse one ffprobe run until the file changes."""
+    audio_path = tmp_path / "audio.wav"
+    audio_path.write_bytes(b"")
+    audio_alignment_module._probe_duration.cache_clear()
+
+    probe = subprocess.CompletedProcess(args=[], returncode=0, stdout="4.0\n")
+    with patch.object(audio_alignment_module.subprocess, "run", return_value=probe) as mock_run:
+        assert audio_alignment_module.get_audio_duration(str(audio_path)) == 4.0
+        timings = audio_alignment_module.create_evenly_distributed_timings(
+            str(audio_path), "one two"
+        )
+        captions = audio_alignment_module.create_evenly_distributed_captions(
+            str(audio_path), "one two three four"
+        )
+        assert mock_run.call_count == 1
+
+        os.utime(audio_path, (0, 0))
+        audio_alignment_module.get_audio_duration(str(audio_path))
+        assert mock_run.call_count == 2
+
+    assert [timing.end for timing in timings] == [2.0, 4.0]
+    assert [caption.end_time for caption in captions] == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_audio_duration_read_from_container_without_ffprobe(tmp_path):
+    """A readable container's duration comes from its header, without running ffprobe."""
+    pytest.importorskip("av")
+    audio_path = tmp_path / "tone.wav"
+    with wave.open(str(audio_path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(8000)
+        wav_file.writeframes(b"\0\0" * 12000)
+    audio_alignment_module._probe_duration.cache_clear()
+
+    with patch.object(audio_alignment_module.subprocess, "run") as mock_run:
+        duration = audio_alignment_module.get_audio_duration(str(audio_path))
+
+    assert duration == pytest.approx(1.5, abs=0.01)
+    mock_run.assert_not_called()
+
+
+def test_audio_durations_probe_a_batch_without_subprocesses(tmp_path):
+    """A batch of containers is probed in-process, one duration per path."""
+    pytest.importorskip("av")
+    paths = []
+    for index, frames in enumerate((4000, 16000)):
+        audio_path = tmp_path / f"tone{index}.wav"
+        with wave.open(str(audio_path), "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(8000)
+            wav_file.writeframes(b"\0\0" * frames)
+        paths.append(str(audio_path))
+    audio_alignment_module._probe_duration.cache_clear()
+
+    with patch.object(audio_alignment_module.subprocess, "run") as mock_run:
+        durations = audio_alignment_module.get_audio_durations(paths)
+
+    assert list(durations) == paths
+    assert durations[paths[0]] == pytest.approx(0.5, abs=0.01)
+    assert durations[paths[1]] == pytest.approx(2.0, abs=0.01)
+    mock_run.assert_not_called()
+
+
+def test_whisper_runs_in_half_precision_on_gpu(monkeypatch):
+    """On a CUDA host the model is loaded to the GPU in FP16 and transcribes with fp16."""
+    gpu_model = MagicMock()
+    gpu_model.transcribe.return_value = {
+        "segments": [{"words": [{"word": "hello", "start": 0.0, "end": 0.5}]}]
+    }
+    loaded_model = MagicMock()
+    loaded_model.half.return_value = gpu_model
+    gpu_model.eval.return_value = gpu_model
+    load_model = MagicMock(return_value=loaded_model)
+    monkeypatch.setattr(audio_alignment_module, "_whisper_device", lambda: "cuda")
+    monkeypatch.setattr(audio_alignment_module.whisper, "load_model", load_model)
+    monkeypatch.setattr(
+        audio_alignment_module, "_whisper_state", audio_alignment_module.WhisperModelState()
+    )
+
+    timings = audio_alignment_module.align_words_with_audio("audio.wav", "hello")
+
+    assert load_model.call_args.kwargs["device"] == "cuda"
+    assert gpu_model.transcribe.call_args.kwargs["fp16"] is True
+    assert [timing.text for timing in timings] == ["hello"]
+
+
+def test_faster_whisper_backend_returns_openai_shaped_result(monkeypatch):
+    """The faster-whisper backend loads int8 on the CPU and feeds the usual alignment path."""
+    word = SimpleNamespace(word=" hello", start=0.0, end=0.5)
+    segment = SimpleNamespace(text=" hello", start=0.0, end=0.5, words=[word])
+    ctranslate_model = MagicMock()
+    ctranslate_model.transcribe.return_value = (iter([segment]), None)
+    faster_whisper = SimpleNamespace(WhisperModel=MagicMock(return_value=ctranslate_model))
+    monkeypatch.setitem(sys.modules, "faster_whisper", faster_whisper)
+    monkeypatch.setenv("GANGLIA_WHISPER_BACKEND", "faster-whisper")
+    monkeypatch.setattr(audio_alignment_module, "_whisper_device", lambda: "cpu")
+    monkeypatch.setattr(
+        audio_alignment_module, "_whisper_state", audio_alignment_module.WhisperModelState()
+    )
+
+    timings = audio_alignment_module.align_words_with_audio("audio.wav", "hello")
+
+    assert faster_whisper.WhisperModel.call_args.kwargs["compute_type"] == "int8"
+    options = ctranslate_model.transcribe.call_args.kwargs
+    assert options["log_prob_threshold"] == -0.7
+    assert "logprob_threshold" not in options and "fp16" not in options
+    assert [(timing.text, timing.end) for timing in timings] == [("hello", 0.5)]
+
+
+def test_alignment_and_captions_share_one_transcription(tmp_path):
+    """Word alignment and captions for the same audio and text run Whisper once."""
+    audio_path = tmp_path / "speech.wav"
+    audio_path.write_bytes(b"")
+    text = "shared transcription for both paths"
+    model = audio_alignment_module.get_whisper_model("small")
+    audio_alignment_module._transcription_cache.clear()
+
+    with patch.object(model, "transcribe", wraps=model.transcribe) as transcribe:
+        word_timings = audio_alignment_module.align_words_with_audio(str(audio_path), text)
+        captions = audio_alignment_module.create_word_level_captions(str(audio_path), text)
+
+    assert transcribe.call_count == 1
+    assert [timing.text for timing in word_timings] == [caption.text for caption in captions]
+
+
+def _run_concurrent_transcriptions(model, tmp_path):
+    """Transcribe two files from two threads, returning the results."""
+    results = []
+
+    def transcribe(name):
+        results.append(
+            audio_alignment_module._transcribe_with_whisper(
+                model, str(tmp_path / name), "hi", "small"
+            )
+        )
+
+    threads = [threading.Thread(target=transcribe, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    return results
+
+
+def test_openai_whisper_transcriptions_take_turns(tmp_path):
+    """openai-whisper keeps per-call hooks on the shared model, so calls never overlap."""
+    active = 0
+    peak = 0
+    counter_lock = threading.Lock()
+
+    class SharedStateModel:
+        def transcribe(self, _audio_path, **_kwargs):
+            nonlocal active, peak
+            with counter_lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with counter_lock:
+                active -= 1
+            return {"segments": [{"words": [{"word": "hi", "start": 0.0, "end": 0.2}]}]}
+
+    results = _run_concurrent_transcriptions(SharedStateModel(), tmp_path)
+
+    assert len(results) == 2
+    assert peak == 1
+
+
+def test_faster_whisper_transcriptions_overlap_across_threads(tmp_path):
+    """faster-whisper models transcribe on two threads at once instead of queueing."""
+    both_transcribing = threading.Barrier(2, timeout=5)
+
+    def transcribe(_audio_path, **_kwargs):
+        both_transcribing.wait()  # Raises BrokenBarrierError if calls are serialized
+        return {"segments": [{"words": [{"word": "hi", "start": 0.0, "end": 0.2}]}]}
+
+    model = audio_alignment_module.FasterWhisperModel.__new__(
+        audio_alignment_module.FasterWhisperModel
+    )
+    model.transcribe = transcribe
+
+    results = _run_concurrent_transcriptions(model, tmp_path)
+
+    assert len(results) == 2
+
+
+def test_encoder_compiled_and_warmed_up_when_enabled(monkeypatch):
+    """With GANGLIA_WHISPER_COMPILE set, the encoder is compiled and run once at load."""
+    model = MagicMock()
+    model.eval.return_value = model
+    eager_encoder = model.encoder
+    compiled_encoder = MagicMock()
+    monkeypatch.setenv("GANGLIA_WHISPER_COMPILE", "true")
+    monkeypatch.setattr(audio_alignment_module.whisper, "load_model", lambda *_a, **_k: model)
+    monkeypatch.setattr(
+        audio_alignment_module.torch, "compile", MagicMock(return_value=compiled_encoder),
+        raising=False,
+    )
+    monkeypatch.setattr(audio_alignment_module.torch, "zeros", MagicMock(), raising=False)
+    monkeypatch.setattr(
+        audio_alignment_module.whisper, "audio", SimpleNamespace(N_FRAMES=3000), raising=False
+    )
+
+    loaded = audio_alignment_module._load_whisper_model("small", "cpu")
+
+    audio_alignment_module.torch.compile.assert_called_once_with(
+        eager_encoder, mode="default", dynamic=False
+    )
+    assert loaded.encoder is compiled_encoder
+    compiled_encoder.assert_called_once()
+
+
+def test_encoder_left_eager_when_compile_fails(monkeypatch):
+    """A failed compile keeps the eager encoder so transcription still works."""
+    model = MagicMock()
+    model.eval.return_value = model
+    eager_encoder = model.encoder
+    monkeypatch.setenv("GANGLIA_WHISPER_COMPILE", "true")
+    monkeypatch.setattr(audio_alignment_module.whisper, "load_model", lambda *_a, **_k: model)
+    monkeypatch.setattr(
+        audio_alignment_module.torch, "compile", MagicMock(side_effect=RuntimeError("no cc")),
+        raising=False,
+    )
+
+    loaded = audio_alignment_module._load_whisper_model("small", "cpu")
+
+    assert loaded.encoder is eager_encoder
+
+
+def test_extract_word_timings_returns_parallel_arrays():
+    """Word timings come back as arrays of the exact times, skipping malformed words."""
+    result = {
+        "segments": [
+            {"words": [{"word": " hello", "start": 0.0, "end": 0.5}, {"word": "broken"}]},
+            {"text": "no words"},
+            {"words": [{"word": " world ", "start": 0.5, "end": 1.28}]},
+        ]
+    }
+
+    timings = audio_alignment_module._extract_word_timings(result)
+
+    assert timings.texts == ["hello", "world"]
+    assert timings.starts.dtype == np.float64 and timings.ends.dtype == np.float64
+    assert timings.starts.tolist() == [0.0, 0.5]
+    assert timings.ends.tolist() == [0.5, 1.28]
+    assert timings.as_list() == [
+        audio_alignment_module.WordTiming(text="hello", start=0.0, end=0.5),
+        audio_alignment_module.WordTiming(text="world", start=0.5, end=1.28),
+    ]
+
+
+def test_silence_trimmed_before_transcription(monkeypatch, tmp_path):
+    """Leading and trailing silence is cut, and word times still match the full file."""
+    audio_path = tmp_path / "padded.wav"
+    audio_path.write_bytes(b"")
+    sample_rate = whisper.audio.SAMPLE_RATE
+    samples = np.zeros(4 * sample_rate, dtype=np.float32)
+    samples[2 * sample_rate : 3 * sample_rate] = 0.5  # One second of sound after 2s lead-in
+    monkeypatch.setattr(whisper, "load_audio", lambda _path: samples)
+    monkeypatch.setenv("GANGLIA_WHISPER_TRIM_SILENCE", "true")
+    model = MagicMock()
+    word = {"word": "hi", "start": 0.2, "end": 1.2}
+    model.transcribe.return_value = {"segments": [{"start": 0.2, "end": 1.2, "words": [word]}]}
+    audio_alignment_module._transcription_cache.clear()
+
+    result = audio_alignment_module._transcribe_with_whisper(model, str(audio_path), "hi", "small")
+
+    trimmed = model.transcribe.call_args.args[0]
+    assert len(trimmed) == int(1.4 * sample_rate)
+    assert result["segments"][0]["words"][0] is word
+    assert (word["start"], word["end"]) == pytest.approx((2.0, 3.0))
+    audio_alignment_module._transcription_cache.clear()
+
+
+def test_whisper_preload_is_opt_in(monkeypatch):
+    """The model is preloaded in the background only when GANGLIA_PRELOAD_WHISPER is set."""
+    model = MagicMock()
+    load_model = MagicMock(side_effect=[RuntimeError("no weights"), model])
+    monkeypatch.setattr(audio_alignment_module, "_load_whisper_model", load_model)
+    monkeypatch.setattr(
+        audio_alignment_module, "_whisper_state", audio_alignment_module.WhisperModelState()
+    )
+    monkeypatch.delenv("GANGLIA_PRELOAD_WHISPER", raising=False)
+    assert audio_alignment_module._start_whisper_preload() is None
+
+    monkeypatch.setenv("GANGLIA_PRELOAD_WHISPER", "true")
+    monkeypatch.setenv("GANGLIA_WHISPER_SIZE", "tiny")
+    audio_alignment_module._start_whisper_preload().join(timeout=5)  # Failure is only logged
+    audio_alignment_module._start_whisper_preload().join(timeout=5)
+
+    assert load_model.call_args.args[0] == "tiny"
+    assert audio_alignment_module.get_whisper_model("tiny") is model
+    assert load_model.call_count == 2
@@ -1,8 +1,20 @@
 """Tests for caption ROI detection functionality."""
 
+from unittest.mock import MagicMock
+
+import cv2
 import numpy as np
+import pytest
 
-from ganglia_studio.video.caption_roi import find_roi_in_frame
+from ganglia_studio.video import caption_roi
+from ganglia_studio.video.caption_roi import (
+    _block_std,
+    _block_std_numpy,
+    _search_windows,
+    _search_windows_numpy,
+    calculate_activity_map,
+    find_roi_in_frame,
+)
 from ganglia_studio.video.color_utils import get_contrasting_color
 
 
@@ -34,6 +46,124 @@ def test_roi_dimensions():
     assert 0.1 <= ratio <= 0.2, f"ROI area ratio {ratio} outside expected range"
 
 
+def test_activity_map_matches_per_block_std():
+    """Test that each activity value is the standard deviation of its block's gray levels."""
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, size=(100, 130, 3), dtype=np.uint8)
+
+    activity_map = calculate_activity_map(frame, block_size=32)
+
+    assert activity_map.shape == (3, 4)
+    gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+    for i in range(3):
+        for j in range(4):
+            block = gray[i * 32:(i + 1) * 32, j * 32:(j + 1) * 32]
+            assert np.isclose(activity_map[i, j], np.std(block), rtol=1e-4)
+
+
+def test_activity_map_on_subsampled_float_frame():
+    """Test that strided and non-8-bit frames are converted to gray like contiguous ones."""
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, size=(200, 260, 3)).astype(np.float64)
+
+    np.testing.assert_allclose(
+        calculate_activity_map(frame[::2, ::2], block_size=16),
+        calculate_activity_map(np.ascontiguousarray(frame[::2, ::2], np.float32), 16),
+        rtol=1e-4,
+    )
+    assert calculate_activity_map(frame[:10], block_size=16).shape == (0, 16)
+
+
+def test_roi_centered_on_nearly_flat_frame(monkeypatch):
+    """Test that faint noise too weak to matter centers the ROI without a search."""
+    rng = np.random.default_rng(0)
+    frame = 128 + rng.uniform(-0.3, 0.3, size=(1080, 1920, 3))
+    search = MagicMock()
+    monkeypatch.setattr(caption_roi, "_search_windows", search)
+
+    x, y, width, height = find_roi_in_frame(frame)
+
+    search.assert_not_called()
+
+    assert abs(x + width / 2 - 1920 / 2) <= 2
+    assert abs(y + height / 2 - 1080 / 2) <= 2
+
+
+def test_roi_prefers_low_activity_region():
+    """Test that the ROI is placed over the calmest part of a busy frame."""
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, size=(1080, 1920, 3), dtype=np.uint8)
+    frame[200:900, 1100:1700] = 40  # Flat region on the right
+
+    x, y, width, height = find_roi_in_frame(frame)
+
+    assert x >= 1100 and x + width <= 1700, "ROI should sit inside the flat region"
+    assert y >= 200 and y + height <= 900, "ROI should sit inside the flat region"
+
+
+def test_roi_search_on_4k_frame():
+    """Test that a 4K frame, searched subsampled, still finds its flat region."""
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, size=(2160, 3840, 3), dtype=np.uint8)
+    frame[400:1800, 2200:3400] = 40  # Flat region on the right
+
+    x, y, width, height = find_roi_in_frame(frame)
+
+    assert x >= 2200 and x + width <= 3400, "ROI should sit inside the flat region"
+    assert y >= 400 and y + height <= 1800, "ROI should sit inside the flat region"
+
+
+def test_optimal_roi_reads_first_frame_without_moviepy(tmp_path, monkeypatch):
+    """Test that the first frame is decoded with PyAV, leaving moviepy unused."""
+    av = pytest.importorskip("av")
+    video_path = tmp_path / "clip.mp4"
+    with av.open(str(video_path), "w") as container:
+        stream = container.add_stream("mpeg4", rate=24)
+        stream.width, stream.height, stream.pix_fmt = 320, 240, "yuv420p"
+        for _ in range(3):
+            frame = av.VideoFrame.from_ndarray(
+                np.full((240, 320, 3), 90, dtype=np.uint8), format="rgb24"
+            )
+            container.mux(stream.encode(frame))
+        container.mux(stream.encode())
+    video_clip = MagicMock(side_effect=AssertionError("moviepy should not be used"))
+    monkeypatch.setattr(caption_roi, "VideoFileClip", video_clip)
+
+    roi = caption_roi.find_optimal_roi(str(video_path))
+
+    assert roi == find_roi_in_frame(np.full((240, 320, 3), 90, dtype=np.uint8))
+    video_clip.assert_not_called()
+
+
+def test_block_std_matches_numpy_reference():
+    """Test that the block standard deviation kernel agrees with the NumPy reference."""
+    rng = np.random.default_rng(0)
+    gray = rng.integers(0, 256, size=(64, 80), dtype=np.uint8)
+
+    for block_gray in (gray, gray.astype(np.float32), gray[::2, ::2]):
+        blocks_h = block_gray.shape[0] // 8
+        blocks_w = block_gray.shape[1] // 8
+        np.testing.assert_allclose(
+            _block_std(block_gray, 8, blocks_h, blocks_w),
+            _block_std_numpy(block_gray, 8, blocks_h, blocks_w),
+            rtol=1e-4,
+        )
+
+
+def test_window_search_matches_numpy_reference():
+    """Test that the window search picks the same first minimum as the NumPy reference."""
+    rng = np.random.default_rng(0)
+    # Few distinct values so that several windows tie for the minimum
+    activity_map = rng.integers(0, 3, size=(20, 30)).astype(np.float64)
+    sat = np.pad(activity_map.cumsum(axis=0).cumsum(axis=1), ((1, 0), (1, 0)))
+    tops = np.arange(2, 12)
+    lefts = np.arange(3, 20)
+
+    assert tuple(_search_windows(sat, tops, lefts, 4, 3)) == tuple(
+        _search_windows_numpy(sat, tops, lefts, 4, 3)
+    )
+
+
 def test_contrasting_color_dark_background():
     """Test color selection for dark backgrounds."""
     # Test different dark backgrounds
@@ -134,3 +264,31 @@ def test_roi_centering():
     assert abs(roi_center_y - frame_center_y) / 1080 < 0.1, \
         f"ROI not vertically centered: {roi_center_y} vs {frame_center_y}"
 
+
+
+def test_optimal_roi_closes_moviepy_clip_on_error(monkeypatch):
+    """Test that the moviepy fallback closes its clip even when reading the frame fails."""
+    monkeypatch.setattr(caption_roi, "_read_first_frame_with_av", lambda _path: None)
+    video = MagicMock()
+    video.__enter__.return_value = video
+    video.get_frame.side_effect = OSError("truncated file")
+    monkeypatch.setattr(caption_roi, "VideoFileClip", MagicMock(return_value=video))
+
+    assert caption_roi.find_optimal_roi("broken.mp4") is None
+    video.__exit__.assert_called_once()
+
+
+def test_first_frame_and_duration_fall_back_to_moviepy(monkeypatch):
+    """Test that the moviepy reader supplies the frame and duration when PyAV cannot."""
+    monkeypatch.setattr(caption_roi, "_read_first_frame_with_av", lambda _path: None)
+    frame = np.zeros((4, 4, 3), dtype=np.uint8)
+    video = MagicMock(duration=2.5)
+    video.__enter__.return_value = video
+    video.get_frame.return_value = frame
+    monkeypatch.setattr(caption_roi, "VideoFileClip", MagicMock(return_value=video))
+
+    first_frame, duration = caption_roi.read_first_frame_and_duration("clip.mp4")
+
+    assert first_frame is frame
+    assert duration == 2.5
+    video.__exit__.assert_called_once()
@@ -11,23 +11,28 @@ This module contains tests for caption generation functionality including:
 # pylint: disable=no-member,unused-import,unused-variable,import-outside-toplevel
 
 import os
+from unittest.mock import MagicMock
 
 import cv2
+import numpy as np
 import pytest
 from ganglia_common.logger import Logger
 from ganglia_common.utils.file_utils import get_tempdir
 
 from ganglia_studio.utils.ffmpeg_utils import run_ffmpeg_command
 from ganglia_studio.utils.video_utils import create_test_video
+from ganglia_studio.video import captions
 from ganglia_studio.video.audio_alignment import create_word_level_captions
 from ganglia_studio.video.captions import (
     CaptionEntry,
     Word,
+    _calculate_word_clip_geometry,
     calculate_word_positions,
     create_caption_windows,
     create_dynamic_captions,
     create_srt_captions,
     create_static_captions,
+    render_word_rgba,
     split_into_words,
 )
 from ganglia_studio.video.color_utils import get_vibrant_palette
@@ -282,6 +287,18 @@ def test_create_srt_captions():
             os.unlink(srt_path)
 
 
+def test_srt_times_round_to_whole_milliseconds(tmp_path):
+    """Test that SRT timestamps carry rounding into seconds, minutes and hours"""
+    srt_path = tmp_path / "timing.srt"
+    captions_in = [CaptionEntry("Edge", 59.9996, 3599.9999), CaptionEntry("Later", 3723.456, 3724.3)]
+
+    assert create_srt_captions(captions_in, str(srt_path)) == str(srt_path)
+    assert srt_path.read_text(encoding="utf-8") == (
+        "1\n00:01:00,000 --> 01:00:00,000\nEdge\n\n"
+        "2\n01:02:03,456 --> 01:02:04,300\nLater\n\n"
+    )
+
+
 @pytest.mark.slow
 def test_audio_aligned_captions(tmp_path):
     """Test creation of a video with audio-aligned captions"""
@@ -483,6 +500,337 @@ def test_text_rendering_features():
             os.unlink(output_path)
 
 
+def test_word_widths_reuse_loaded_fonts(monkeypatch):
+    """Test that measuring repeated words loads each font size and measures each word once"""
+    captions._load_font.cache_clear()
+    captions._measure_length.cache_clear()
+    truetype = MagicMock(wraps=captions.ImageFont.truetype)
+    monkeypatch.setattr(captions.ImageFont, "truetype", truetype)
+
+    words = [Word.from_text(text) for text in ("echo", "echo", "delta", "echo")]
+    for word in words:
+        word.calculate_width(40)
+    words[0].calculate_width(50)
+
+    assert truetype.call_count == 2
+    assert captions._measure_length.cache_info().hits == 2
+    assert words[0].width > words[1].width > 0
+    assert words[1].width == words[3].width
+
+
+def test_default_font_looked_up_once(monkeypatch):
+    """Test that words without a font share one cached default font lookup"""
+    captions.get_default_font.cache_clear()
+    exists = MagicMock(wraps=os.path.exists)
+    monkeypatch.setattr(captions.os.path, "exists", exists)
+
+    words = [Word.from_text("one"), Word("two", 0.0, 1.0), Word.from_timed_word("3", 1.0, 2.0)]
+    words += split_into_words(CaptionEntry("four five", 2.0, 3.0))
+
+    assert {word.font_name for word in words} == {captions.get_default_font()}
+    assert exists.call_count == captions.get_default_font.cache_info().misses == 1
+
+
+def test_word_sizes_measured_once_per_size():
+    """Test that every size is used and each distinct size loads its font once"""
+    captions._load_font.cache_clear()
+    words = [Word.from_text(f"word{index % 7}") for index in range(40)]
+
+    captions.assign_word_sizes(words, min_font_size=32, max_font_ratio=1.5)
+
+    sizes = {word.font_size for word in words}
+    assert min(sizes) == 32 and max(sizes) == 48
+    assert captions._load_font.cache_info().misses == len(sizes)
+    for word in words:
+        expected = Word.from_text(word.text)
+        expected.calculate_width(word.font_size)
+        assert word.width == expected.width
+
+
+def test_word_array_round_trips_words():
+    """Test that words survive conversion to columns and back with their layout"""
+    words = [Word(f"w{index}", index * 0.5, index * 0.5 + 0.4) for index in range(6)]
+    windows = create_caption_windows(words, 24, 1.5, roi_width=80, roi_height=90)
+
+    word_array = captions.WordArray.from_words(words)
+    assert len(word_array) == len(words)
+    np.testing.assert_array_equal(word_array.start_times, [word.start_time for word in words])
+    assert word_array.to_words() == words
+    assert [word for window in windows for word in window.words] == words
+
+
+def test_word_layout_kernel_matches_python_loop():
+    """Test that the compiled word layout agrees with the plain Python loop"""
+    rng = np.random.default_rng(0)
+    widths = rng.uniform(10, 160, size=200)
+    font_sizes = rng.integers(24, 49, size=200)
+
+    compiled = captions._layout_words(widths, font_sizes, 400, 300)
+    reference = captions._layout_words_loop(widths, font_sizes, 400, 300)
+
+    for actual, expected in zip(compiled, reference, strict=True):
+        np.testing.assert_array_equal(actual, expected)
+    window_ids = reference[3]
+    assert window_ids[0] == 0 and np.all(np.diff(window_ids) >= 0) and window_ids[-1] > 0
+
+
+def test_word_positions_align_larger_words_to_the_baseline():
+    """Test window-relative word positions, with larger words raised to share a baseline"""
+    words = [Word("big", 0.0, 1.0), Word("small", 1.0, 2.0), Word("next", 2.0, 3.0)]
+    for word, font_size, x_position, line_number in zip(
+        words, (40, 30, 30), (0, 60, 0), (0, 0, 1), strict=True
+    ):
+        word.font_size = font_size
+        word.x_position = x_position
+        word.line_number = line_number
+    window = captions.CaptionWindow(words, 0.0, 3.0, font_size=30)
+
+    # Two 36-pixel lines end 20 pixels above the bottom of a 500-pixel frame
+    assert calculate_word_positions(window, video_height=500, margin=20) == [
+        (20, 398),
+        (80, 408),
+        (20, 444),
+    ]
+
+
+def test_caption_colors_chosen_once_for_all_windows(monkeypatch):
+    """Test that windows over the same ROI share one background color analysis"""
+    determine_colors = MagicMock(wraps=captions._determine_text_colors)
+    monkeypatch.setattr(captions, "_determine_text_colors", determine_colors)
+    frame = np.full((360, 640, 3), 30, dtype=np.uint8)
+    words = [Word(text, index * 0.5, index * 0.5 + 0.5) for index, text in enumerate("abcdef")]
+    windows = create_caption_windows(words, 24, 1.5, roi_width=60, roi_height=80)
+    assert len(windows) > 1
+
+    clips = captions._create_text_clips_for_windows(
+        windows,
+        roi=(100, 100, 60, 80),
+        first_frame=frame,
+        min_font_size=24,
+        max_font_ratio=1.5,
+        border_thickness=2,
+        shadow_offset=(2, 2),
+    )
+
+    assert len(clips) == len(words)
+    determine_colors.assert_called_once()
+
+
+def test_windows_rendered_concurrently_keep_word_order(monkeypatch):
+    """Test that windows rendered on several threads return clips in word order"""
+    monkeypatch.setattr(captions.os, "cpu_count", lambda: 4)
+    frame = np.full((360, 640, 3), 200, dtype=np.uint8)
+    words = [Word(f"w{index}", index * 0.25, index * 0.25 + 0.25) for index in range(30)]
+    windows = create_caption_windows(words, 24, 1.5, roi_width=120, roi_height=90)
+    assert len(windows) > 2
+
+    clips = captions._create_text_clips_for_windows(
+        windows,
+        roi=(100, 100, 120, 90),
+        first_frame=frame,
+        min_font_size=24,
+        max_font_ratio=1.5,
+        border_thickness=2,
+        shadow_offset=(2, 2),
+    )
+
+    assert [clip.start for clip in clips] == [word.start_time for word in words]
+
+
+def test_window_clips_show_one_image_at_a_time():
+    """Test that each window is one growing image at a time rather than a clip per word"""
+    frame = np.full((360, 640, 3), 30, dtype=np.uint8)
+    words = [Word(f"w{index}", index * 0.5, index * 0.5 + 0.5) for index in range(4)]
+    windows = create_caption_windows(words, 24, 1.5, roi_width=300, roi_height=200)
+    assert len(windows) == 1
+
+    clips = captions._create_text_clips_for_windows(
+        windows,
+        roi=(100, 100, 300, 200),
+        first_frame=frame,
+        min_font_size=24,
+        max_font_ratio=1.5,
+        border_thickness=2,
+        shadow_offset=(2, 2),
+    )
+
+    for t in (0.25, 0.75, 1.25, 1.75):
+        assert sum(clip.is_playing(t) for clip in clips) == 1
+    # Every later image holds the earlier words, so it is at least as large
+    coverage = [np.count_nonzero(clip.mask.get_frame(0)) for clip in clips]
+    assert coverage == sorted(coverage) and coverage[0] < coverage[-1]
+    assert clips[-1].end == windows[0].end_time
+
+
+def test_window_canvas_rebuilds_stages_asked_for_out_of_order():
+    """Test that a window stage looks the same whichever stage was built before it"""
+    words = [Word(f"w{index}", index * 0.5, index * 0.5 + 0.5) for index in range(3)]
+    windows = create_caption_windows(words, 24, 1.5, roi_width=300, roi_height=200)
+    rendered = captions.render_window_rgba(
+        windows[0],
+        roi_x=100,
+        roi_y=100,
+        text_color=(255, 255, 255),
+        stroke_color=(80, 80, 80),
+        border_thickness=2,
+        shadow_offset=(2, 2),
+        max_font_size=36,
+    )
+    canvas = captions._WindowCanvas(rendered)
+
+    in_order = [tuple(frame.copy() for frame in canvas.stage(index)) for index in range(3)]
+    for index in (0, 2, 1):
+        rgb, mask = canvas.stage(index)
+        assert np.array_equal(rgb, in_order[index][0])
+        assert np.array_equal(mask, in_order[index][1])
+
+
+def test_time_indexed_composite_finds_playing_clips():
+    """Test that the segment index returns the same clips as MoviePy's per-clip check"""
+    from moviepy.video.VideoClip import ColorClip
+
+    background = ColorClip((64, 48), color=(0, 0, 0), duration=4)
+    rng = np.random.default_rng(1)
+    clips = [
+        ColorClip((8, 8), color=(255, 0, 0), duration=float(length)).with_start(float(start))
+        for start, length in zip(rng.uniform(0, 2.9, 40), rng.uniform(0.1, 1.0, 40), strict=True)
+    ]
+
+    composite = captions._TimeIndexedCompositeVideoClip([background] + clips, use_bgclip=True)
+
+    assert composite.duration == 4
+    times = [0.0, *rng.uniform(0, 4, 200), *(clip.start for clip in clips)]
+    for t in times + [clip.end for clip in clips]:
+        expected = [clip for clip in composite.clips if clip.is_playing(t)]
+        assert composite.playing_clips(t) == expected
+
+
+def test_word_rendered_once_with_shadows():
+    """Test that a word and both shadows are rasterized into one RGBA image"""
+    word = Word.from_text("Hello")
+    word.font_size = 48
+    word.calculate_width(word.font_size)
+    geometry = _calculate_word_clip_geometry(
+        word,
+        roi_x=100,
+        roi_y=50,
+        shadow_offset=(8, 8),
+        max_font_size=72,
+        border_thickness=5,
+    )
+
+    rgba, position = render_word_rgba(
+        word, geometry, text_color=(255, 0, 0), stroke_color=(85, 0, 0), border_thickness=5
+    )
+
+    # The image starts at the text and extends far enough to hold the outer shadow
+    assert position == geometry.base_position
+    clip_width = geometry.clip_dimensions[0] + geometry.margins[0] + geometry.margins[2]
+    clip_height = geometry.clip_dimensions[1] + geometry.margins[1] + geometry.margins[3]
+    assert rgba.shape == (clip_height + 12, clip_width + 12, 4)
+
+    opaque = rgba[..., 3] == 255
+    assert np.any(np.all(rgba[opaque][:, :3] == (255, 0, 0), axis=1)), "Text fill missing"
+    # The translucent black outer shadow reaches 12 pixels below and right of the text
+    text_rows, text_cols = np.nonzero(rgba[..., 0] > 0)
+    drawn_rows, drawn_cols = np.nonzero(rgba[..., 3] > 0)
+    assert drawn_rows.max() == text_rows.max() + 12, "Shadow missing"
+    assert drawn_cols.max() == text_cols.max() + 12, "Shadow missing"
+    shadow_edge = rgba[drawn_rows.max()]
+    assert shadow_edge[..., 3].max() < 255 and shadow_edge[..., :3].max() == 0
+
+
+def test_drawtext_filters_draw_each_word_with_shadows():
+    """Test that every word gets two shadow drawtexts and one text drawtext"""
+    words = [Word("it's", 0.0, 0.5), Word("a:b", 0.5, 1.0)]
+    windows = create_caption_windows(words, 24, 1.5, roi_width=300, roi_height=200)
+
+    filters = captions._build_word_drawtext_filters(
+        windows,
+        roi=(100, 100, 300, 200),
+        text_color=(255, 0, 0),
+        stroke_color=(85, 0, 0),
+        min_font_size=24,
+        max_font_ratio=1.5,
+        border_thickness=2,
+        shadow_offset=(2, 2),
+    )
+
+    assert len(filters) == 3 * len(words)
+    # Quotes and colons are escaped for both the option and the filtergraph parser
+    assert filters[0].startswith("drawtext=text=it\\\\\\'s:")
+    assert filters[3].startswith("drawtext=text=a\\\\:b:")
+    assert ":fontcolor=0x000000@0.4:" in filters[0]
+    assert ":fontcolor=0x000000@0.7:" in filters[1]
+    assert ":fontcolor=0xFF0000:bordercolor=0x550000:" in filters[2]
+    assert f"between(t\\,0.5\\,{windows[-1].end_time})" in filters[5]
+
+
+def test_static_drawtext_filters_escape_special_characters():
+    """Test that static caption text reaches drawtext with every special character escaped"""
+    filters = captions._build_drawtext_filters(
+        [CaptionEntry("50% off: [now], it's back\\", 0.0, 2.0)],
+        max_chars_per_line=80,
+        position="bottom",
+        margin=40,
+        font_name="Arial",
+        font_size=40,
+        box_color="black@0.5",
+    )
+
+    assert filters[0].startswith(
+        "drawtext=text=50% off\\\\: \\[now\\]\\, it\\\\\\'s back\\\\\\\\:font=Arial:"
+    )
+    assert ":expansion=none:" in filters[0]
+
+
+def test_first_frame_and_duration_read_without_moviepy():
+    """Test that PyAV reads the same first frame and duration MoviePy would"""
+    from moviepy.video.io.VideoFileClip import VideoFileClip
+
+    from ganglia_studio.video.caption_roi import _read_first_frame_with_av
+
+    input_video = create_test_video(duration=2, color=(200, 40, 90))
+    try:
+        frame, duration = _read_first_frame_with_av(input_video)
+        with VideoFileClip(input_video, audio=False) as video:
+            expected_frame = video.get_frame(0)
+            expected_duration = video.duration
+    finally:
+        os.unlink(input_video)
+
+    assert frame.shape == expected_frame.shape and frame.dtype == np.uint8
+    assert np.abs(frame.astype(int) - expected_frame.astype(int)).max() <= 2
+    assert duration == pytest.approx(expected_duration, abs=0.01)
+
+
+def test_dynamic_captions_burned_in_with_one_ffmpeg_pass(monkeypatch, tmp_path):
+    """Test that with drawtext available the captions are drawn by a single ffmpeg run"""
+    commands = []
+    scripts = []
+
+    def record_command(cmd):
+        commands.append(cmd)
+        with open(cmd[cmd.index("-filter_script:v") + 1], encoding="utf-8") as script:
+            scripts.append(script.read())
+        return MagicMock()
+
+    monkeypatch.setattr(captions, "_ffmpeg_has_drawtext", lambda: True)
+    monkeypatch.setattr(captions, "run_ffmpeg_command", record_command)
+    input_video = create_test_video(duration=2)
+    try:
+        result = create_dynamic_captions(
+            input_video, [CaptionEntry("One two three", 0.0, 1.5)], str(tmp_path / "out.mp4")
+        )
+    finally:
+        os.unlink(input_video)
+
+    assert result == str(tmp_path / "out.mp4")
+    assert len(commands) == 1
+    assert scripts[0].count("drawtext=") == 9
+    assert commands[0][commands[0].index("-tune") + 1] == "zerolatency"
+
+
 @pytest.mark.slow
 def test_vibrant_color_palette():
     """Test that the vibrant color palette generates appropriate colors for different backgrounds"""
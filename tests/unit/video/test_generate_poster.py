@@ -74,6 +74,125 @@ class TestGenerateMoviePoster(unittest.TestCase):
         )
         self.assertIsNone(result, "Function should return None on DALL-E error")
 
+    @patch('ganglia_studio.video.story_generation.get_openai_client')
+    @patch('ganglia_studio.video.story_generation.save_image_without_caption')
+    def test_generate_movie_poster_reuses_client_across_retries(self, mock_save, mock_get_client):
+        """Rate-limit retries should reuse the client looked up before the first attempt."""
+        filtered_story = json.dumps({
+            "style": "cyberpunk",
+            "title": "Neon Nights",
+            "story": "A detective navigates a neon-lit city"
+        })
+
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.data = [MagicMock(url='http://example.com/poster.png')]
+        mock_client.images.generate.side_effect = [
+            Exception("Rate limit exceeded"),
+            mock_response,
+        ]
+        mock_get_client.return_value = mock_client
+
+        result = generate_movie_poster(
+            filtered_story,
+            self.style,
+            self.story_title,
+            query_dispatcher=self.query_dispatcher,
+            wait_time=0,
+            output_dir=self.output_dir,
+        )
+
+        self.assertIsNotNone(result)
+        self.assertEqual(mock_client.images.generate.call_count, 2)
+        mock_get_client.assert_called_once()
+        mock_save.assert_called_once()
+
+    @patch('ganglia_studio.video.story_generation.get_openai_client')
+    def test_generate_movie_poster_without_api_key(self, mock_get_client):
+        """A missing API key should be reported and return None, not raise."""
+        filtered_story = json.dumps({
+            "style": "cyberpunk",
+            "title": "Neon Nights",
+            "story": "A detective navigates a neon-lit city"
+        })
+        mock_get_client.side_effect = ValueError("OPENAI_API_KEY environment variable must be set.")
+
+        result = generate_movie_poster(
+            filtered_story,
+            self.style,
+            self.story_title,
+            query_dispatcher=self.query_dispatcher,
+            output_dir=self.output_dir,
+        )
+        self.assertIsNone(result)
+
+    @patch('ganglia_studio.video.story_generation.get_openai_client')
+    def test_generate_movie_poster_stops_when_filtering_repeats_rejected_content(
+        self, mock_get_client
+    ):
+        """Filtered content that was already rejected should not be sent again."""
+        filtered_story = json.dumps({
+            "style": "cyberpunk",
+            "title": "Neon Nights",
+            "story": "A detective navigates a neon-lit city"
+        })
+
+        mock_client = MagicMock()
+        mock_client.images.generate.side_effect = Exception(
+            "Your request was rejected by our safety system"
+        )
+        mock_get_client.return_value = mock_client
+        # Filtering leaves the content unchanged, so it is rejected again
+        self.query_dispatcher.filter_content_for_dalle.return_value = (
+            True,
+            "A detective navigates a neon-lit city",
+        )
+
+        result = generate_movie_poster(
+            filtered_story,
+            self.style,
+            self.story_title,
+            query_dispatcher=self.query_dispatcher,
+            output_dir=self.output_dir,
+        )
+
+        self.assertIsNone(result)
+        self.assertEqual(mock_client.images.generate.call_count, 1)
+        self.query_dispatcher.filter_content_for_dalle.assert_called_once_with(
+            "A detective navigates a neon-lit city"
+        )
+
+
+    @patch('ganglia_studio.video.story_generation.get_openai_client')
+    def test_generate_movie_poster_filters_each_rejection_again(self, mock_get_client):
+        """Each safety rejection should ask the filter again for new content."""
+        filtered_story = json.dumps({
+            "style": "cyberpunk",
+            "title": "Neon Nights",
+            "story": "A detective navigates a neon-lit city"
+        })
+
+        mock_client = MagicMock()
+        mock_client.images.generate.side_effect = Exception(
+            "Your request was rejected by our safety system"
+        )
+        mock_get_client.return_value = mock_client
+        self.query_dispatcher.filter_content_for_dalle.side_effect = [
+            (True, f"A detective walks a bright city, take {take}") for take in range(3)
+        ]
+
+        result = generate_movie_poster(
+            filtered_story,
+            self.style,
+            self.story_title,
+            query_dispatcher=self.query_dispatcher,
+            output_dir=self.output_dir,
+        )
+
+        self.assertIsNone(result)
+        self.assertEqual(mock_client.images.generate.call_count, 3)
+        self.assertEqual(self.query_dispatcher.filter_content_for_dalle.call_count, 3)
+
 if __name__ == '__main__':
     unittest.main()
 